@@ -0,0 +1,352 @@
+#-*- coding: utf-8 -*-
+
+"""
+Copyright (c) 2026 LG Electronics Inc.
+SPDX-License-Identifier: MIT
+
+Synthetic scale benchmark for hosta.
+
+Generates a project with the requested number of host libraries and tests,
+then measures configure, generate, full build, no-op rebuild and
+single-header-touch rebuild times for each generator. Results are written
+to a JSON file so that hosta versions can be compared with each other.
+
+Usage:
+  python3 benchmarks/hosta_benchmark.py --static 1000 --shared 100 --interface 100 --output result.json
+
+Set CMAKE_BUILD_PARALLEL_LEVEL to control the number of parallel build jobs.
+"""
+
+from datetime import datetime, timezone
+import argparse
+import json
+import os
+import platform
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOTDIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+sys.path.insert(0, os.path.join(ROOTDIR, "tests"))
+from conftest import CMakeFixture  # noqa: E402
+
+GENERATORS = ["Unix Makefiles", "Ninja"]
+
+CONFIGURE_DONE = "-- Configuring done"
+GENERATE_DONE = "-- Generating done"
+
+
+class BenchmarkFixture(CMakeFixture):
+    """CMakeFixture that records the elapsed time of each command."""
+
+    def __init__(self, rootdir, workspace):
+        super().__init__(rootdir, workspace)
+        self.elapsed = 0.0
+        self.markers = {}
+
+    def execute(self, command):
+        if isinstance(command, list):
+            command = " ".join(arg for arg in command if arg)
+        # Stream the output to timestamp the configure/generate milestones
+        lines = []
+        markers = {}
+        start = time.perf_counter()
+        with subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, shell=True, encoding="UTF-8") as process:
+            for line in process.stdout:
+                lines.append(line)
+                for marker in (CONFIGURE_DONE, GENERATE_DONE):
+                    if line.startswith(marker) and marker not in markers:
+                        markers[marker] = time.perf_counter() - start
+        self.elapsed = time.perf_counter() - start
+        self.markers = markers
+        return subprocess.CompletedProcess(command, process.returncode, "".join(lines), "")
+
+
+class SyntheticProject(object):
+    """Writes a synthetic hosta project into the workspace of a fixture."""
+
+    def __init__(self, static=10, shared=0, interface=0, sources=1, fanout=2, unity_fixture_tests=0, gtest_tests=0, cpputest_tests=0):
+        self.static = static
+        self.shared = shared
+        self.interface = interface
+        self.sources = sources
+        self.fanout = fanout
+        self.unity_fixture_tests = unity_fixture_tests
+        self.gtest_tests = gtest_tests
+        self.cpputest_tests = cpputest_tests
+
+    def settings(self):
+        return dict(vars(self))
+
+    def libraries(self):
+        # Interleave the library types so that each type appears across the whole graph
+        counts = {"STATIC": self.static, "SHARED": self.shared, "INTERFACE": self.interface}
+        taken = dict.fromkeys(counts, 0)
+        result = []
+        for index in range(sum(counts.values())):
+            # Pick the type that lags the most behind its share
+            kind = max(counts, key=lambda k: (counts[k] - taken[k]) / counts[k] if counts[k] else -1)
+            taken[kind] += 1
+            result.append((f"lib{index:05d}", kind))
+        return result
+
+    def dependencies(self, index):
+        # Each library depends on the preceding libraries, forming a DAG
+        return list(range(max(0, index - self.fanout), index))
+
+    def header(self, name):
+        return f"libs/{name}/include/{name}.h"
+
+    def targets(self):
+        libraries = len(self.libraries())
+        tests = self.unity_fixture_tests + self.gtest_tests + self.cpputest_tests
+        return {"libraries": libraries, "executables": 1 + tests, "tests": tests}
+
+    def write(self, testing):
+        libraries = self.libraries()
+        content = [
+            "cmake_minimum_required(VERSION 3.17 FATAL_ERROR)\n",
+            "project(HostaBenchmark LANGUAGES NONE)\n",
+            "include(cmake/HostTest.cmake)\n",
+            "enable_testing()\n",
+        ]
+
+        frameworks = {
+            "unity": self.unity_fixture_tests,
+            "gtest": self.gtest_tests,
+            "cpputest": self.cpputest_tests,
+        }
+        for framework, count in frameworks.items():
+            if count:
+                testing.copytree(f"tests/project/external/{framework}", f"external/{framework}")
+                content.append(f"add_subdirectory(external/{framework})\n")
+
+        for index, (name, kind) in enumerate(libraries):
+            deps = [libraries[i][0] for i in self.dependencies(index)]
+            self.write_library(testing, name, kind, deps)
+            content.append(f"add_subdirectory(libs/{name})\n")
+
+        # An executable that links the most dependent libraries
+        top = [name for name, _ in libraries[-max(1, self.fanout):]]
+        self.write_consumer(testing, "app", top, "c", "int main(void) {{ return {calls}; }}\n")
+        content.append("add_subdirectory(app)\n")
+
+        for index in range(self.unity_fixture_tests):
+            name = f"unity_fixture_test{index:05d}"
+            used = [libraries[index % len(libraries)][0]] if libraries else []
+            source = (
+                "#include <unity_fixture.h>\n"
+                "TEST_GROUP(Bench);\n"
+                "TEST_SETUP(Bench) {{ }}\n"
+                "TEST_TEAR_DOWN(Bench) {{ }}\n"
+                "TEST(Bench, test) {{ TEST_ASSERT_EQUAL(0, {calls}); }}\n"
+                "static void runAllTests(void) {{ RUN_TEST_CASE(Bench, test); }}\n"
+                "int main(int argc, const char* argv[]) {{ return UnityMain(argc, argv, runAllTests); }}\n"
+            )
+            self.write_consumer(testing, name, used, "c", source, frameworks=["Host::unity-fixture", "Host::unity"], command="unity_fixture_add_host_tests")
+            content.append(f"add_subdirectory({name})\n")
+
+        for index in range(self.gtest_tests):
+            name = f"gtest_test{index:05d}"
+            used = [libraries[index % len(libraries)][0]] if libraries else []
+            source = (
+                "#include <gtest/gtest.h>\n"
+                "TEST(Bench, test) {{ EXPECT_EQ(0, {calls}); }}\n"
+                "int main(int argc, char** argv) {{ testing::InitGoogleTest(&argc, argv); return RUN_ALL_TESTS(); }}\n"
+            )
+            self.write_consumer(testing, name, used, "cpp", source, frameworks=["Host::gtest"], command="gtest_add_host_tests")
+            content.append(f"add_subdirectory({name})\n")
+
+        for index in range(self.cpputest_tests):
+            name = f"cpputest_test{index:05d}"
+            used = [libraries[index % len(libraries)][0]] if libraries else []
+            source = (
+                "#include <CppUTest/CommandLineTestRunner.h>\n"
+                "#include <CppUTest/TestHarness.h>\n"
+                "TEST_GROUP(Bench) {{ }};\n"
+                "TEST(Bench, test) {{ CHECK_EQUAL(0, {calls}); }}\n"
+                "int main(int argc, char** argv) {{ return CommandLineTestRunner::RunAllTests(argc, argv); }}\n"
+            )
+            self.write_consumer(testing, name, used, "cpp", source, frameworks=["Host::cpputest"], command="cpputest_add_host_tests")
+            content.append(f"add_subdirectory({name})\n")
+
+        testing.write("CMakeLists.txt", content)
+
+    def write_library(self, testing, name, kind, deps):
+        includes = "".join(f'#include "{dep}.h"\n' for dep in deps)
+        link = f"  LINK_LIBRARIES PUBLIC {' '.join('Host::' + dep for dep in deps)}\n" if deps else ""
+
+        if kind == "INTERFACE":
+            testing.write(self.header(name), f"#pragma once\n{includes}static inline int {name}(void) {{ return 0; }}\n")
+            testing.write(f"libs/{name}/CMakeLists.txt", [
+                f"add_host_library({name} INTERFACE\n",
+                "  INCLUDE_DIRECTORIES PUBLIC include\n",
+                link,
+                ")\n",
+            ])
+            return
+
+        prototypes = "".join(f"int {name}_{k}(void);\n" for k in range(1, self.sources))
+        testing.write(self.header(name), f"#pragma once\n{includes}int {name}(void);\n{prototypes}")
+
+        sources = []
+        calls = " + ".join(f"{dep}()" for dep in deps) or "0"
+        for k in range(self.sources):
+            source = f"src/{name}_{k}.c"
+            function = name if k == 0 else f"{name}_{k}"
+            body = calls if k == 0 else "0"
+            testing.write(f"libs/{name}/{source}", f'#include "{name}.h"\nint {function}(void) {{ return {body}; }}\n')
+            sources.append(source)
+
+        testing.write(f"libs/{name}/CMakeLists.txt", [
+            f"add_host_library({name} {kind}\n",
+            f"  SOURCES {' '.join(sources)}\n",
+            "  INCLUDE_DIRECTORIES PUBLIC include\n",
+            link,
+            ")\n",
+        ])
+
+    def write_consumer(self, testing, name, libraries, extension, source, frameworks=None, command=None):
+        includes = "".join(f'#include "{lib}.h"\n' for lib in libraries)
+        if extension == "cpp":
+            includes = f'extern "C" {{\n{includes}}}\n'
+        calls = " + ".join(f"{lib}()" for lib in libraries) or "0"
+        testing.write(f"{name}/main.{extension}", includes + source.format(calls=calls))
+
+        links = " ".join([f"Host::{lib}" for lib in libraries] + (frameworks or []))
+        content = [
+            f"add_host_executable({name}\n",
+            f"  SOURCES main.{extension}\n",
+            f"  LINK_LIBRARIES PRIVATE {links}\n" if links else "",
+            ")\n",
+        ]
+        if command:
+            content.append(f"{command}(Host::{name})\n")
+        testing.write(f"{name}/CMakeLists.txt", content)
+
+
+def get_cmake_version():
+    output = subprocess.run(["cmake", "--version"], capture_output=True, encoding="UTF-8").stdout
+    return re.search(r"cmake version (\S+)", output).group(1)
+
+
+def get_hosta_version():
+    with open(os.path.join(ROOTDIR, "cmake", "HostBuild.cmake"), "r") as f:
+        content = f.read()
+    parts = [re.search(rf"set\(HOSTA_{part}_VERSION (\d+)\)", content).group(1) for part in ("MAJOR", "MINOR", "PATCH")]
+    return ".".join(parts)
+
+
+def check(process, step):
+    if process.returncode:
+        raise RuntimeError(f"{step} failed:\n{process.stdout}")
+
+
+def run_generator(project, generator, workspace):
+    """Measure a single generator on a freshly written project."""
+    testing = BenchmarkFixture(ROOTDIR, workspace)
+    project.write(testing)
+
+    result = {"generator": generator}
+
+    process = testing.configure_internal(options=[f'-G "{generator}"'])
+    check(process, "configure")
+    configure_done = testing.markers.get(CONFIGURE_DONE, testing.elapsed)
+    generate_done = testing.markers.get(GENERATE_DONE, testing.elapsed)
+    result["configure_s"] = round(configure_done, 3)
+    result["generate_s"] = round(generate_done - configure_done, 3)
+
+    check(testing.cmake("host-targets"), "build")
+    result["build_s"] = round(testing.elapsed, 3)
+
+    check(testing.cmake("host-targets"), "no-op rebuild")
+    result["null_build_s"] = round(testing.elapsed, 3)
+
+    # Touch the header at the bottom of the dependency graph
+    libraries = project.libraries()
+    if libraries:
+        time.sleep(1)  # Ensure a newer timestamp on coarse-grained filesystems
+        testing.touch(project.header(libraries[0][0]))
+        check(testing.cmake("host-targets"), "header-touch rebuild")
+        result["touch_build_s"] = round(testing.elapsed, 3)
+
+    return result
+
+
+def run(project, generators, workdir):
+    results = []
+    for generator in generators:
+        program = "ninja" if generator.startswith("Ninja") else None
+        if program and not shutil.which(program):
+            results.append({"generator": generator, "skipped": f"{program} not found"})
+            continue
+        workspace = os.path.join(workdir, re.sub(r"\W+", "_", generator).lower())
+        shutil.rmtree(workspace, ignore_errors=True)
+        os.makedirs(workspace)
+        results.append(run_generator(project, generator, workspace))
+
+    return {
+        "version": 1,
+        "hosta_version": get_hosta_version(),
+        "cmake_version": get_cmake_version(),
+        "platform": platform.platform(),
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "project": project.settings(),
+        "targets": project.targets(),
+        "results": results,
+    }
+
+
+def parse_arguments(argv=None):
+    parser = argparse.ArgumentParser(description="Synthetic scale benchmark for hosta")
+    parser.add_argument("--static", type=int, default=10, help="number of static libraries")
+    parser.add_argument("--shared", type=int, default=0, help="number of shared libraries")
+    parser.add_argument("--interface", type=int, default=0, help="number of interface libraries")
+    parser.add_argument("--sources", type=int, default=1, help="number of sources per library")
+    parser.add_argument("--fanout", type=int, default=2, help="number of dependencies per library")
+    parser.add_argument("--unity-fixture-tests", type=int, default=0, help="number of Unity Fixture test executables")
+    parser.add_argument("--gtest-tests", type=int, default=0, help="number of gtest test executables")
+    parser.add_argument("--cpputest-tests", type=int, default=0, help="number of CppUTest test executables")
+    parser.add_argument("--generator", action="append", dest="generators", help="CMake generator to measure (default: Unix Makefiles and Ninja)")
+    parser.add_argument("--workdir", help="directory for generated projects (default: temporary directory)")
+    parser.add_argument("--output", default="hosta-benchmark.json", help="path to the JSON result file")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_arguments(argv)
+    project = SyntheticProject(
+        static=args.static,
+        shared=args.shared,
+        interface=args.interface,
+        sources=args.sources,
+        fanout=args.fanout,
+        unity_fixture_tests=args.unity_fixture_tests,
+        gtest_tests=args.gtest_tests,
+        cpputest_tests=args.cpputest_tests,
+    )
+    generators = args.generators or GENERATORS
+
+    if args.workdir:
+        os.makedirs(args.workdir, exist_ok=True)
+        report = run(project, generators, os.path.abspath(args.workdir))
+    else:
+        with tempfile.TemporaryDirectory(prefix="hosta-benchmark-") as workdir:
+            report = run(project, generators, workdir)
+
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+        f.write("\n")
+
+    for result in report["results"]:
+        print(json.dumps(result))
+    print(f"Benchmark report written to {args.output}")
+    return report
+
+
+if __name__ == "__main__":
+    main()
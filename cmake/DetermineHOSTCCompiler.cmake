@@ -34,9 +34,7 @@ endif()
 include(CMakeTestCompilerCommon)
 
 # List compilers to try
-if(NOT CMAKE_HOSTC_COMPILER_LIST)
-  set(CMAKE_HOSTC_COMPILER_LIST cc gcc clang)
-endif()
+get_host_compiler_list(C CMAKE_HOSTC_COMPILER_LIST)
 
 find_host_compiler(C)
 
@@ -49,6 +47,33 @@ if(NOT CMAKE_HOSTC_COMPILER)
   )
 endif()
 
+# Reuse the compiler information of project() for the same compiler
+load_host_target_compiler_info(C __CMAKE_HOSTC_COMPILER_REUSED)
+if(__CMAKE_HOSTC_COMPILER_REUSED)
+  message(STATUS "Reusing C compiler info for HOSTC compiler - done")
+  set_host_platform_default_options(C)
+  set(CMAKE_HOSTC_SOURCE_FILE_EXTENSIONS c m)
+  find_host_binutils(C)
+  save_host_compiler_preferences(C)
+  list(APPEND ENABLED_HOST_LANGUAGES C)
+  unset(__CMAKE_HOSTC_COMPILER_REUSED)
+  return()
+endif()
+
+# Load the compiler information detected by other build trees
+if(CMAKE_HOST_COMPILER_CACHE_DIR)
+  get_host_compiler_cache_file(C __CMAKE_HOSTC_COMPILER_CACHE_FILE)
+  unset(CMAKE_HOSTC_COMPILER_WORKS)
+  load_host_compiler_cache(C "${__CMAKE_HOSTC_COMPILER_CACHE_FILE}")
+  if(CMAKE_HOSTC_COMPILER_WORKS)
+    message(STATUS "Loading HOSTC compiler info from ${CMAKE_HOST_COMPILER_CACHE_DIR} - done")
+    save_host_compiler_preferences(C)
+    list(APPEND ENABLED_HOST_LANGUAGES C)
+    unset(__CMAKE_HOSTC_COMPILER_CACHE_FILE)
+    return()
+  endif()
+endif()
+
 # Build a small source file to identify the compiler.
 find_host_compiler_id(C FLAGS "-D__CLASSIC_C__")
 
@@ -99,29 +124,11 @@ else()
     "the following output:\n${__CMAKE_HOSTC_COMPILER_WORKS_OUTPUT}\n\n"
   )
 
-  # Try to identify the ABI
-  try_host_compile(C
-    SOURCE ${CMAKE_ROOT}/Modules/CMakeCCompilerABI.c
-    TARGET CMakeDetermineCompilerABI_HOSTC.bin
-    COMPILE_OPTIONS ${CMAKE_HOSTC_VERBOSE_FLAG}
-    WORKING_DIRECTORY ${CMAKE_BINARY_DIR}${CMAKE_FILES_DIRECTORY}/${CMAKE_VERSION}-hosta.internal
-    RESULT_VARIABLE CMAKE_HOSTC_ABI_COMPILED
-    OUTPUT_VARIABLE __CMAKE_HOSTC_ABI_COMPILED_OUTPUT
-  )
-
-  if(CMAKE_HOSTC_ABI_COMPILED)
-    message(STATUS "Detecting HOSTC compiler ABI info - done")
-    file(APPEND ${CMAKE_BINARY_DIR}${CMAKE_FILES_DIRECTORY}/CMakeOutput.log
-      "Detecting HOSTC compiler ABI info compiled with the following output:\n${__CMAKE_HOSTC_ABI_COMPILED_OUTPUT}\n\n"
-    )
-    parse_host_compiler_abi_info(C ${CMAKE_BINARY_DIR}${CMAKE_FILES_DIRECTORY}/${CMAKE_VERSION}-hosta.internal/CMakeDetermineCompilerABI_HOSTC.bin)
-    parse_host_implicit_include_info(C "${__CMAKE_HOSTC_ABI_COMPILED_OUTPUT}")
-    parse_host_implicit_link_info(C "${__CMAKE_HOSTC_ABI_COMPILED_OUTPUT}")
+  # Try to identify the ABI unless deferred to the first query
+  if(NOT DEFINED CMAKE_HOST_LAZY_COMPILER_INFO OR CMAKE_HOST_LAZY_COMPILER_INFO)
+    message(STATUS "Detecting HOSTC compiler ABI info - deferred")
   else()
-    message(STATUS "Detecting HOSTC compiler ABI info - failed")
-    file(APPEND ${CMAKE_BINARY_DIR}${CMAKE_FILES_DIRECTORY}/CMakeError.log
-      "Detecting HOSTC compiler ABI info failed to compile with the following output:\n${__CMAKE_HOSTC_ABI_COMPILED_OUTPUT}\n\n"
-    )
+    find_host_compiler_abi_info(C)
   endif()
 endif()
 
@@ -137,9 +144,14 @@ find_host_binutils(C)
 # Configure variables set in this file for fast reload later on
 save_host_compiler_preferences(C)
 
+# Share the compiler information with other build trees
+if(CMAKE_HOST_COMPILER_CACHE_DIR)
+  save_host_compiler_cache(C "${__CMAKE_HOSTC_COMPILER_CACHE_FILE}")
+endif()
+
 # Add the current host language to the list
 list(APPEND ENABLED_HOST_LANGUAGES C)
 
 # Unset temporary variables
 unset(__CMAKE_HOSTC_COMPILER_WORKS_OUTPUT)
-unset(__CMAKE_HOSTC_ABI_COMPILED_OUTPUT)
+unset(__CMAKE_HOSTC_COMPILER_CACHE_FILE)
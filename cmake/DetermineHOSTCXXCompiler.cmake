@@ -34,9 +34,7 @@ endif()
 include(CMakeTestCompilerCommon)
 
 # List compilers to try
-if(NOT CMAKE_HOSTCXX_COMPILER_LIST)
-  set(CMAKE_HOSTCXX_COMPILER_LIST c++ g++ clang++)
-endif()
+get_host_compiler_list(CXX CMAKE_HOSTCXX_COMPILER_LIST)
 
 find_host_compiler(CXX)
 
@@ -49,6 +47,33 @@ if(NOT CMAKE_HOSTCXX_COMPILER)
   )
 endif()
 
+# Reuse the compiler information of project() for the same compiler
+load_host_target_compiler_info(CXX __CMAKE_HOSTCXX_COMPILER_REUSED)
+if(__CMAKE_HOSTCXX_COMPILER_REUSED)
+  message(STATUS "Reusing CXX compiler info for HOSTCXX compiler - done")
+  set_host_platform_default_options(CXX)
+  set(CMAKE_HOSTCXX_SOURCE_FILE_EXTENSIONS C M c++ cc cpp cxx m mm CPP)
+  find_host_binutils(CXX)
+  save_host_compiler_preferences(CXX)
+  list(APPEND ENABLED_HOST_LANGUAGES CXX)
+  unset(__CMAKE_HOSTCXX_COMPILER_REUSED)
+  return()
+endif()
+
+# Load the compiler information detected by other build trees
+if(CMAKE_HOST_COMPILER_CACHE_DIR)
+  get_host_compiler_cache_file(CXX __CMAKE_HOSTCXX_COMPILER_CACHE_FILE)
+  unset(CMAKE_HOSTCXX_COMPILER_WORKS)
+  load_host_compiler_cache(CXX "${__CMAKE_HOSTCXX_COMPILER_CACHE_FILE}")
+  if(CMAKE_HOSTCXX_COMPILER_WORKS)
+    message(STATUS "Loading HOSTCXX compiler info from ${CMAKE_HOST_COMPILER_CACHE_DIR} - done")
+    save_host_compiler_preferences(CXX)
+    list(APPEND ENABLED_HOST_LANGUAGES CXX)
+    unset(__CMAKE_HOSTCXX_COMPILER_CACHE_FILE)
+    return()
+  endif()
+endif()
+
 # Build a small source file to identify the compiler.
 find_host_compiler_id(CXX)
 
@@ -92,29 +117,11 @@ else()
     "the following output:\n${__CMAKE_HOSTCXX_COMPILER_WORKS_OUTPUT}\n\n"
   )
 
-  # Try to identify the ABI
-  try_host_compile(CXX
-    SOURCE ${CMAKE_ROOT}/Modules/CMakeCXXCompilerABI.cpp
-    TARGET CMakeDetermineCompilerABI_HOSTCXX.bin
-    COMPILE_OPTIONS ${CMAKE_HOSTCXX_VERBOSE_FLAG}
-    WORKING_DIRECTORY ${CMAKE_BINARY_DIR}${CMAKE_FILES_DIRECTORY}/${CMAKE_VERSION}-hosta.internal
-    RESULT_VARIABLE CMAKE_HOSTCXX_ABI_COMPILED
-    OUTPUT_VARIABLE __CMAKE_HOSTCXX_ABI_COMPILED_OUTPUT
-  )
-
-  if(CMAKE_HOSTCXX_ABI_COMPILED)
-    message(STATUS "Detecting HOSTCXX compiler ABI info - done")
-    file(APPEND ${CMAKE_BINARY_DIR}${CMAKE_FILES_DIRECTORY}/CMakeOutput.log
-      "Detecting HOSTCXX compiler ABI info compiled with the following output:\n${__CMAKE_HOSTCXX_ABI_COMPILED_OUTPUT}\n\n"
-    )
-    parse_host_compiler_abi_info(CXX ${CMAKE_BINARY_DIR}${CMAKE_FILES_DIRECTORY}/${CMAKE_VERSION}-hosta.internal/CMakeDetermineCompilerABI_HOSTCXX.bin)
-    parse_host_implicit_include_info(CXX "${__CMAKE_HOSTCXX_ABI_COMPILED_OUTPUT}")
-    parse_host_implicit_link_info(CXX "${__CMAKE_HOSTCXX_ABI_COMPILED_OUTPUT}")
+  # Try to identify the ABI unless deferred to the first query
+  if(NOT DEFINED CMAKE_HOST_LAZY_COMPILER_INFO OR CMAKE_HOST_LAZY_COMPILER_INFO)
+    message(STATUS "Detecting HOSTCXX compiler ABI info - deferred")
   else()
-    message(STATUS "Detecting HOSTCXX compiler ABI info - failed")
-    file(APPEND ${CMAKE_BINARY_DIR}${CMAKE_FILES_DIRECTORY}/CMakeError.log
-      "Detecting HOSTCXX compiler ABI info failed to compile with the following output:\n${__CMAKE_HOSTCXX_ABI_COMPILED_OUTPUT}\n\n"
-    )
+    find_host_compiler_abi_info(CXX)
   endif()
 endif()
 
@@ -130,9 +137,14 @@ find_host_binutils(CXX)
 # Configure variables set in this file for fast reload later on
 save_host_compiler_preferences(CXX)
 
+# Share the compiler information with other build trees
+if(CMAKE_HOST_COMPILER_CACHE_DIR)
+  save_host_compiler_cache(CXX "${__CMAKE_HOSTCXX_COMPILER_CACHE_FILE}")
+endif()
+
 # Add the current host language to the list
 list(APPEND ENABLED_HOST_LANGUAGES CXX)
 
 # Unset temporary variables
 unset(__CMAKE_HOSTCXX_COMPILER_WORKS_OUTPUT)
-unset(__CMAKE_HOSTCXX_ABI_COMPILED_OUTPUT)
+unset(__CMAKE_HOSTCXX_COMPILER_CACHE_FILE)
@@ -0,0 +1,43 @@
+# Copyright (c) 2026 LG Electronics Inc.
+# SPDX-License-Identifier: MIT
+
+# Detect a host compiler in a separate process (see detect_host_compilers).
+#
+# Usage:
+#   cmake -DHOST_LANGUAGE=<lang> -DHOST_VARIABLES_FILE=<file> [-DHOST_LOG_FILE=<file>]
+#         [-DHOST_PROFILE_FILE=<file>] -P DetermineHOSTCompilerWorker.cmake
+#
+# With HOST_LOG_FILE, the detection runs in a child process whose output is
+# written to the given file, since only the output of the last process of a
+# concurrent execute_process() call can be captured. With CMAKE_HOST_PROFILE,
+# the profile entries of the detection are saved to HOST_PROFILE_FILE for the
+# report of the parent process.
+
+if(HOST_LOG_FILE)
+  execute_process(
+    COMMAND ${CMAKE_COMMAND}
+      -DHOST_LANGUAGE=${HOST_LANGUAGE}
+      -DHOST_VARIABLES_FILE=${HOST_VARIABLES_FILE}
+      -DHOST_PROFILE_FILE=${HOST_PROFILE_FILE}
+      -P ${CMAKE_CURRENT_LIST_FILE}
+    OUTPUT_FILE ${HOST_LOG_FILE}
+    ERROR_FILE ${HOST_LOG_FILE}
+    RESULT_VARIABLE _result
+  )
+  if(NOT _result EQUAL 0)
+    message(FATAL_ERROR "Failed to detect the HOST${HOST_LANGUAGE} compiler")
+  endif()
+  return()
+endif()
+
+include(${HOST_VARIABLES_FILE})
+include(${CMAKE_CURRENT_LIST_DIR}/HostCompilerUtilities.cmake)
+
+# The report is written by the parent process
+set_property(GLOBAL PROPERTY HOST_PROFILE_REPORT_DEFERRED TRUE)
+
+include(${CMAKE_CURRENT_LIST_DIR}/DetermineHOST${HOST_LANGUAGE}Compiler.cmake)
+
+if(HOST_PROFILE_FILE)
+  save_host_profile_entries(${HOST_PROFILE_FILE})
+endif()
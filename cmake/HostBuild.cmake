@@ -29,6 +29,13 @@ list(TRANSFORM ENABLE_HOST_LANGUAGES TOUPPER)
 list(REMOVE_DUPLICATES ENABLE_HOST_LANGUAGES)
 list(SORT ENABLE_HOST_LANGUAGES)
 
+# Detect the host compilers concurrently if not disabled
+if(NOT DEFINED CMAKE_HOST_CONCURRENT_DETECTION OR CMAKE_HOST_CONCURRENT_DETECTION)
+  start_host_profile(_profile_start)
+  detect_host_compilers(${ENABLE_HOST_LANGUAGES})
+  stop_host_profile(detect_host_compilers "${_profile_start}")
+endif()
+
 # Set the list of enabled host languages
 unset(ENABLED_HOST_LANGUAGES)
 foreach(lang IN LISTS ENABLE_HOST_LANGUAGES)
@@ -37,9 +44,22 @@ foreach(lang IN LISTS ENABLE_HOST_LANGUAGES)
   elseif(NOT EXISTS "${_HOSTA_BASE_DIR}/DetermineHOST${lang}Compiler.cmake")
     host_logging_error("No CMAKE_HOST${lang}_COMPILER could be found.")
   else()
+    start_host_profile(_profile_start)
     include(${_HOSTA_BASE_DIR}/DetermineHOST${lang}Compiler.cmake)
+    stop_host_profile(DetermineHOST${lang}Compiler "${_profile_start}")
   endif()
 endforeach()
+unset(_profile_start)
+
+# Set the default compile flags of the host build types
+foreach(lang IN LISTS ENABLED_HOST_LANGUAGES)
+  foreach(_config DEBUG RELEASE RELWITHDEBINFO MINSIZEREL)
+    if(NOT DEFINED CMAKE_HOST${lang}_FLAGS_${_config})
+      set(CMAKE_HOST${lang}_FLAGS_${_config} "${CMAKE_HOST${lang}_FLAGS_${_config}_INIT}")
+    endif()
+  endforeach()
+endforeach()
+unset(_config)
 
 # Set default host build target name
 if(NOT CMAKE_HOST_BUILD_TARGET)
@@ -49,6 +69,20 @@ endif()
 # Set default host build target
 add_custom_target(${CMAKE_HOST_BUILD_TARGET})
 
+# Report the statistics of the host object cache at the end of the build
+if(CMAKE_HOST_OBJECT_CACHE_DIR)
+  get_filename_component(CMAKE_HOST_OBJECT_CACHE_DIR "${CMAKE_HOST_OBJECT_CACHE_DIR}" ABSOLUTE BASE_DIR "${CMAKE_BINARY_DIR}")
+  set(CMAKE_HOST_OBJECT_CACHE_STATS "${CMAKE_BINARY_DIR}${CMAKE_FILES_DIRECTORY}/hosta-object-cache.stats")
+  add_custom_command(TARGET ${CMAKE_HOST_BUILD_TARGET} POST_BUILD
+    COMMAND ${CMAKE_COMMAND}
+      -DHOST_OBJECT_CACHE_DIR=${CMAKE_HOST_OBJECT_CACHE_DIR}
+      -DHOST_OBJECT_CACHE_STATS=${CMAKE_HOST_OBJECT_CACHE_STATS}
+      -DHOST_OBJECT_CACHE_REPORT=ON
+      -P ${_HOSTA_BASE_DIR}/HostObjectCache.cmake
+    VERBATIM
+  )
+endif()
+
 # Set host namespace prefix
 set(CMAKE_HOST_NAMESPACE_PREFIX "Host::")
 
@@ -114,6 +148,11 @@ define_property(TARGET PROPERTY HOST_INTERFACE_LINK_OPTIONS
   FULL_DOCS "List of link options for host targets"
 )
 
+define_property(TARGET PROPERTY HOST_INTERFACE_PRECOMPILE_HEADERS
+  BRIEF_DOCS "List of precompiled headers for host targets"
+  FULL_DOCS "List of precompiled headers for host targets"
+)
+
 define_property(TARGET PROPERTY HOST_BINARY_DIR
   BRIEF_DOCS "Binary directory where the host target is built"
   FULL_DOCS "Binary directory where the host target is built"
@@ -129,6 +168,43 @@ define_property(TARGET PROPERTY HOST_SOVERSION
   FULL_DOCS "SO version of the host target"
 )
 
+# Transitive usage requirements are computed once when a host library is
+# defined, so that consumers never need to walk the dependency graph again.
+define_property(TARGET PROPERTY HOST_TRANSITIVE_INCLUDE_DIRECTORIES
+  BRIEF_DOCS "Transitive list of include directories for host targets"
+  FULL_DOCS "Transitive list of include directories for host targets"
+)
+
+define_property(TARGET PROPERTY HOST_TRANSITIVE_COMPILE_OPTIONS
+  BRIEF_DOCS "Transitive list of compile options for host targets"
+  FULL_DOCS "Transitive list of compile options for host targets"
+)
+
+define_property(TARGET PROPERTY HOST_TRANSITIVE_PRECOMPILE_HEADERS
+  BRIEF_DOCS "Transitive list of precompiled headers for host targets"
+  FULL_DOCS "Transitive list of precompiled headers for host targets"
+)
+
+define_property(TARGET PROPERTY HOST_TRANSITIVE_LINK_OPTIONS
+  BRIEF_DOCS "Transitive list of link options and libraries for host targets"
+  FULL_DOCS "Transitive list of link options and libraries for host targets in link order"
+)
+
+define_property(TARGET PROPERTY HOST_TRANSITIVE_RUNTIME_DIRECTORIES
+  BRIEF_DOCS "Transitive list of shared library directories for host targets"
+  FULL_DOCS "Transitive list of shared library directories for host targets"
+)
+
+define_property(TARGET PROPERTY HOST_TRANSITIVE_LINK_DEPENDS
+  BRIEF_DOCS "Transitive list of files for host targets to be relinked on change"
+  FULL_DOCS "Transitive list of archives, shared libraries and object files for host targets to be relinked on change"
+)
+
+define_property(TARGET PROPERTY HOST_TRANSITIVE_DEPENDENCIES
+  BRIEF_DOCS "Transitive list of host targets to be built first"
+  FULL_DOCS "Transitive list of host targets to be built first"
+)
+
 function(get_host_target_property VARIABLE TARGET PROPERTY)
   get_host_target_name(TARGET "${TARGET}")
 
@@ -149,7 +225,7 @@ endfunction(get_host_target_property)
 
 function(get_host_target_properties TARGET)
   set(oneValueArgs NAME OUTPUT_NAME TYPE SOURCE_DIR BINARY_DIR VERSION SOVERSION)
-  set(multiValueArgs SOURCES INTERFACE_INCLUDE_DIRECTORIES INTERFACE_COMPILE_OPTIONS INTERFACE_LINK_OPTIONS)
+  set(multiValueArgs SOURCES INTERFACE_INCLUDE_DIRECTORIES INTERFACE_COMPILE_OPTIONS INTERFACE_LINK_OPTIONS INTERFACE_PRECOMPILE_HEADERS)
   cmake_parse_arguments(ARG "" "${oneValueArgs}" "${multiValueArgs}" ${ARGN})
 
   set(properties ${oneValueArgs} ${multiValueArgs})
@@ -180,7 +256,7 @@ endfunction(set_host_target_property)
 
 function(set_host_target_properties TARGET)
   set(oneValueArgs NAME OUTPUT_NAME TYPE BINARY_DIR VERSION SOVERSION)
-  set(multiValueArgs SOURCES INTERFACE_INCLUDE_DIRECTORIES INTERFACE_COMPILE_OPTIONS INTERFACE_LINK_OPTIONS)
+  set(multiValueArgs SOURCES INTERFACE_INCLUDE_DIRECTORIES INTERFACE_COMPILE_OPTIONS INTERFACE_LINK_OPTIONS INTERFACE_PRECOMPILE_HEADERS)
   cmake_parse_arguments(ARG "" "${oneValueArgs}" "${multiValueArgs}" ${ARGN})
 
   set(properties ${oneValueArgs} ${multiValueArgs})
@@ -258,39 +334,333 @@ function(separate_host_scoped_arguments INPUT OUTPUT INTERFACE_OUTPUT)
   set(${INTERFACE_OUTPUT} ${_interface_result} PARENT_SCOPE)
 endfunction(separate_host_scoped_arguments)
 
-function(get_host_file_dependencies lang OUTPUT)
-  set(oneValueArgs SOURCE)
-  set(multiValueArgs INCLUDE_DIRECTORIES COMPILE_OPTIONS)
+# Prepend the flag to each argument. Unlike transform_host_arguments(),
+# generator expressions are expected to expand to lists, so the flag is
+# prepended to each of the expanded elements.
+function(prepend_host_transitive_flag OUTPUT INPUT FLAG)
+  unset(_result)
+  foreach(arg IN LISTS INPUT)
+    if("${arg}" MATCHES "\\$<")
+      list(APPEND _result "$<$<BOOL:${arg}>:${FLAG}>$<JOIN:${arg},$<SEMICOLON>${FLAG}>")
+    else()
+      list(APPEND _result "${FLAG}${arg}")
+    endif()
+  endforeach()
+  set(${OUTPUT} ${_result} PARENT_SCOPE)
+endfunction(prepend_host_transitive_flag)
+
+# Collect the transitive usage requirements of the given host libraries into
+# <PREFIX>_INCLUDE_DIRECTORIES, <PREFIX>_COMPILE_OPTIONS,
+# <PREFIX>_PRECOMPILE_HEADERS, <PREFIX>_LINK_OPTIONS,
+# <PREFIX>_RUNTIME_DIRECTORIES, <PREFIX>_LINK_DEPENDS and
+# <PREFIX>_DEPENDENCIES. The closures of the libraries defined so far are read
+# as is, while libraries defined later are referred to by generator
+# expressions resolved at generate time. Each option item of a closure is
+# either the generator expression of the options of one library, an archive or
+# an object file, so duplicates are removed per item.
+function(get_host_transitive_properties PREFIX LIBRARIES)
+  set(_properties INCLUDE_DIRECTORIES COMPILE_OPTIONS PRECOMPILE_HEADERS LINK_OPTIONS RUNTIME_DIRECTORIES LINK_DEPENDS DEPENDENCIES)
+  foreach(_property IN LISTS _properties)
+    set(_result_${_property})
+  endforeach()
+
+  foreach(_lib IN LISTS LIBRARIES)
+    set(_defined FALSE)
+    if(TARGET ${_lib})
+      get_property(_defined TARGET ${_lib} PROPERTY HOST_TRANSITIVE_DEPENDENCIES SET)
+    endif()
+
+    if(_defined)
+      foreach(_property IN LISTS _properties)
+        get_property(_value TARGET ${_lib} PROPERTY HOST_TRANSITIVE_${_property})
+        list(APPEND _result_${_property} ${_value})
+      endforeach()
+    else()
+      foreach(_property IN LISTS _properties)
+        # Precompiled headers have to be known at configure time
+        if(_property STREQUAL "PRECOMPILE_HEADERS")
+          continue()
+        endif()
+        # Closures may refer to libraries defined later, hence GENEX_EVAL
+        list(APPEND _result_${_property} "$<GENEX_EVAL:$<TARGET_PROPERTY:${_lib},HOST_TRANSITIVE_${_property}>>")
+      endforeach()
+      # Note: $<TARGET_PROPERTY:tgt,prop>: Non-existing libraries cause build failures
+      list(APPEND _result_DEPENDENCIES "${CMAKE_HOST_TARGET_PREFIX}$<TARGET_PROPERTY:${_lib},HOST_NAME>")
+    endif()
+  endforeach()
+
+  # Archives must precede the libraries they depend on, so keep the last occurrence
+  if(_result_LINK_OPTIONS)
+    list(REVERSE _result_LINK_OPTIONS)
+    list(REMOVE_DUPLICATES _result_LINK_OPTIONS)
+    list(REVERSE _result_LINK_OPTIONS)
+  endif()
+
+  foreach(_property IN LISTS _properties)
+    if(_result_${_property} AND NOT _property STREQUAL "LINK_OPTIONS")
+      list(REMOVE_DUPLICATES _result_${_property})
+    endif()
+    set(${PREFIX}_${_property} "${_result_${_property}}" PARENT_SCOPE)
+  endforeach()
+endfunction(get_host_transitive_properties)
+
+# Get the modification times of the given files. Missing files yield an
+# empty entry, so that any change of the file set is detected.
+function(get_host_file_timestamps OUTPUT FILES)
+  unset(_result)
+  foreach(_file IN LISTS FILES)
+    # Fractional seconds are supported by CMake 3.23 or higher. Older versions
+    # also use the file contents, so that changes within a second are detected.
+    if(CMAKE_VERSION VERSION_LESS 3.23)
+      file(TIMESTAMP "${_file}" _timestamp "%Y-%m-%dT%H:%M:%S" UTC)
+      if(EXISTS "${_file}" AND NOT IS_DIRECTORY "${_file}")
+        file(MD5 "${_file}" _hash)
+        string(APPEND _timestamp "-${_hash}")
+      endif()
+    else()
+      file(TIMESTAMP "${_file}" _timestamp "%Y-%m-%dT%H:%M:%S%f" UTC)
+    endif()
+    list(APPEND _result "${_timestamp}")
+  endforeach()
+  set(${OUTPUT} "${_result}" PARENT_SCOPE)
+endfunction(get_host_file_timestamps)
+
+# Check if the compiler-generated depfiles can be used by the generator.
+# DEPFILE of add_custom_command() is supported by Ninja (3.7+) and Makefile
+# generators (3.20+).
+function(get_host_depfile_support OUTPUT)
+  if(CMAKE_GENERATOR MATCHES "Ninja" OR
+     (CMAKE_GENERATOR MATCHES "Make" AND NOT CMAKE_VERSION VERSION_LESS 3.20))
+    set(${OUTPUT} TRUE PARENT_SCOPE)
+  else()
+    set(${OUTPUT} FALSE PARENT_SCOPE)
+  endif()
+endfunction(get_host_depfile_support)
+
+# Queue a source file for the configure-time header dependency scan.
+# The queued sources of the current directory are resolved together by
+# scan_host_file_dependencies(). If OBJECT is given, the resolved files are
+# appended to the DEPENDS of the custom command producing the object file.
+# Objects are not queued in the depfile-only mode (CMAKE_HOST_DEPFILE_ONLY),
+# where the depfile is the only source of their header dependencies.
+# The scan runs through the compiler launcher, if any.
+function(queue_host_file_dependencies lang OUTPUT)
+  set(oneValueArgs SOURCE OBJECT)
+  set(multiValueArgs INCLUDE_DIRECTORIES COMPILE_OPTIONS COMPILER_LAUNCHER)
   cmake_parse_arguments(BUILD "" "${oneValueArgs}" "${multiValueArgs}" ${ARGN})
 
+  if(BUILD_OBJECT)
+    get_host_depfile_support(_depfile_supported)
+    if(_depfile_supported AND (NOT DEFINED CMAKE_HOST_DEPFILE_ONLY OR CMAKE_HOST_DEPFILE_ONLY))
+      unset(${OUTPUT} PARENT_SCOPE)
+      return()
+    endif()
+  endif()
+
   # Resolve absolute path
   get_filename_component(BUILD_SOURCE ${BUILD_SOURCE} ABSOLUTE)
 
-  # Resolve file dependencies
-  set(BUILD_COMMAND
+  # Fall back to the global compiler launcher
+  if(NOT BUILD_COMPILER_LAUNCHER)
+    set(BUILD_COMPILER_LAUNCHER ${CMAKE_HOST${lang}_COMPILER_LAUNCHER})
+  endif()
+
+  get_property(_index DIRECTORY PROPERTY HOST_DEPENDENCY_SCAN_COUNT)
+  if(NOT _index)
+    set(_index 0)
+  endif()
+  math(EXPR _count "${_index} + 1")
+
+  set_property(DIRECTORY PROPERTY HOST_DEPENDENCY_SCAN_COUNT ${_count})
+  set_property(DIRECTORY PROPERTY HOST_DEPENDENCY_SCAN_${_index}_SOURCE "${BUILD_SOURCE}")
+  set_property(DIRECTORY PROPERTY HOST_DEPENDENCY_SCAN_${_index}_OBJECT "${BUILD_OBJECT}")
+  set_property(DIRECTORY PROPERTY HOST_DEPENDENCY_SCAN_${_index}_COMPILER "${CMAKE_HOST${lang}_COMPILER}")
+  set_property(DIRECTORY PROPERTY HOST_DEPENDENCY_SCAN_${_index}_COMMAND
+    ${BUILD_COMPILER_LAUNCHER}
     ${CMAKE_HOST${lang}_COMPILER}
     -MM
     ${BUILD_SOURCE}
     ${BUILD_INCLUDE_DIRECTORIES}
     ${BUILD_COMPILE_OPTIONS}
   )
-  execute_process(
-    COMMAND ${BUILD_COMMAND}
-    WORKING_DIRECTORY ${CMAKE_CURRENT_SOURCE_DIR}
-    RESULT_VARIABLE _result
-    OUTPUT_VARIABLE _output
-    ERROR_QUIET
-  )
 
-  if(_result EQUAL 0)
-    string(REPLACE " \\" "" _output "${_output}")
-    string(REPLACE "\n" "" _output "${_output}")
-    separate_arguments(_file_dependencies NATIVE_COMMAND "${_output}")
-    list(REMOVE_AT _file_dependencies 0)
-  else()
-    set(_file_dependencies ${BUILD_SOURCE})
+  set(${OUTPUT} ${_index} PARENT_SCOPE)
+endfunction(queue_host_file_dependencies)
+
+# Resolve the file dependencies of all queued sources in the current directory.
+# Up to CMAKE_HOST_DEPENDENCY_SCAN_JOBS compiler processes run concurrently
+# within a single execute_process() call. The results are cached in the
+# internal directory and reused as long as the source, its headers and the
+# compiler keep their timestamps and the scan command line is unchanged. With
+# DEFER, the scan is postponed to the end of the current directory if
+# supported (CMake 3.19 or higher), so that the sources of all host targets in
+# the directory share the batches.
+function(scan_host_file_dependencies)
+  set(options DEFER)
+  cmake_parse_arguments(ARG "${options}" "" "" ${ARGN})
+
+  if(ARG_DEFER AND NOT CMAKE_VERSION VERSION_LESS 3.19)
+    get_property(_deferred DIRECTORY PROPERTY HOST_DEPENDENCY_SCAN_DEFERRED)
+    if(NOT _deferred)
+      set_property(DIRECTORY PROPERTY HOST_DEPENDENCY_SCAN_DEFERRED TRUE)
+      cmake_language(DEFER CALL scan_host_file_dependencies)
+    endif()
+    return()
+  endif()
+  set_property(DIRECTORY PROPERTY HOST_DEPENDENCY_SCAN_DEFERRED FALSE)
+
+  get_property(_count DIRECTORY PROPERTY HOST_DEPENDENCY_SCAN_COUNT)
+  get_property(_start DIRECTORY PROPERTY HOST_DEPENDENCY_SCAN_START)
+  if(NOT _count)
+    set(_count 0)
+  endif()
+  if(NOT _start)
+    set(_start 0)
+  endif()
+  if(_start EQUAL _count)
+    return()
   endif()
 
+  start_host_profile(_profile_start)
+
+  # Set the maximum number of concurrent compiler processes
+  set(_jobs "${CMAKE_HOST_DEPENDENCY_SCAN_JOBS}")
+  if(NOT _jobs)
+    cmake_host_system_information(RESULT _jobs QUERY NUMBER_OF_LOGICAL_CORES)
+  endif()
+  if(NOT _jobs GREATER 0)
+    set(_jobs 1)
+  endif()
+
+  # Each process writes its dependency rule to a separate file, since only
+  # the output of the last command of execute_process() can be captured.
+  # The rules are kept to serve as a cache for later configure runs.
+  set(_scan_dir "${CMAKE_BINARY_DIR}${CMAKE_FILES_DIRECTORY}/${CMAKE_VERSION}-hosta.internal/dependencies")
+  file(MAKE_DIRECTORY "${_scan_dir}")
+
+  # Reuse cached results whose source, headers and compiler are unchanged
+  unset(_pending)
+  set(_index ${_start})
+  while(_index LESS _count)
+    get_property(_command DIRECTORY PROPERTY HOST_DEPENDENCY_SCAN_${_index}_COMMAND)
+    get_property(_compiler DIRECTORY PROPERTY HOST_DEPENDENCY_SCAN_${_index}_COMPILER)
+    get_property(_source DIRECTORY PROPERTY HOST_DEPENDENCY_SCAN_${_index}_SOURCE)
+    string(MD5 _key "${CMAKE_CURRENT_SOURCE_DIR};${_command}")
+    set_property(DIRECTORY PROPERTY HOST_DEPENDENCY_SCAN_${_index}_KEY ${_key})
+    math(EXPR _index "${_index} + 1")
+
+    # Scan the same command only once
+    get_property(_resolved DIRECTORY PROPERTY HOST_DEPENDENCY_SCAN_${_key} SET)
+    if(_resolved OR _key IN_LIST _pending)
+      continue()
+    endif()
+
+    set(_stamp_file "${_scan_dir}/${_key}.cmake")
+    if((NOT DEFINED CMAKE_HOST_DEPENDENCY_SCAN_CACHE OR CMAKE_HOST_DEPENDENCY_SCAN_CACHE) AND EXISTS "${_stamp_file}")
+      unset(_cached_files)
+      unset(_cached_timestamps)
+      unset(_cached_dependencies)
+      include("${_stamp_file}")
+      get_host_file_timestamps(_timestamps "${_cached_files}")
+      if(_cached_files AND "${_timestamps}" STREQUAL "${_cached_timestamps}")
+        set_property(DIRECTORY PROPERTY HOST_DEPENDENCY_SCAN_${_key} "${_cached_dependencies}")
+        continue()
+      endif()
+    endif()
+
+    list(APPEND _pending ${_key})
+    set_property(DIRECTORY PROPERTY HOST_DEPENDENCY_SCAN_${_key}_COMMAND ${_command})
+    set_property(DIRECTORY PROPERTY HOST_DEPENDENCY_SCAN_${_key}_COMPILER "${_compiler}")
+    set_property(DIRECTORY PROPERTY HOST_DEPENDENCY_SCAN_${_key}_SOURCE "${_source}")
+  endwhile()
+
+  # Scan the remaining sources in batches of concurrent processes
+  while(_pending)
+    unset(_commands)
+    unset(_batch)
+    while(_pending)
+      list(LENGTH _batch _length)
+      if(NOT _length LESS _jobs)
+        break()
+      endif()
+      list(POP_FRONT _pending _key)
+      get_property(_command DIRECTORY PROPERTY HOST_DEPENDENCY_SCAN_${_key}_COMMAND)
+      file(REMOVE "${_scan_dir}/${_key}.d" "${_scan_dir}/${_key}.cmake")
+      list(APPEND _commands COMMAND ${_command} -MF ${_scan_dir}/${_key}.d)
+      list(APPEND _batch ${_key})
+    endwhile()
+
+    start_host_profile(_process_start)
+    execute_process(
+      ${_commands}
+      WORKING_DIRECTORY ${CMAKE_CURRENT_SOURCE_DIR}
+      RESULTS_VARIABLE _results
+      OUTPUT_QUIET
+      ERROR_QUIET
+    )
+    stop_host_profile("execute_process(scan_host_file_dependencies)" "${_process_start}")
+
+    foreach(_key IN LISTS _batch)
+      list(POP_FRONT _results _result)
+      get_property(_source DIRECTORY PROPERTY HOST_DEPENDENCY_SCAN_${_key}_SOURCE)
+      get_property(_compiler DIRECTORY PROPERTY HOST_DEPENDENCY_SCAN_${_key}_COMPILER)
+      set(_depfile "${_scan_dir}/${_key}.d")
+
+      if("${_result}" STREQUAL "0" AND EXISTS "${_depfile}")
+        file(READ "${_depfile}" _output)
+        string(REPLACE " \\" "" _output "${_output}")
+        string(REPLACE "\n" "" _output "${_output}")
+        separate_arguments(_file_dependencies NATIVE_COMMAND "${_output}")
+        list(REMOVE_AT _file_dependencies 0)
+
+        # Record the timestamps of the resolved files and the compiler
+        set(_cached_files ${_file_dependencies} ${_compiler})
+        get_host_file_timestamps(_timestamps "${_cached_files}")
+        file(WRITE "${_scan_dir}/${_key}.cmake"
+          "set(_cached_files [==[${_cached_files}]==])\n"
+          "set(_cached_timestamps [==[${_timestamps}]==])\n"
+          "set(_cached_dependencies [==[${_file_dependencies}]==])\n"
+        )
+      else()
+        set(_file_dependencies ${_source})
+      endif()
+      set_property(DIRECTORY PROPERTY HOST_DEPENDENCY_SCAN_${_key} "${_file_dependencies}")
+    endforeach()
+  endwhile()
+
+  # Distribute the results to the queued sources
+  set(_index ${_start})
+  while(_index LESS _count)
+    get_property(_key DIRECTORY PROPERTY HOST_DEPENDENCY_SCAN_${_index}_KEY)
+    get_property(_file_dependencies DIRECTORY PROPERTY HOST_DEPENDENCY_SCAN_${_key})
+    set_property(DIRECTORY PROPERTY HOST_DEPENDENCY_SCAN_${_index}_RESULT "${_file_dependencies}")
+
+    get_property(_object DIRECTORY PROPERTY HOST_DEPENDENCY_SCAN_${_index}_OBJECT)
+    if(_object)
+      add_custom_command(OUTPUT ${_object} APPEND DEPENDS ${_file_dependencies})
+    endif()
+    math(EXPR _index "${_index} + 1")
+  endwhile()
+
+  set_property(DIRECTORY PROPERTY HOST_DEPENDENCY_SCAN_START ${_count})
+
+  stop_host_profile(scan_host_file_dependencies "${_profile_start}")
+endfunction(scan_host_file_dependencies)
+
+function(get_host_file_dependencies lang OUTPUT)
+  set(oneValueArgs SOURCE)
+  set(multiValueArgs INCLUDE_DIRECTORIES COMPILE_OPTIONS)
+  cmake_parse_arguments(BUILD "" "${oneValueArgs}" "${multiValueArgs}" ${ARGN})
+
+  # Resolve file dependencies
+  queue_host_file_dependencies(${lang} _index
+    SOURCE "${BUILD_SOURCE}"
+    INCLUDE_DIRECTORIES "${BUILD_INCLUDE_DIRECTORIES}"
+    COMPILE_OPTIONS "${BUILD_COMPILE_OPTIONS}"
+  )
+  scan_host_file_dependencies()
+
+  get_property(_file_dependencies DIRECTORY PROPERTY HOST_DEPENDENCY_SCAN_${_index}_RESULT)
   set(${OUTPUT} ${_file_dependencies} PARENT_SCOPE)
 endfunction(get_host_file_dependencies)
 
@@ -363,14 +733,362 @@ function(get_host_include_flag OUTPUT)
   set(${OUTPUT} "-I" PARENT_SCOPE)
 endfunction(get_host_include_flag)
 
+# Return the directory of the intermediate files of a host target. Each host
+# build type has its own directory, so switching between build types reuses
+# the objects built before.
+function(get_host_object_directory OUTPUT TARGET)
+  set(_directory "${CMAKE_CURRENT_BINARY_DIR}${CMAKE_FILES_DIRECTORY}/${CMAKE_HOST_TARGET_PREFIX}${TARGET}.dir")
+  if(CMAKE_HOST_BUILD_TYPE)
+    string(APPEND _directory "/${CMAKE_HOST_BUILD_TYPE}")
+  endif()
+  set(${OUTPUT} "${_directory}" PARENT_SCOPE)
+endfunction(get_host_object_directory)
+
+# Return the compile and link options of the optimizations requested for a
+# host target as <PREFIX>_COMPILE_OPTIONS and <PREFIX>_LINK_OPTIONS.
+# INTERPROCEDURAL_OPTIMIZATION enables link-time optimization, which is set to
+# <PREFIX>_INTERPROCEDURAL_OPTIMIZATION along with its link options as
+# <PREFIX>_INTERPROCEDURAL_LINK_OPTIONS, and GC_SECTIONS removes unused
+# functions and data from the linked binaries.
+function(get_host_optimization_options lang PREFIX)
+  set(oneValueArgs TARGET INTERPROCEDURAL_OPTIMIZATION GC_SECTIONS)
+  cmake_parse_arguments(BUILD "" "${oneValueArgs}" "" ${ARGN})
+
+  # Fall back to the global settings
+  if("${BUILD_INTERPROCEDURAL_OPTIMIZATION}" STREQUAL "")
+    set(BUILD_INTERPROCEDURAL_OPTIMIZATION "${CMAKE_HOST_INTERPROCEDURAL_OPTIMIZATION}")
+  endif()
+  if("${BUILD_GC_SECTIONS}" STREQUAL "")
+    set(BUILD_GC_SECTIONS "${CMAKE_HOST_GC_SECTIONS}")
+  endif()
+
+  unset(_compile_options)
+  unset(_link_options)
+  unset(_interprocedural_link_options)
+
+  if(BUILD_INTERPROCEDURAL_OPTIMIZATION)
+    # Trust the user if the compiler information was forced without it
+    get_host_compiler_info(${lang} IPO_SUPPORTED _supported)
+    if(NOT "${_supported}" STREQUAL "" AND NOT _supported)
+      host_logging_error("INTERPROCEDURAL_OPTIMIZATION is not supported by the HOST${lang} compiler for target: ${BUILD_TARGET}")
+    endif()
+    if(CMAKE_HOST${lang}_COMPILE_OPTIONS_IPO)
+      list(APPEND _compile_options ${CMAKE_HOST${lang}_COMPILE_OPTIONS_IPO})
+      set(_interprocedural_link_options ${CMAKE_HOST${lang}_LINK_OPTIONS_IPO})
+    else()
+      list(APPEND _compile_options -flto)
+      set(_interprocedural_link_options -flto)
+    endif()
+    list(APPEND _link_options ${_interprocedural_link_options})
+    set(${PREFIX}_INTERPROCEDURAL_OPTIMIZATION TRUE PARENT_SCOPE)
+  else()
+    set(${PREFIX}_INTERPROCEDURAL_OPTIMIZATION FALSE PARENT_SCOPE)
+  endif()
+
+  if(BUILD_GC_SECTIONS)
+    list(APPEND _compile_options -ffunction-sections -fdata-sections)
+    list(APPEND _link_options -Wl,--gc-sections)
+  endif()
+
+  set(${PREFIX}_COMPILE_OPTIONS ${_compile_options} PARENT_SCOPE)
+  set(${PREFIX}_LINK_OPTIONS ${_link_options} PARENT_SCOPE)
+  set(${PREFIX}_INTERPROCEDURAL_LINK_OPTIONS ${_interprocedural_link_options} PARENT_SCOPE)
+endfunction(get_host_optimization_options)
+
+# Convert the given headers into the form used by #include directives.
+# Angle-bracketed headers are kept as is, and the others are quoted with
+# their absolute paths.
+function(get_host_precompile_headers OUTPUT INPUT)
+  unset(_result)
+  foreach(_header IN LISTS INPUT)
+    if("${_header}" MATCHES "\\$<|^<.*>$|^\".*\"$")
+      list(APPEND _result "${_header}")
+    else()
+      get_filename_component(_header "${_header}" ABSOLUTE)
+      list(APPEND _result "\"${_header}\"")
+    endif()
+  endforeach()
+  set(${OUTPUT} ${_result} PARENT_SCOPE)
+endfunction(get_host_precompile_headers)
+
+# Precompile the headers for the given language, and return the compile
+# options to use the precompiled header and the file the objects depend on.
+# With OWNER, the name of the host target being built, targets of the same
+# directory with identical headers and compile flags share a single
+# precompiled header, and OWNER_OUTPUT is set to the custom target that builds
+# it if it is shared with another target.
+function(do_host_precompile_headers lang OUTPUT DEPENDS_OUTPUT)
+  set(oneValueArgs TARGET OWNER OWNER_OUTPUT)
+  set(multiValueArgs HEADERS INCLUDE_DIRECTORIES COMPILE_OPTIONS COMPILER_LAUNCHER)
+  cmake_parse_arguments(BUILD "" "${oneValueArgs}" "${multiValueArgs}" ${ARGN})
+
+  if(BUILD_OWNER_OUTPUT)
+    unset(${BUILD_OWNER_OUTPUT} PARENT_SCOPE)
+  endif()
+
+  # Without an owner, the precompiled header is not shared
+  if(NOT BUILD_OWNER)
+    set(BUILD_OWNER "${CMAKE_HOST_TARGET_PREFIX}${BUILD_TARGET}")
+    set(_scope "${BUILD_TARGET}")
+  endif()
+
+  string(MD5 _key "${lang};${_scope};${BUILD_COMPILER_LAUNCHER};${CMAKE_HOST${lang}_COMPILER};${BUILD_HEADERS};${BUILD_INCLUDE_DIRECTORIES};${BUILD_COMPILE_OPTIONS}")
+  get_property(_options DIRECTORY PROPERTY HOST_PRECOMPILE_HEADER_${_key}_OPTIONS)
+  get_property(_depends DIRECTORY PROPERTY HOST_PRECOMPILE_HEADER_${_key}_DEPENDS)
+  get_property(_owner DIRECTORY PROPERTY HOST_PRECOMPILE_HEADER_${_key}_OWNER)
+  if(_depends)
+    # A custom target builds the shared precompiled header first, so that
+    # parallel builds never race on it
+    if(BUILD_OWNER_OUTPUT AND NOT _owner STREQUAL BUILD_OWNER)
+      get_host_shared_target(_shared "${_depends}" "${_owner}")
+      set(${BUILD_OWNER_OUTPUT} ${_shared} PARENT_SCOPE)
+    endif()
+    set(${OUTPUT} ${_options} PARENT_SCOPE)
+    set(${DEPENDS_OUTPUT} ${_depends} PARENT_SCOPE)
+    return()
+  endif()
+
+  set(C_header_extension "h")
+  set(C_header_language "c-header")
+  set(CXX_header_extension "hxx")
+  set(CXX_header_language "c++-header")
+
+  # Write a header including all of the precompiled headers
+  unset(_headers)
+  foreach(_entry IN LISTS BUILD_HEADERS)
+    # Escape characters with special meaning inside generator expressions
+    if(NOT "${_entry}" MATCHES "\\$<")
+      string(REPLACE ">" "$<ANGLE-R>" _entry "${_entry}")
+      string(REPLACE "," "$<COMMA>" _entry "${_entry}")
+    endif()
+    list(APPEND _headers "${_entry}")
+  endforeach()
+  get_host_object_directory(_object_directory "${BUILD_TARGET}")
+  set(_header "${_object_directory}/cmake_pch.${${lang}_header_extension}")
+  file(GENERATE
+    OUTPUT ${_header}
+    CONTENT "/* generated by hosta */\n#include $<JOIN:${_headers},\n#include >\n"
+  )
+
+  if(CMAKE_HOST${lang}_COMPILER_ID STREQUAL "GNU")
+    # GCC picks up <header>.gch next to the included header
+    set(_output "${_header}.gch")
+    set(_options -Winvalid-pch -include ${_header})
+  elseif(CMAKE_HOST${lang}_COMPILER_ID MATCHES "Clang")
+    set(_output "${_header}.pch")
+    set(_options -Xclang -include-pch -Xclang ${_output} -Xclang -include -Xclang ${_header})
+  else()
+    # Include the headers without precompiling them
+    set(_output "${_header}")
+    set(_options -include ${_header})
+  endif()
+
+  if(NOT _output STREQUAL _header)
+    do_host_precompile_header_command(${lang} "${_header}" "${_output}"
+      COMPILER_LAUNCHER "${BUILD_COMPILER_LAUNCHER}"
+      INCLUDE_DIRECTORIES "${BUILD_INCLUDE_DIRECTORIES}"
+      COMPILE_OPTIONS "${BUILD_COMPILE_OPTIONS}" -x ${${lang}_header_language}
+    )
+  endif()
+
+  set_property(DIRECTORY PROPERTY HOST_PRECOMPILE_HEADER_${_key}_OPTIONS ${_options})
+  set_property(DIRECTORY PROPERTY HOST_PRECOMPILE_HEADER_${_key}_DEPENDS ${_output})
+  set_property(DIRECTORY PROPERTY HOST_PRECOMPILE_HEADER_${_key}_OWNER ${BUILD_OWNER})
+
+  set(${OUTPUT} ${_options} PARENT_SCOPE)
+  set(${DEPENDS_OUTPUT} ${_output} PARENT_SCOPE)
+endfunction(do_host_precompile_headers)
+
+function(do_host_precompile_header_command lang HEADER OUTPUT)
+  set(multiValueArgs INCLUDE_DIRECTORIES COMPILE_OPTIONS COMPILER_LAUNCHER)
+  cmake_parse_arguments(BUILD "" "" "${multiValueArgs}" ${ARGN})
+
+  file(RELATIVE_PATH _relative_output ${CMAKE_CURRENT_BINARY_DIR} "${OUTPUT}")
+
+  set(BUILD_COMMAND
+    ${BUILD_COMPILER_LAUNCHER}
+    ${CMAKE_HOST${lang}_COMPILER}
+    ${BUILD_INCLUDE_DIRECTORIES}
+    ${BUILD_COMPILE_OPTIONS}
+    -o ${_relative_output}
+    -c ${HEADER}
+  )
+
+  # Track the headers included by the precompiled header
+  get_host_depfile_support(_depfile_supported)
+  if(_depfile_supported)
+    if(POLICY CMP0116)
+      cmake_policy(SET CMP0116 NEW)
+    endif()
+    set(_relative_depfile "${_relative_output}.d")
+    list(APPEND BUILD_COMMAND -MD -MF ${_relative_depfile} -MT ${_relative_output})
+
+    add_custom_command(
+      OUTPUT ${_relative_output}
+      COMMAND ${BUILD_COMMAND}
+      DEPENDS ${HEADER}
+      DEPFILE ${_relative_depfile}
+      WORKING_DIRECTORY ${CMAKE_CURRENT_BINARY_DIR}
+      COMMENT "Precompiling HOST${lang} header ${_relative_output}"
+      COMMAND_EXPAND_LISTS
+      VERBATIM
+    )
+  else()
+    add_custom_command(
+      OUTPUT ${_relative_output}
+      COMMAND ${BUILD_COMMAND}
+      DEPENDS ${HEADER}
+      IMPLICIT_DEPENDS ${lang} ${HEADER}
+      WORKING_DIRECTORY ${CMAKE_CURRENT_BINARY_DIR}
+      COMMENT "Precompiling HOST${lang} header ${_relative_output}"
+      COMMAND_EXPAND_LISTS
+      VERBATIM
+    )
+  endif()
+endfunction(do_host_precompile_header_command)
+
+# Amalgamate the source files into unity sources of at most BATCH_SIZE files
+# per language, written to the object directory of the target. A batch size
+# of 0 puts all files of the same language into a single unity source, and a
+# batch size of 1 keeps the original source files.
+function(do_host_unity_sources OUTPUT TARGET SOURCES)
+  set(oneValueArgs UNITY_BUILD BATCH_SIZE)
+  cmake_parse_arguments(BUILD "" "${oneValueArgs}" "" ${ARGN})
+
+  # Fall back to the global settings
+  if("${BUILD_UNITY_BUILD}" STREQUAL "")
+    set(BUILD_UNITY_BUILD "${CMAKE_HOST_UNITY_BUILD}")
+  endif()
+  if("${BUILD_BATCH_SIZE}" STREQUAL "")
+    set(BUILD_BATCH_SIZE "${CMAKE_HOST_UNITY_BUILD_BATCH_SIZE}")
+  endif()
+  if("${BUILD_BATCH_SIZE}" STREQUAL "")
+    set(BUILD_BATCH_SIZE 8)
+  endif()
+  if(NOT BUILD_BATCH_SIZE MATCHES "^[0-9]+$")
+    host_logging_error("UNITY_BUILD_BATCH_SIZE requires a non-negative integer: ${BUILD_BATCH_SIZE}")
+  endif()
+
+  if(NOT BUILD_UNITY_BUILD OR BUILD_BATCH_SIZE EQUAL 1)
+    set(${OUTPUT} ${SOURCES} PARENT_SCOPE)
+    return()
+  endif()
+
+  set(C_unity_extension "c")
+  set(CXX_unity_extension "cxx")
+
+  # Group source files by language
+  unset(_languages)
+  foreach(_source IN LISTS SOURCES)
+    get_filename_component(_path "${_source}" ABSOLUTE)
+    if(NOT EXISTS "${_path}")
+      host_logging_error("Cannot find source file:\n  ${_source}")
+    endif()
+    find_host_language(_lang "${_source}")
+    if(NOT _lang IN_LIST _languages)
+      list(APPEND _languages ${_lang})
+      set(_sources_${_lang})
+    endif()
+    list(APPEND _sources_${_lang} "${_path}")
+  endforeach()
+
+  get_host_object_directory(_object_directory "${TARGET}")
+
+  unset(_result)
+  foreach(_lang IN LISTS _languages)
+    # Split the source files into batches of the given size
+    set(_index 0)
+    set(_count 0)
+    foreach(_source IN LISTS _sources_${_lang})
+      if(BUILD_BATCH_SIZE GREATER 0 AND _count EQUAL BUILD_BATCH_SIZE)
+        math(EXPR _index "${_index} + 1")
+        set(_count 0)
+      endif()
+      if(_count EQUAL 0)
+        set(_content_${_index} "/* generated by hosta */\n")
+      endif()
+      string(APPEND _content_${_index} "#include \"${_source}\"\n")
+      math(EXPR _count "${_count} + 1")
+    endforeach()
+
+    foreach(_batch RANGE ${_index})
+      # Rewrite the unity source only when changed to avoid needless rebuilds
+      set(_unity_source "${_object_directory}/unity_${_batch}_${${_lang}_unity_extension}.${${_lang}_unity_extension}")
+      unset(_previous)
+      if(EXISTS "${_unity_source}")
+        file(READ "${_unity_source}" _previous)
+      endif()
+      if(NOT _content_${_batch} STREQUAL _previous)
+        file(WRITE "${_unity_source}" "${_content_${_batch}}")
+      endif()
+      list(APPEND _result "${_unity_source}")
+    endforeach()
+  endforeach()
+
+  set(${OUTPUT} ${_result} PARENT_SCOPE)
+endfunction(do_host_unity_sources)
+
+# Return the compile options selecting the debug information mode of
+# CMAKE_HOST_DEBUG_INFO for the given compile options. SPLIT moves the debug
+# information into a .dwo file next to the object, and COMPRESSED compresses
+# the debug sections. Nothing is added unless debug information is enabled.
+function(get_host_debug_info_options OUTPUT SPLIT_OUTPUT OPTIONS)
+  set(${OUTPUT} "" PARENT_SCOPE)
+  set(${SPLIT_OUTPUT} FALSE PARENT_SCOPE)
+
+  string(TOUPPER "${CMAKE_HOST_DEBUG_INFO}" _mode)
+  if(NOT _mode OR _mode STREQUAL "DEFAULT")
+    return()
+  elseif(NOT _mode MATCHES "^(SPLIT|COMPRESSED)$")
+    host_logging_error("CMAKE_HOST_DEBUG_INFO must be one of DEFAULT, SPLIT or COMPRESSED: ${CMAKE_HOST_DEBUG_INFO}")
+  endif()
+
+  # The last debug level option wins, as with the compiler
+  set(_debug FALSE)
+  foreach(_option IN LISTS OPTIONS)
+    if(_option MATCHES "^-g(gdb|dwarf(-[0-9]+)?)?[1-3]?$")
+      set(_debug TRUE)
+    elseif(_option STREQUAL "-g0")
+      set(_debug FALSE)
+    endif()
+  endforeach()
+  if(NOT _debug)
+    return()
+  endif()
+
+  if(_mode STREQUAL "SPLIT")
+    set(${OUTPUT} -gsplit-dwarf PARENT_SCOPE)
+    set(${SPLIT_OUTPUT} TRUE PARENT_SCOPE)
+  else()
+    set(${OUTPUT} -gz PARENT_SCOPE)
+  endif()
+endfunction(get_host_debug_info_options)
+
+# Compile a source file of a host target into an object file. With OWNER, the
+# name of the host target being built, compiles with identical sources,
+# compilers and flags in the current directory share a single object file,
+# and OWNER_OUTPUT is set to the custom targets that build the shared object
+# or the shared precompiled header.
 function(do_host_compile lang OUTPUT)
-  set(oneValueArgs SOURCE TARGET)
-  set(multiValueArgs INCLUDE_DIRECTORIES COMPILE_OPTIONS DEPENDS)
+  start_host_profile(_profile_start)
+  set(oneValueArgs SOURCE TARGET OWNER OWNER_OUTPUT)
+  set(multiValueArgs INCLUDE_DIRECTORIES COMPILE_OPTIONS PRECOMPILE_HEADERS COMPILER_LAUNCHER DEPENDS)
   cmake_parse_arguments(BUILD "" "${oneValueArgs}" "${multiValueArgs}" ${ARGN})
 
   # Reset the appropriate host language for each source file
   find_host_language(lang "${BUILD_SOURCE}")
 
+  # Fall back to the global compiler launcher
+  if(NOT BUILD_COMPILER_LAUNCHER)
+    set(BUILD_COMPILER_LAUNCHER ${CMAKE_HOST${lang}_COMPILER_LAUNCHER})
+  endif()
+
+  # Set compile flags of the host build type
+  if(CMAKE_HOST_BUILD_TYPE)
+    string(TOUPPER "${CMAKE_HOST_BUILD_TYPE}" _config)
+    list(PREPEND BUILD_COMPILE_OPTIONS "${CMAKE_HOST${lang}_FLAGS_${_config}}")
+  endif()
+
   # Set global compile flags
   list(PREPEND BUILD_COMPILE_OPTIONS "${CMAKE_HOST${lang}_FLAGS}")
 
@@ -378,27 +1096,82 @@ function(do_host_compile lang OUTPUT)
   get_host_standard_compile_option(${lang} _option)
   list(PREPEND BUILD_COMPILE_OPTIONS "${_option}")
 
+  # Use precompiled headers built with the same compile flags
+  unset(_owners)
+  if(BUILD_PRECOMPILE_HEADERS)
+    do_host_precompile_headers(${lang} _options _depends
+      TARGET "${BUILD_TARGET}"
+      OWNER "${BUILD_OWNER}"
+      OWNER_OUTPUT _owners
+      HEADERS "${BUILD_PRECOMPILE_HEADERS}"
+      COMPILER_LAUNCHER "${BUILD_COMPILER_LAUNCHER}"
+      INCLUDE_DIRECTORIES "${BUILD_INCLUDE_DIRECTORIES}"
+      COMPILE_OPTIONS "${BUILD_COMPILE_OPTIONS}"
+    )
+    list(APPEND BUILD_COMPILE_OPTIONS ${_options})
+    list(APPEND BUILD_DEPENDS ${_depends})
+  endif()
+
+  # Select the debug information mode
+  get_host_debug_info_options(_options _split_dwarf "${BUILD_COMPILE_OPTIONS}")
+  list(APPEND BUILD_COMPILE_OPTIONS ${_options})
+
+  # Resolve absolute path
+  get_filename_component(_absolute_source "${BUILD_SOURCE}" ABSOLUTE)
+
+  # Reuse the object of an identical compile with the same dependencies
+  if(BUILD_OWNER AND (NOT DEFINED CMAKE_HOST_DEDUPLICATE_COMPILES OR CMAKE_HOST_DEDUPLICATE_COMPILES))
+    string(MD5 _fingerprint "${lang};${_absolute_source};${BUILD_COMPILER_LAUNCHER};${CMAKE_HOST${lang}_COMPILER};${BUILD_INCLUDE_DIRECTORIES};${BUILD_COMPILE_OPTIONS};${BUILD_DEPENDS}")
+    get_property(_object DIRECTORY PROPERTY HOST_COMPILE_${_fingerprint}_OUTPUT)
+    get_property(_owner DIRECTORY PROPERTY HOST_COMPILE_${_fingerprint}_OWNER)
+    set_property(GLOBAL APPEND PROPERTY HOST_COMPILES "${_fingerprint}")
+    if(_object AND NOT _owner STREQUAL BUILD_OWNER)
+      set_property(GLOBAL APPEND PROPERTY HOST_DEDUPLICATED_COMPILES "${_fingerprint}")
+      set(${OUTPUT} ${_object} PARENT_SCOPE)
+      if(BUILD_OWNER_OUTPUT)
+        get_host_shared_target(_shared "${_object}" "${_owner}")
+        set(${BUILD_OWNER_OUTPUT} ${_shared} ${_owners} PARENT_SCOPE)
+      endif()
+      stop_host_profile(do_host_compile "${_profile_start}")
+      return()
+    endif()
+  endif()
+  if(BUILD_OWNER_OUTPUT)
+    set(${BUILD_OWNER_OUTPUT} ${_owners} PARENT_SCOPE)
+  endif()
+
   # Set path to the output file
-  if(IS_ABSOLUTE "${BUILD_SOURCE}")
+  # Sources generated in the object directory (e.g. unity sources) keep their names
+  get_host_object_directory(_object_directory "${BUILD_TARGET}")
+  string(FIND "${_absolute_source}" "${_object_directory}/" _index)
+  if(_index EQUAL 0)
+    file(RELATIVE_PATH BUILD_SOURCE ${_object_directory} "${_absolute_source}")
+  elseif(IS_ABSOLUTE "${BUILD_SOURCE}")
     file(RELATIVE_PATH BUILD_SOURCE ${CMAKE_CURRENT_SOURCE_DIR} "${BUILD_SOURCE}")
   endif()
   # Replace special characters in the path
   set(_build_source "${BUILD_SOURCE}")
   string(REPLACE ".." "__" _build_source "${_build_source}")
   string(REGEX REPLACE "[\":*?<>| ]" "_" _build_source "${_build_source}")
-  set(_absolute_output "${CMAKE_CURRENT_BINARY_DIR}${CMAKE_FILES_DIRECTORY}/${CMAKE_HOST_TARGET_PREFIX}${BUILD_TARGET}.dir/${_build_source}${CMAKE_HOST${lang}_OUTPUT_EXTENSION}")
+  set(_absolute_output "${_object_directory}/${_build_source}${CMAKE_HOST${lang}_OUTPUT_EXTENSION}")
   file(RELATIVE_PATH _relative_output ${CMAKE_CURRENT_BINARY_DIR} "${_absolute_output}")
-  file(RELATIVE_PATH _relative_gcda_output ${CMAKE_CURRENT_BINARY_DIR} "${CMAKE_CURRENT_BINARY_DIR}${CMAKE_FILES_DIRECTORY}/${CMAKE_HOST_TARGET_PREFIX}${BUILD_TARGET}.dir/${_build_source}.gcda")
+  file(RELATIVE_PATH _relative_gcda_output ${CMAKE_CURRENT_BINARY_DIR} "${_object_directory}/${_build_source}.gcda")
+
+  # The compiler writes split debug information next to the object
+  unset(_byproducts)
+  if(_split_dwarf)
+    string(REGEX REPLACE "\\.[^./]*$" ".dwo" _byproducts "${_relative_output}")
+  endif()
 
   # Make sure that the base directory of the object file exists
   get_filename_component(BUILD_DIRECTORY "${_absolute_output}" DIRECTORY)
   file(MAKE_DIRECTORY ${BUILD_DIRECTORY})
 
-  # Resolve absolute path
-  get_filename_component(BUILD_SOURCE ${BUILD_SOURCE} ABSOLUTE)
+  set(BUILD_SOURCE "${_absolute_source}")
 
   # Compile source file
   set(BUILD_COMMAND
+    ${BUILD_COMPILER_LAUNCHER}
     ${CMAKE_HOST${lang}_COMPILER}
     ${BUILD_INCLUDE_DIRECTORIES}
     ${BUILD_COMPILE_OPTIONS}
@@ -406,12 +1179,25 @@ function(do_host_compile lang OUTPUT)
     -c ${BUILD_SOURCE}
   )
 
+  # Look up the object in the host object cache before compiling
+  if(CMAKE_HOST_OBJECT_CACHE_DIR)
+    list(PREPEND BUILD_COMMAND
+      ${CMAKE_COMMAND}
+      -DHOST_OBJECT_CACHE_DIR=${CMAKE_HOST_OBJECT_CACHE_DIR}
+      -DHOST_OBJECT_CACHE_MAX_SIZE=${CMAKE_HOST_OBJECT_CACHE_MAX_SIZE}
+      -DHOST_OBJECT_CACHE_STATS=${CMAKE_HOST_OBJECT_CACHE_STATS}
+      "-DHOST_COMPILER_IDENTITY=${CMAKE_HOST${lang}_COMPILER_ID} ${CMAKE_HOST${lang}_COMPILER_VERSION} ${CMAKE_HOST${lang}_COMPILER}"
+      -P ${_HOSTA_BASE_DIR}/HostObjectCache.cmake
+      --
+    )
+  endif()
+
   # Track header/source dependencies across incremental builds.
   # DEPFILE: compiler emits a depfile (Ninja: 3.7+, Make: 3.20+).
   # IMPLICIT_DEPENDS: honored only by Makefile generators -- CMake scans the
   # source for #include itself.
-  if(CMAKE_GENERATOR MATCHES "Ninja" OR
-     (CMAKE_GENERATOR MATCHES "Make" AND NOT CMAKE_VERSION VERSION_LESS 3.20))
+  get_host_depfile_support(_depfile_supported)
+  if(_depfile_supported)
     # CMP0116 NEW: DEPFILE paths (and paths inside the depfile) are resolved
     # against CMAKE_CURRENT_BINARY_DIR. Makefile/VS/Xcode generators force
     # this regardless, but Ninja respects the policy -- so if the consuming
@@ -434,6 +1220,7 @@ function(do_host_compile lang OUTPUT)
       OUTPUT ${_relative_output}
       COMMAND ${CMAKE_COMMAND} -E rm -f -- ${_relative_gcda_output}
       COMMAND ${BUILD_COMMAND}
+      BYPRODUCTS ${_byproducts}
       DEPENDS ${BUILD_DEPENDS}
       DEPFILE ${_relative_depfile}
       WORKING_DIRECTORY ${CMAKE_CURRENT_BINARY_DIR}
@@ -446,6 +1233,7 @@ function(do_host_compile lang OUTPUT)
       OUTPUT ${_relative_output}
       COMMAND ${CMAKE_COMMAND} -E rm -f -- ${_relative_gcda_output}
       COMMAND ${BUILD_COMMAND}
+      BYPRODUCTS ${_byproducts}
       DEPENDS ${BUILD_DEPENDS}
       IMPLICIT_DEPENDS ${lang} ${BUILD_SOURCE}
       WORKING_DIRECTORY ${CMAKE_CURRENT_BINARY_DIR}
@@ -455,12 +1243,65 @@ function(do_host_compile lang OUTPUT)
     )
   endif()
 
+  if(_fingerprint)
+    set_property(DIRECTORY PROPERTY HOST_COMPILE_${_fingerprint}_OUTPUT "${_absolute_output}")
+    set_property(DIRECTORY PROPERTY HOST_COMPILE_${_fingerprint}_OWNER "${BUILD_OWNER}")
+    report_host_compile_deduplication(DEFER)
+  endif()
+
   set(${OUTPUT} ${_absolute_output} PARENT_SCOPE)
+
+  stop_host_profile(do_host_compile "${_profile_start}")
 endfunction(do_host_compile)
 
+# Set OUTPUT to the custom target that builds the given object or precompiled
+# header shared by several host targets, so that building one of them does not
+# build the others. The custom target is added when the file is first shared,
+# and the host target OWNER that added its command is made to depend on it.
+function(get_host_shared_target OUTPUT FILE OWNER)
+  string(MD5 _key "${FILE}")
+  get_property(_target DIRECTORY PROPERTY HOST_SHARED_${_key}_TARGET)
+  if(NOT _target)
+    string(SUBSTRING "${_key}" 0 16 _suffix)
+    set(_target "${CMAKE_HOST_TARGET_PREFIX}shared-${_suffix}")
+    add_custom_target(${_target} DEPENDS "${FILE}")
+    if(TARGET ${OWNER})
+      add_dependencies(${OWNER} ${_target})
+    endif()
+    set_property(DIRECTORY PROPERTY HOST_SHARED_${_key}_TARGET ${_target})
+  endif()
+  set(${OUTPUT} ${_target} PARENT_SCOPE)
+endfunction(get_host_shared_target)
+
+# Report how many compiles were eliminated by sharing the objects of identical
+# compiles. The report is printed automatically at the end of configure with
+# CMake 3.19 or higher.
+function(report_host_compile_deduplication)
+  if("${ARGV0}" STREQUAL "DEFER")
+    if(CMAKE_VERSION VERSION_LESS 3.19)
+      return()
+    endif()
+    get_property(_deferred GLOBAL PROPERTY HOST_COMPILE_REPORT_DEFERRED)
+    if(NOT _deferred)
+      set_property(GLOBAL PROPERTY HOST_COMPILE_REPORT_DEFERRED TRUE)
+      cmake_language(DEFER DIRECTORY ${CMAKE_SOURCE_DIR} CALL report_host_compile_deduplication)
+    endif()
+    return()
+  endif()
+
+  get_property(_compiles GLOBAL PROPERTY HOST_COMPILES)
+  get_property(_deduplicated GLOBAL PROPERTY HOST_DEDUPLICATED_COMPILES)
+  list(LENGTH _compiles _count)
+  list(LENGTH _deduplicated _deduplicated_count)
+  if(_deduplicated_count GREATER 0)
+    message(STATUS "Host compiles deduplicated: ${_deduplicated_count} of ${_count}")
+  endif()
+endfunction(report_host_compile_deduplication)
+
 function(do_host_link lang TARGET OUTPUT)
-  set(oneValueArgs TYPE VERSION SOVERSION)
-  set(multiValueArgs OBJECTS LINK_LIBRARIES LINK_OPTIONS DEPENDS)
+  start_host_profile(_profile_start)
+  set(oneValueArgs TYPE VERSION SOVERSION LINKER_TYPE)
+  set(multiValueArgs OBJECTS LINK_LIBRARIES LINK_OPTIONS LINKER_LAUNCHER DEPENDS)
   cmake_parse_arguments(BUILD "" "${oneValueArgs}" "${multiValueArgs}" ${ARGN})
 
   # Default type is EXECUTABLE
@@ -468,6 +1309,43 @@ function(do_host_link lang TARGET OUTPUT)
     set(BUILD_TYPE "EXECUTABLE")
   endif()
 
+  # Fall back to the global linker launcher
+  if(NOT BUILD_LINKER_LAUNCHER)
+    set(BUILD_LINKER_LAUNCHER ${CMAKE_HOST${lang}_LINKER_LAUNCHER})
+  endif()
+
+  # Select the linker through the compiler driver, e.g. -fuse-ld=lld for LLD
+  if(NOT BUILD_LINKER_TYPE)
+    set(BUILD_LINKER_TYPE "${CMAKE_HOST_LINKER_TYPE}")
+  endif()
+  string(TOUPPER "${BUILD_LINKER_TYPE}" BUILD_LINKER_TYPE)
+  if(BUILD_LINKER_TYPE AND NOT BUILD_LINKER_TYPE STREQUAL "SYSTEM")
+    # Trust the user if the compiler information was forced without them
+    get_host_compiler_info(${lang} LINKER_TYPES _linker_types)
+    if((DEFINED CMAKE_HOST${lang}_LINKER_TYPES OR NOT CMAKE_HOST${lang}_COMPILER_FORCED) AND
+       NOT BUILD_LINKER_TYPE IN_LIST _linker_types)
+      list(JOIN _linker_types ", " _linker_types)
+      host_logging_error(
+        "The HOST${lang} linker type ${BUILD_LINKER_TYPE} is not available for ${TARGET}."
+        "Available linker types: SYSTEM ${_linker_types}"
+      )
+    endif()
+    string(TOLOWER "${BUILD_LINKER_TYPE}" _linker_name)
+    list(PREPEND BUILD_LINK_OPTIONS "-fuse-ld=${_linker_name}")
+  endif()
+
+  # Match the debug information mode of the objects
+  string(TOUPPER "${CMAKE_HOST_DEBUG_INFO}" _debug_info)
+  if(_debug_info STREQUAL "COMPRESSED")
+    list(APPEND BUILD_LINK_OPTIONS -gz)
+  elseif(_debug_info STREQUAL "SPLIT" AND BUILD_LINKER_TYPE MATCHES "^(GOLD|LLD|MOLD)$")
+    # Index the split debug information for faster debugger startup
+    list(APPEND BUILD_LINK_OPTIONS -Wl,--gdb-index)
+  endif()
+
+  # Set the host build type for the linker flags
+  string(TOUPPER "${CMAKE_HOST_BUILD_TYPE}" _config)
+
   # Set object files
   separate_arguments(BUILD_OBJECTS NATIVE_COMMAND "${BUILD_OBJECTS}")
 
@@ -476,7 +1354,7 @@ function(do_host_link lang TARGET OUTPUT)
 
   if(BUILD_TYPE STREQUAL "SHARED")
     # Set global shared linker flags
-    list(PREPEND BUILD_LINK_OPTIONS "${CMAKE_HOST_SHARED_LINKER_FLAGS}")
+    list(PREPEND BUILD_LINK_OPTIONS "${CMAKE_HOST_SHARED_LINKER_FLAGS}" "${CMAKE_HOST_SHARED_LINKER_FLAGS_${_config}}")
 
     # Add shared library creation flags (e.g. -shared)
     list(PREPEND BUILD_LINK_OPTIONS "${CMAKE_HOST${lang}_SHARED_LIBRARY_CREATE_FLAGS}")
@@ -514,6 +1392,7 @@ function(do_host_link lang TARGET OUTPUT)
 
     # Link object files
     set(BUILD_COMMAND
+      ${BUILD_LINKER_LAUNCHER}
       ${CMAKE_HOST${lang}_COMPILER}
       -o ${_output}
       ${BUILD_OBJECTS}
@@ -561,7 +1440,7 @@ function(do_host_link lang TARGET OUTPUT)
   else()
     # EXECUTABLE (existing behavior)
     # Set global linker flags
-    list(PREPEND BUILD_LINK_OPTIONS "${CMAKE_HOST_EXE_LINKER_FLAGS}")
+    list(PREPEND BUILD_LINK_OPTIONS "${CMAKE_HOST_EXE_LINKER_FLAGS}" "${CMAKE_HOST_EXE_LINKER_FLAGS_${_config}}")
 
     if(NOT CMAKE_HOST_EXECUTABLE_SUFFIX)
       set(CMAKE_HOST_EXECUTABLE_SUFFIX "${CMAKE_HOST${lang}_EXECUTABLE_SUFFIX}")
@@ -572,6 +1451,7 @@ function(do_host_link lang TARGET OUTPUT)
 
     # Link object files
     set(BUILD_COMMAND
+      ${BUILD_LINKER_LAUNCHER}
       ${CMAKE_HOST${lang}_COMPILER}
       -o ${_output}
       ${BUILD_OBJECTS}
@@ -591,12 +1471,16 @@ function(do_host_link lang TARGET OUTPUT)
   endif()
 
   set(${OUTPUT} ${_output} PARENT_SCOPE)
+
+  stop_host_profile(do_host_link "${_profile_start}")
 endfunction(do_host_link)
 
 function(add_host_executable TARGET)
+  start_host_profile(_profile_start)
   set(options EXCLUDE_FROM_ALL)
-  set(multiValueArgs SOURCES INCLUDE_DIRECTORIES COMPILE_OPTIONS LINK_OPTIONS LINK_LIBRARIES DEPENDS)
-  cmake_parse_arguments(BUILD "${options}" "" "${multiValueArgs}" ${ARGN})
+  set(oneValueArgs UNITY_BUILD UNITY_BUILD_BATCH_SIZE LINKER_TYPE INTERPROCEDURAL_OPTIMIZATION GC_SECTIONS)
+  set(multiValueArgs SOURCES INCLUDE_DIRECTORIES COMPILE_OPTIONS PRECOMPILE_HEADERS LINK_OPTIONS LINK_LIBRARIES COMPILER_LAUNCHER LINKER_LAUNCHER DEPENDS)
+  cmake_parse_arguments(BUILD "${options}" "${oneValueArgs}" "${multiValueArgs}" ${ARGN})
 
   # Remove host namespace prefix if exists
   remove_host_namespace_prefix(TARGET "${TARGET}")
@@ -614,6 +1498,11 @@ function(add_host_executable TARGET)
   # Set compile options
   separate_host_scoped_arguments("${BUILD_COMPILE_OPTIONS}" BUILD_COMPILE_OPTIONS BUILD_INTERFACE_COMPILE_OPTIONS)
 
+  # Set precompiled headers
+  separate_host_scoped_arguments("${BUILD_PRECOMPILE_HEADERS}" BUILD_PRECOMPILE_HEADERS BUILD_INTERFACE_PRECOMPILE_HEADERS)
+  get_host_precompile_headers(BUILD_PRECOMPILE_HEADERS "${BUILD_PRECOMPILE_HEADERS}")
+  get_host_precompile_headers(BUILD_INTERFACE_PRECOMPILE_HEADERS "${BUILD_INTERFACE_PRECOMPILE_HEADERS}")
+
   # Set link options
   separate_host_scoped_arguments("${BUILD_LINK_OPTIONS}" BUILD_LINK_OPTIONS BUILD_INTERFACE_LINK_OPTIONS)
 
@@ -629,21 +1518,13 @@ function(add_host_executable TARGET)
     host_logging_error("add_host_executable LINK_LIBRARIES requires the name of host libraries starting with the host namespace prefix.\nUnsupported libraries: ${remaining}")
   endif()
 
-  # Get interface properties of linking libraries
-  unset(_extra_include_directories)
-  unset(_extra_compile_options)
-  unset(_extra_link_options)
-  unset(_extra_dependencies)
-
-  foreach(_lib IN LISTS BUILD_LINK_LIBRARIES)
-    list(APPEND _extra_include_directories "$<$<BOOL:$<TARGET_PROPERTY:${_lib},HOST_INTERFACE_INCLUDE_DIRECTORIES>>:${include_flag}>$<JOIN:$<TARGET_PROPERTY:${_lib},HOST_INTERFACE_INCLUDE_DIRECTORIES>,$<SEMICOLON>${include_flag}>")
-    list(APPEND _extra_compile_options "$<TARGET_PROPERTY:${_lib},HOST_INTERFACE_COMPILE_OPTIONS>")
-    list(APPEND _extra_link_options "$<TARGET_PROPERTY:${_lib},HOST_INTERFACE_LINK_OPTIONS>")
-    list(APPEND _extra_dependencies "${CMAKE_HOST_TARGET_PREFIX}$<TARGET_PROPERTY:${_lib},HOST_NAME>")
-    # Add static library paths as link option
-    # Note: $<TARGET_PROPERTY:tgt,prop>: Non-existing libraries cause build failures
-    list(APPEND _extra_link_options "$<$<BOOL:$<STREQUAL:$<TARGET_PROPERTY:${_lib},HOST_TYPE>,HOST_STATIC>>:$<TARGET_PROPERTY:${_lib},HOST_OUTPUT_NAME>>")
-  endforeach()
+  # Get transitive properties of linking libraries
+  get_host_transitive_properties(_transitive "${BUILD_LINK_LIBRARIES}")
+  prepend_host_transitive_flag(_extra_include_directories "${_transitive_INCLUDE_DIRECTORIES}" "${include_flag}")
+  set(_extra_compile_options "${_transitive_COMPILE_OPTIONS}")
+  set(_precompile_headers ${BUILD_PRECOMPILE_HEADERS} ${_transitive_PRECOMPILE_HEADERS})
+  set(_extra_link_options "${_transitive_LINK_OPTIONS}")
+  set(_extra_dependencies "${_transitive_DEPENDENCIES}")
 
   if(NOT BUILD_SOURCES)
     host_logging_error("No SOURCES given to target: ${TARGET}")
@@ -654,10 +1535,26 @@ function(add_host_executable TARGET)
     host_logging_error("CMake Error: Cannot determine host language for target: ${TARGET}")
   endif()
 
+  # Set optimization options
+  get_host_optimization_options(${lang} _optimization
+    TARGET "${TARGET}"
+    INTERPROCEDURAL_OPTIMIZATION "${BUILD_INTERPROCEDURAL_OPTIMIZATION}"
+    GC_SECTIONS "${BUILD_GC_SECTIONS}"
+  )
+  list(APPEND BUILD_COMPILE_OPTIONS ${_optimization_COMPILE_OPTIONS})
+  list(APPEND _extra_link_options ${_optimization_LINK_OPTIONS})
+
+  # Amalgamate source files for unity builds
+  do_host_unity_sources(_sources "${TARGET}" "${BUILD_SOURCES}"
+    UNITY_BUILD "${BUILD_UNITY_BUILD}"
+    BATCH_SIZE "${BUILD_UNITY_BUILD_BATCH_SIZE}"
+  )
+
   # Compile source files
   unset(_objects)
+  unset(_object_dependencies)
 
-  foreach(_source IN LISTS BUILD_SOURCES)
+  foreach(_source IN LISTS _sources)
     # Check if the source file exists
     if(IS_ABSOLUTE "${_source}")
       set(_path "${_source}")
@@ -668,28 +1565,37 @@ function(add_host_executable TARGET)
       host_logging_error("Cannot find source file:\n  ${_source}")
     endif()
 
-    # Resolve file dependencies
-    get_host_file_dependencies(${lang} _file_dependencies
-      SOURCE "${_source}"
-      INCLUDE_DIRECTORIES "${BUILD_INCLUDE_DIRECTORIES}"
-      COMPILE_OPTIONS "${BUILD_COMPILE_OPTIONS}"
-    )
-
     do_host_compile(${lang} _output
       SOURCE "${_source}"
       TARGET "${TARGET}"
       INCLUDE_DIRECTORIES "${_global_include_directories}" "${BUILD_INCLUDE_DIRECTORIES}" "${_extra_include_directories}"
       COMPILE_OPTIONS "${BUILD_COMPILE_OPTIONS}" "${_extra_compile_options}"
-      DEPENDS "${BUILD_DEPENDS}" "${_file_dependencies}" "${_extra_dependencies}"
+      PRECOMPILE_HEADERS "${_precompile_headers}"
+      COMPILER_LAUNCHER "${BUILD_COMPILER_LAUNCHER}"
+      DEPENDS "${BUILD_DEPENDS}" "${_extra_dependencies}"
+      OWNER "${CMAKE_HOST_TARGET_PREFIX}${TARGET}"
+      OWNER_OUTPUT _owner
     )
     list(APPEND _objects ${_output})
+    list(APPEND _object_dependencies ${_owner})
+
+    # Queue file dependencies of the object file
+    queue_host_file_dependencies(${lang} _index
+      SOURCE "${_source}"
+      OBJECT "${_output}"
+      INCLUDE_DIRECTORIES "${BUILD_INCLUDE_DIRECTORIES}"
+      COMPILE_OPTIONS "${BUILD_COMPILE_OPTIONS}"
+      COMPILER_LAUNCHER "${BUILD_COMPILER_LAUNCHER}"
+    )
   endforeach()
 
+  # Resolve file dependencies
+  scan_host_file_dependencies(DEFER)
+
   # Add RPATH for shared library dependencies
   if(NOT CMAKE_HOST_SKIP_BUILD_RPATH)
-    foreach(_lib IN LISTS BUILD_LINK_LIBRARIES)
-      list(APPEND _extra_link_options "$<$<STREQUAL:$<TARGET_PROPERTY:${_lib},HOST_TYPE>,HOST_SHARED>:${CMAKE_HOST${lang}_SHARED_LIBRARY_RUNTIME_FLAG}$<TARGET_PROPERTY:${_lib},HOST_BINARY_DIR>>")
-    endforeach()
+    prepend_host_transitive_flag(_runtime_directories "${_transitive_RUNTIME_DIRECTORIES}" "${CMAKE_HOST${lang}_SHARED_LIBRARY_RUNTIME_FLAG}")
+    list(APPEND _extra_link_options ${_runtime_directories})
   endif()
 
   # Add user-specified RPATH
@@ -701,11 +1607,19 @@ function(add_host_executable TARGET)
   do_host_link(${lang} ${TARGET} _output
     OBJECTS "${_objects}"
     LINK_OPTIONS "${BUILD_LINK_OPTIONS}" "${_extra_link_options}"
-    DEPENDS "${BUILD_DEPENDS}" "${_extra_dependencies}"
+    LINKER_LAUNCHER "${BUILD_LINKER_LAUNCHER}"
+    LINKER_TYPE "${BUILD_LINKER_TYPE}"
+    DEPENDS "${BUILD_DEPENDS}" "${_extra_dependencies}" "${_transitive_LINK_DEPENDS}"
   )
 
   add_host_custom_target("${CMAKE_HOST_NAMESPACE_PREFIX}${TARGET}" DEPENDS "${_output}")
 
+  # Objects and precompiled headers shared with other targets are built first
+  if(_object_dependencies)
+    list(REMOVE_DUPLICATES _object_dependencies)
+    add_host_dependencies("${CMAKE_HOST_NAMESPACE_PREFIX}${TARGET}" "${_object_dependencies}")
+  endif()
+
   if(NOT BUILD_EXCLUDE_FROM_ALL)
     add_host_dependencies("${CMAKE_HOST_BUILD_TARGET}" "${CMAKE_HOST_NAMESPACE_PREFIX}${TARGET}")
   endif()
@@ -716,12 +1630,15 @@ function(add_host_executable TARGET)
     TYPE "HOST_EXECUTABLE"
     SOURCES "${BUILD_SOURCES}"
   )
+
+  stop_host_profile(add_host_executable "${_profile_start}" TARGET ${TARGET})
 endfunction(add_host_executable)
 
 function(add_host_library TARGET TYPE)
+  start_host_profile(_profile_start)
   set(options EXCLUDE_FROM_ALL)
-  set(oneValueArgs VERSION SOVERSION)
-  set(multiValueArgs SOURCES INCLUDE_DIRECTORIES COMPILE_OPTIONS LINK_OPTIONS LINK_LIBRARIES DEPENDS)
+  set(oneValueArgs VERSION SOVERSION UNITY_BUILD UNITY_BUILD_BATCH_SIZE LINKER_TYPE INTERPROCEDURAL_OPTIMIZATION GC_SECTIONS)
+  set(multiValueArgs SOURCES INCLUDE_DIRECTORIES COMPILE_OPTIONS PRECOMPILE_HEADERS LINK_OPTIONS LINK_LIBRARIES COMPILER_LAUNCHER LINKER_LAUNCHER DEPENDS)
   cmake_parse_arguments(BUILD "${options}" "${oneValueArgs}" "${multiValueArgs}" ${ARGN})
 
   # Remove host namespace prefix if exists
@@ -741,18 +1658,18 @@ function(add_host_library TARGET TYPE)
   # Set compile options
   separate_host_scoped_arguments("${BUILD_COMPILE_OPTIONS}" BUILD_COMPILE_OPTIONS BUILD_INTERFACE_COMPILE_OPTIONS)
 
+  # Set precompiled headers
+  separate_host_scoped_arguments("${BUILD_PRECOMPILE_HEADERS}" BUILD_PRECOMPILE_HEADERS BUILD_INTERFACE_PRECOMPILE_HEADERS)
+  get_host_precompile_headers(BUILD_PRECOMPILE_HEADERS "${BUILD_PRECOMPILE_HEADERS}")
+  get_host_precompile_headers(BUILD_INTERFACE_PRECOMPILE_HEADERS "${BUILD_INTERFACE_PRECOMPILE_HEADERS}")
+
   # Set link options
   separate_host_scoped_arguments("${BUILD_LINK_OPTIONS}" BUILD_LINK_OPTIONS BUILD_INTERFACE_LINK_OPTIONS)
 
   # Set link libraries
   separate_host_scoped_arguments("${BUILD_LINK_LIBRARIES}" BUILD_LINK_LIBRARIES BUILD_INTERFACE_LINK_LIBRARIES)
   get_host_target_names(BUILD_LINK_LIBRARIES "${BUILD_LINK_LIBRARIES}")
-
-  # Get interface properties of linking libraries
-  unset(_extra_include_directories)
-  unset(_extra_compile_options)
-  unset(_extra_link_options)
-  unset(_extra_dependencies)
+  get_host_target_names(BUILD_INTERFACE_LINK_LIBRARIES "${BUILD_INTERFACE_LINK_LIBRARIES}")
 
   # Ensure only host libraries are given
   set(remaining ${BUILD_LINK_LIBRARIES})
@@ -762,14 +1679,29 @@ function(add_host_library TARGET TYPE)
     host_logging_error("add_host_library LINK_LIBRARIES requires the name of host libraries starting with the host namespace prefix.\nUnsupported libraries: ${remaining}")
   endif()
 
-  foreach(_lib IN LISTS BUILD_LINK_LIBRARIES)
-    list(APPEND _extra_include_directories "$<$<BOOL:$<TARGET_PROPERTY:${_lib},HOST_INTERFACE_INCLUDE_DIRECTORIES>>:${include_flag}>$<JOIN:$<TARGET_PROPERTY:${_lib},HOST_INTERFACE_INCLUDE_DIRECTORIES>,$<SEMICOLON>${include_flag}>")
-    list(APPEND _extra_compile_options "$<TARGET_PROPERTY:${_lib},HOST_INTERFACE_COMPILE_OPTIONS>")
-    list(APPEND _extra_link_options "$<TARGET_PROPERTY:${_lib},HOST_INTERFACE_LINK_OPTIONS>")
-    list(APPEND _extra_dependencies "${CMAKE_HOST_TARGET_PREFIX}$<TARGET_PROPERTY:${_lib},HOST_NAME>")
-    # Add static library paths as link option
-    list(APPEND _extra_link_options "$<$<STREQUAL:$<TARGET_PROPERTY:${_lib},HOST_TYPE>,HOST_STATIC>:$<TARGET_PROPERTY:${_lib},HOST_OUTPUT_NAME>>")
-  endforeach()
+  # Get transitive properties of linking libraries
+  get_host_transitive_properties(_transitive "${BUILD_LINK_LIBRARIES}")
+  get_host_transitive_properties(_public "${BUILD_INTERFACE_LINK_LIBRARIES}")
+  prepend_host_transitive_flag(_extra_include_directories "${_transitive_INCLUDE_DIRECTORIES}" "${include_flag}")
+  set(_extra_compile_options "${_transitive_COMPILE_OPTIONS}")
+  set(_precompile_headers ${BUILD_PRECOMPILE_HEADERS} ${_transitive_PRECOMPILE_HEADERS})
+  set(_extra_link_options "${_transitive_LINK_OPTIONS}")
+  set(_extra_dependencies "${_transitive_DEPENDENCIES}")
+
+  # Usage requirements of PUBLIC libraries are propagated to consumers. The
+  # library's own requirements are read from its INTERFACE properties at
+  # generate time, so that later changes by set_host_target_properties() reach
+  # consumers, except for precompiled headers, which are needed right away.
+  set(_interface_include_directories "$<TARGET_PROPERTY:${CMAKE_HOST_TARGET_PREFIX}${TARGET},HOST_INTERFACE_INCLUDE_DIRECTORIES>")
+  set(_interface_compile_options "$<TARGET_PROPERTY:${CMAKE_HOST_TARGET_PREFIX}${TARGET},HOST_INTERFACE_COMPILE_OPTIONS>")
+  set(_interface_link_options "$<TARGET_PROPERTY:${CMAKE_HOST_TARGET_PREFIX}${TARGET},HOST_INTERFACE_LINK_OPTIONS>")
+  set(_closure_include_directories "${_interface_include_directories}" ${_public_INCLUDE_DIRECTORIES})
+  set(_closure_compile_options "${_interface_compile_options}" ${_public_COMPILE_OPTIONS})
+  set(_closure_precompile_headers ${BUILD_INTERFACE_PRECOMPILE_HEADERS} ${_public_PRECOMPILE_HEADERS})
+  set(_closure_link_options "${_interface_link_options}")
+  set(_closure_runtime_directories)
+  set(_closure_link_depends)
+  set(_closure_dependencies "${CMAKE_HOST_TARGET_PREFIX}${TARGET}" ${_transitive_DEPENDENCIES})
 
   set(BUILD_TYPE "HOST_${TYPE}")
 
@@ -783,6 +1715,14 @@ function(add_host_library TARGET TYPE)
       host_logging_error("CMake Error: Cannot determine host language for target: ${TARGET}")
     endif()
 
+    # Set optimization options
+    get_host_optimization_options(${lang} _optimization
+      TARGET "${TARGET}"
+      INTERPROCEDURAL_OPTIMIZATION "${BUILD_INTERPROCEDURAL_OPTIMIZATION}"
+      GC_SECTIONS "${BUILD_GC_SECTIONS}"
+    )
+    list(APPEND BUILD_COMPILE_OPTIONS ${_optimization_COMPILE_OPTIONS})
+
     if(NOT CMAKE_HOST_STATIC_LIBRARY_PREFIX)
       set(CMAKE_HOST_STATIC_LIBRARY_PREFIX "${CMAKE_HOST${lang}_STATIC_LIBRARY_PREFIX}")
     endif()
@@ -790,10 +1730,17 @@ function(add_host_library TARGET TYPE)
       set(CMAKE_HOST_STATIC_LIBRARY_SUFFIX "${CMAKE_HOST${lang}_STATIC_LIBRARY_SUFFIX}")
     endif()
 
+    # Amalgamate source files for unity builds
+    do_host_unity_sources(_sources "${CMAKE_HOST_STATIC_LIBRARY_PREFIX}${TARGET}${CMAKE_HOST_STATIC_LIBRARY_SUFFIX}" "${BUILD_SOURCES}"
+      UNITY_BUILD "${BUILD_UNITY_BUILD}"
+      BATCH_SIZE "${BUILD_UNITY_BUILD_BATCH_SIZE}"
+    )
+
     # Compile source files
     unset(_objects)
+    unset(_object_dependencies)
 
-    foreach(_source IN LISTS BUILD_SOURCES)
+    foreach(_source IN LISTS _sources)
       # Check if the source file exists
       if(IS_ABSOLUTE "${_source}")
         set(_path "${_source}")
@@ -804,23 +1751,33 @@ function(add_host_library TARGET TYPE)
         host_logging_error("Cannot find source file:\n  ${_source}")
       endif()
 
-      # Resolve file dependencies
-      get_host_file_dependencies(${lang} _file_dependencies
-        SOURCE "${_source}"
-        INCLUDE_DIRECTORIES "${BUILD_INCLUDE_DIRECTORIES}"
-        COMPILE_OPTIONS "${BUILD_COMPILE_OPTIONS}"
-      )
-
       do_host_compile(${lang} _output
         SOURCE "${_source}"
         TARGET "${CMAKE_HOST_STATIC_LIBRARY_PREFIX}${TARGET}${CMAKE_HOST_STATIC_LIBRARY_SUFFIX}"
         INCLUDE_DIRECTORIES "${_global_include_directories}" "${BUILD_INCLUDE_DIRECTORIES}" "${_extra_include_directories}"
         COMPILE_OPTIONS "${BUILD_COMPILE_OPTIONS}" "${_extra_compile_options}"
-        DEPENDS "${BUILD_DEPENDS}" "${_file_dependencies}" "${_extra_dependencies}"
+        PRECOMPILE_HEADERS "${_precompile_headers}"
+        COMPILER_LAUNCHER "${BUILD_COMPILER_LAUNCHER}"
+        DEPENDS "${BUILD_DEPENDS}" "${_extra_dependencies}"
+        OWNER "${CMAKE_HOST_TARGET_PREFIX}${TARGET}"
+        OWNER_OUTPUT _owner
       )
       list(APPEND _objects ${_output})
+      list(APPEND _object_dependencies ${_owner})
+
+      # Queue file dependencies of the object file
+      queue_host_file_dependencies(${lang} _index
+        SOURCE "${_source}"
+        OBJECT "${_output}"
+        INCLUDE_DIRECTORIES "${BUILD_INCLUDE_DIRECTORIES}"
+        COMPILE_OPTIONS "${BUILD_COMPILE_OPTIONS}"
+        COMPILER_LAUNCHER "${BUILD_COMPILER_LAUNCHER}"
+      )
     endforeach()
 
+    # Resolve file dependencies
+    scan_host_file_dependencies(DEFER)
+
     set(_filename "${CMAKE_HOST_STATIC_LIBRARY_PREFIX}${TARGET}${CMAKE_HOST_STATIC_LIBRARY_SUFFIX}")
     set(_output "${CMAKE_CURRENT_BINARY_DIR}/${_filename}")
     set(_response_file "${CMAKE_CURRENT_BINARY_DIR}${CMAKE_FILES_DIRECTORY}/${CMAKE_HOST_TARGET_PREFIX}${_filename}.dir/${_filename}.rsp")
@@ -830,6 +1787,13 @@ function(add_host_library TARGET TYPE)
       CONTENT "$<JOIN:${_objects},\n>"
     )
 
+    # Keep the symbol tables of LTO objects with the compiler wrappers
+    if(_optimization_INTERPROCEDURAL_OPTIMIZATION AND NOT CMAKE_HOST_AR AND CMAKE_HOST${lang}_COMPILER_AR)
+      set(CMAKE_HOST_AR "${CMAKE_HOST${lang}_COMPILER_AR}")
+    endif()
+    if(_optimization_INTERPROCEDURAL_OPTIMIZATION AND NOT CMAKE_HOST_RANLIB AND CMAKE_HOST${lang}_COMPILER_RANLIB)
+      set(CMAKE_HOST_RANLIB "${CMAKE_HOST${lang}_COMPILER_RANLIB}")
+    endif()
     if(NOT CMAKE_HOST_AR)
       set(CMAKE_HOST_AR "${CMAKE_HOST${lang}_AR}")
     endif()
@@ -849,6 +1813,18 @@ function(add_host_library TARGET TYPE)
       VERBATIM
     )
     add_host_custom_target("${CMAKE_HOST_NAMESPACE_PREFIX}${TARGET}" DEPENDS "${_output}")
+
+    # Objects and precompiled headers shared with other targets are built first
+    if(_object_dependencies)
+      list(REMOVE_DUPLICATES _object_dependencies)
+      add_host_dependencies("${CMAKE_HOST_NAMESPACE_PREFIX}${TARGET}" "${_object_dependencies}")
+    endif()
+
+    # Consumers link the archive followed by all of its dependencies, with
+    # link-time optimization if the archive holds LTO objects
+    list(APPEND _closure_link_options "${_output}" ${_transitive_LINK_OPTIONS} ${_optimization_INTERPROCEDURAL_LINK_OPTIONS})
+    list(APPEND _closure_runtime_directories ${_transitive_RUNTIME_DIRECTORIES})
+    list(APPEND _closure_link_depends "${_output}" ${_transitive_LINK_DEPENDS})
   elseif(BUILD_TYPE STREQUAL "HOST_SHARED")
     if(NOT BUILD_SOURCES)
       host_logging_error("No SOURCES given to target: ${TARGET}")
@@ -859,6 +1835,15 @@ function(add_host_library TARGET TYPE)
       host_logging_error("CMake Error: Cannot determine host language for target: ${TARGET}")
     endif()
 
+    # Set optimization options
+    get_host_optimization_options(${lang} _optimization
+      TARGET "${TARGET}"
+      INTERPROCEDURAL_OPTIMIZATION "${BUILD_INTERPROCEDURAL_OPTIMIZATION}"
+      GC_SECTIONS "${BUILD_GC_SECTIONS}"
+    )
+    list(APPEND BUILD_COMPILE_OPTIONS ${_optimization_COMPILE_OPTIONS})
+    list(APPEND _extra_link_options ${_optimization_LINK_OPTIONS})
+
     # Add PIC compile option for shared libraries
     if(NOT DEFINED CMAKE_HOST_POSITION_INDEPENDENT_CODE OR CMAKE_HOST_POSITION_INDEPENDENT_CODE)
       list(PREPEND BUILD_COMPILE_OPTIONS "${CMAKE_HOST${lang}_COMPILE_OPTIONS_PIC}")
@@ -871,10 +1856,17 @@ function(add_host_library TARGET TYPE)
       set(CMAKE_HOST_SHARED_LIBRARY_SUFFIX "${CMAKE_HOST${lang}_SHARED_LIBRARY_SUFFIX}")
     endif()
 
+    # Amalgamate source files for unity builds
+    do_host_unity_sources(_sources "${CMAKE_HOST_SHARED_LIBRARY_PREFIX}${TARGET}${CMAKE_HOST_SHARED_LIBRARY_SUFFIX}" "${BUILD_SOURCES}"
+      UNITY_BUILD "${BUILD_UNITY_BUILD}"
+      BATCH_SIZE "${BUILD_UNITY_BUILD_BATCH_SIZE}"
+    )
+
     # Compile source files
     unset(_objects)
+    unset(_object_dependencies)
 
-    foreach(_source IN LISTS BUILD_SOURCES)
+    foreach(_source IN LISTS _sources)
       # Check if the source file exists
       if(IS_ABSOLUTE "${_source}")
         set(_path "${_source}")
@@ -885,23 +1877,33 @@ function(add_host_library TARGET TYPE)
         host_logging_error("Cannot find source file:\n  ${_source}")
       endif()
 
-      # Resolve file dependencies
-      get_host_file_dependencies(${lang} _file_dependencies
-        SOURCE "${_source}"
-        INCLUDE_DIRECTORIES "${BUILD_INCLUDE_DIRECTORIES}"
-        COMPILE_OPTIONS "${BUILD_COMPILE_OPTIONS}"
-      )
-
       do_host_compile(${lang} _output
         SOURCE "${_source}"
         TARGET "${CMAKE_HOST_SHARED_LIBRARY_PREFIX}${TARGET}${CMAKE_HOST_SHARED_LIBRARY_SUFFIX}"
         INCLUDE_DIRECTORIES "${_global_include_directories}" "${BUILD_INCLUDE_DIRECTORIES}" "${_extra_include_directories}"
         COMPILE_OPTIONS "${BUILD_COMPILE_OPTIONS}" "${_extra_compile_options}"
-        DEPENDS "${BUILD_DEPENDS}" "${_file_dependencies}" "${_extra_dependencies}"
+        PRECOMPILE_HEADERS "${_precompile_headers}"
+        COMPILER_LAUNCHER "${BUILD_COMPILER_LAUNCHER}"
+        DEPENDS "${BUILD_DEPENDS}" "${_extra_dependencies}"
+        OWNER "${CMAKE_HOST_TARGET_PREFIX}${TARGET}"
+        OWNER_OUTPUT _owner
       )
       list(APPEND _objects ${_output})
+      list(APPEND _object_dependencies ${_owner})
+
+      # Queue file dependencies of the object file
+      queue_host_file_dependencies(${lang} _index
+        SOURCE "${_source}"
+        OBJECT "${_output}"
+        INCLUDE_DIRECTORIES "${BUILD_INCLUDE_DIRECTORIES}"
+        COMPILE_OPTIONS "${BUILD_COMPILE_OPTIONS}"
+        COMPILER_LAUNCHER "${BUILD_COMPILER_LAUNCHER}"
+      )
     endforeach()
 
+    # Resolve file dependencies
+    scan_host_file_dependencies(DEFER)
+
     # Link shared library
     do_host_link(${lang} ${TARGET} _output
       TYPE SHARED
@@ -909,22 +1911,124 @@ function(add_host_library TARGET TYPE)
       SOVERSION "${BUILD_SOVERSION}"
       OBJECTS "${_objects}"
       LINK_OPTIONS "${BUILD_LINK_OPTIONS}" "${_extra_link_options}"
-      DEPENDS "${BUILD_DEPENDS}" "${_extra_dependencies}"
+      LINKER_LAUNCHER "${BUILD_LINKER_LAUNCHER}"
+      LINKER_TYPE "${BUILD_LINKER_TYPE}"
+      DEPENDS "${BUILD_DEPENDS}" "${_extra_dependencies}" "${_transitive_LINK_DEPENDS}"
     )
     add_host_custom_target("${CMAKE_HOST_NAMESPACE_PREFIX}${TARGET}" DEPENDS "${_output}")
 
+    # Objects and precompiled headers shared with other targets are built first
+    if(_object_dependencies)
+      list(REMOVE_DUPLICATES _object_dependencies)
+      add_host_dependencies("${CMAKE_HOST_NAMESPACE_PREFIX}${TARGET}" "${_object_dependencies}")
+    endif()
+
     # Register shared library link flags in INTERFACE so consumers
     # automatically get the correct -L/-l regardless of their directory scope
     list(APPEND BUILD_INTERFACE_LINK_OPTIONS
       "-L${CMAKE_CURRENT_BINARY_DIR}"
       "-l${TARGET}"
     )
+
+    # PRIVATE libraries are already linked into the shared library
+    set(_closure_link_options "${_interface_link_options}" ${_public_LINK_OPTIONS})
+    list(APPEND _closure_runtime_directories "${CMAKE_CURRENT_BINARY_DIR}" ${_transitive_RUNTIME_DIRECTORIES})
+    list(APPEND _closure_link_depends "${_output}" ${_public_LINK_DEPENDS})
   elseif(BUILD_TYPE STREQUAL "HOST_INTERFACE")
     if(BUILD_SOURCES)
       host_logging_error("add_host_library INTERFACE requires no source arguments.")
     endif()
     # Create a phony target for an interface library
     add_host_custom_target("${CMAKE_HOST_NAMESPACE_PREFIX}${TARGET}")
+
+    list(APPEND _closure_link_options ${_public_LINK_OPTIONS})
+    list(APPEND _closure_runtime_directories ${_public_RUNTIME_DIRECTORIES})
+    list(APPEND _closure_link_depends ${_public_LINK_DEPENDS})
+  elseif(BUILD_TYPE STREQUAL "HOST_OBJECT")
+    if(NOT BUILD_SOURCES)
+      host_logging_error("No SOURCES given to target: ${TARGET}")
+    endif()
+
+    find_host_language(lang "${BUILD_SOURCES}")
+    if(NOT lang)
+      host_logging_error("CMake Error: Cannot determine host language for target: ${TARGET}")
+    endif()
+
+    # Set optimization options
+    get_host_optimization_options(${lang} _optimization
+      TARGET "${TARGET}"
+      INTERPROCEDURAL_OPTIMIZATION "${BUILD_INTERPROCEDURAL_OPTIMIZATION}"
+      GC_SECTIONS "${BUILD_GC_SECTIONS}"
+    )
+    list(APPEND BUILD_COMPILE_OPTIONS ${_optimization_COMPILE_OPTIONS})
+
+    # Objects are linked into shared libraries only with position-independent code
+    if(CMAKE_HOST_POSITION_INDEPENDENT_CODE)
+      list(PREPEND BUILD_COMPILE_OPTIONS "${CMAKE_HOST${lang}_COMPILE_OPTIONS_PIC}")
+    endif()
+
+    # Amalgamate source files for unity builds
+    do_host_unity_sources(_sources "${TARGET}" "${BUILD_SOURCES}"
+      UNITY_BUILD "${BUILD_UNITY_BUILD}"
+      BATCH_SIZE "${BUILD_UNITY_BUILD_BATCH_SIZE}"
+    )
+
+    # Compile source files
+    unset(_objects)
+    unset(_object_dependencies)
+
+    foreach(_source IN LISTS _sources)
+      # Check if the source file exists
+      if(IS_ABSOLUTE "${_source}")
+        set(_path "${_source}")
+      else()
+        set(_path "${CMAKE_CURRENT_SOURCE_DIR}/${_source}")
+      endif()
+      if(NOT EXISTS "${_path}")
+        host_logging_error("Cannot find source file:\n  ${_source}")
+      endif()
+
+      do_host_compile(${lang} _output
+        SOURCE "${_source}"
+        TARGET "${TARGET}"
+        INCLUDE_DIRECTORIES "${_global_include_directories}" "${BUILD_INCLUDE_DIRECTORIES}" "${_extra_include_directories}"
+        COMPILE_OPTIONS "${BUILD_COMPILE_OPTIONS}" "${_extra_compile_options}"
+        PRECOMPILE_HEADERS "${_precompile_headers}"
+        COMPILER_LAUNCHER "${BUILD_COMPILER_LAUNCHER}"
+        DEPENDS "${BUILD_DEPENDS}" "${_extra_dependencies}"
+        OWNER "${CMAKE_HOST_TARGET_PREFIX}${TARGET}"
+        OWNER_OUTPUT _owner
+      )
+      list(APPEND _objects ${_output})
+      list(APPEND _object_dependencies ${_owner})
+
+      # Queue file dependencies of the object file
+      queue_host_file_dependencies(${lang} _index
+        SOURCE "${_source}"
+        OBJECT "${_output}"
+        INCLUDE_DIRECTORIES "${BUILD_INCLUDE_DIRECTORIES}"
+        COMPILE_OPTIONS "${BUILD_COMPILE_OPTIONS}"
+        COMPILER_LAUNCHER "${BUILD_COMPILER_LAUNCHER}"
+      )
+    endforeach()
+
+    # Resolve file dependencies
+    scan_host_file_dependencies(DEFER)
+
+    # Consumers link the object files directly, without an archive, with
+    # link-time optimization if they are LTO objects
+    set(_output "${_objects}")
+    add_host_custom_target("${CMAKE_HOST_NAMESPACE_PREFIX}${TARGET}" DEPENDS "${_objects}")
+
+    # Objects and precompiled headers shared with other targets are built first
+    if(_object_dependencies)
+      list(REMOVE_DUPLICATES _object_dependencies)
+      add_host_dependencies("${CMAKE_HOST_NAMESPACE_PREFIX}${TARGET}" "${_object_dependencies}")
+    endif()
+
+    list(APPEND _closure_link_options ${_objects} ${_transitive_LINK_OPTIONS} ${_optimization_INTERPROCEDURAL_LINK_OPTIONS})
+    list(APPEND _closure_runtime_directories ${_transitive_RUNTIME_DIRECTORIES})
+    list(APPEND _closure_link_depends ${_objects} ${_transitive_LINK_DEPENDS})
   else()
     host_logging_error("Unsupported library type: ${TYPE}")
   endif()
@@ -941,8 +2045,35 @@ function(add_host_library TARGET TYPE)
     SOURCES "${BUILD_SOURCES}"
     INTERFACE_INCLUDE_DIRECTORIES "${BUILD_INTERFACE_INCLUDE_DIRECTORIES}"
     INTERFACE_COMPILE_OPTIONS "${BUILD_INTERFACE_COMPILE_OPTIONS}"
+    INTERFACE_PRECOMPILE_HEADERS "${BUILD_INTERFACE_PRECOMPILE_HEADERS}"
     INTERFACE_LINK_OPTIONS "${BUILD_INTERFACE_LINK_OPTIONS}"
     VERSION "${BUILD_VERSION}"
     SOVERSION "${BUILD_SOVERSION}"
   )
+
+  # Store the flattened closure of usage requirements for consumers. Options
+  # are only kept as a whole per library, so that options taking a value, such
+  # as -include <file>, are never deduplicated token by token.
+  foreach(_list IN ITEMS include_directories compile_options precompile_headers runtime_directories link_depends dependencies)
+    if(_closure_${_list})
+      list(REMOVE_DUPLICATES _closure_${_list})
+    endif()
+  endforeach()
+  if(_closure_link_options)
+    list(REVERSE _closure_link_options)
+    list(REMOVE_DUPLICATES _closure_link_options)
+    list(REVERSE _closure_link_options)
+  endif()
+
+  set_target_properties(${CMAKE_HOST_TARGET_PREFIX}${TARGET} PROPERTIES
+    HOST_TRANSITIVE_INCLUDE_DIRECTORIES "${_closure_include_directories}"
+    HOST_TRANSITIVE_COMPILE_OPTIONS "${_closure_compile_options}"
+    HOST_TRANSITIVE_PRECOMPILE_HEADERS "${_closure_precompile_headers}"
+    HOST_TRANSITIVE_LINK_OPTIONS "${_closure_link_options}"
+    HOST_TRANSITIVE_RUNTIME_DIRECTORIES "${_closure_runtime_directories}"
+    HOST_TRANSITIVE_LINK_DEPENDS "${_closure_link_depends}"
+    HOST_TRANSITIVE_DEPENDENCIES "${_closure_dependencies}"
+  )
+
+  stop_host_profile(add_host_library "${_profile_start}" TARGET ${TARGET})
 endfunction(add_host_library)
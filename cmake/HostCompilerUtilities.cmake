@@ -42,12 +42,22 @@ function(save_host_compiler_preferences lang)
     "set(CMAKE_HOST${lang}_STATIC_LIBRARY_SUFFIX \"@CMAKE_HOST${lang}_STATIC_LIBRARY_SUFFIX@\")\n"
     "set(CMAKE_HOST${lang}_AR \"@CMAKE_HOST${lang}_AR@\")\n"
     "set(CMAKE_HOST${lang}_RANLIB \"@CMAKE_HOST${lang}_RANLIB@\")\n"
+    "set(CMAKE_HOST${lang}_COMPILER_AR \"@CMAKE_HOST${lang}_COMPILER_AR@\")\n"
+    "set(CMAKE_HOST${lang}_COMPILER_RANLIB \"@CMAKE_HOST${lang}_COMPILER_RANLIB@\")\n"
     "set(CMAKE_HOST${lang}_SHARED_LIBRARY_PREFIX \"@CMAKE_HOST${lang}_SHARED_LIBRARY_PREFIX@\")\n"
     "set(CMAKE_HOST${lang}_SHARED_LIBRARY_SUFFIX \"@CMAKE_HOST${lang}_SHARED_LIBRARY_SUFFIX@\")\n"
     "set(CMAKE_HOST${lang}_COMPILE_OPTIONS_PIC \"@CMAKE_HOST${lang}_COMPILE_OPTIONS_PIC@\")\n"
     "set(CMAKE_HOST${lang}_SHARED_LIBRARY_SONAME_FLAG \"@CMAKE_HOST${lang}_SHARED_LIBRARY_SONAME_FLAG@\")\n"
     "set(CMAKE_HOST${lang}_SHARED_LIBRARY_RUNTIME_FLAG \"@CMAKE_HOST${lang}_SHARED_LIBRARY_RUNTIME_FLAG@\")\n"
     "set(CMAKE_HOST${lang}_SHARED_LIBRARY_CREATE_FLAGS \"@CMAKE_HOST${lang}_SHARED_LIBRARY_CREATE_FLAGS@\")\n"
+    "set(CMAKE_HOST${lang}_LINKER_TYPES \"@CMAKE_HOST${lang}_LINKER_TYPES@\")\n"
+    "set(CMAKE_HOST${lang}_COMPILE_OPTIONS_IPO \"@CMAKE_HOST${lang}_COMPILE_OPTIONS_IPO@\")\n"
+    "set(CMAKE_HOST${lang}_LINK_OPTIONS_IPO \"@CMAKE_HOST${lang}_LINK_OPTIONS_IPO@\")\n"
+    "set(CMAKE_HOST${lang}_IPO_SUPPORTED @CMAKE_HOST${lang}_IPO_SUPPORTED@)\n"
+    "set(CMAKE_HOST${lang}_FLAGS_DEBUG_INIT \"@CMAKE_HOST${lang}_FLAGS_DEBUG_INIT@\")\n"
+    "set(CMAKE_HOST${lang}_FLAGS_RELEASE_INIT \"@CMAKE_HOST${lang}_FLAGS_RELEASE_INIT@\")\n"
+    "set(CMAKE_HOST${lang}_FLAGS_RELWITHDEBINFO_INIT \"@CMAKE_HOST${lang}_FLAGS_RELWITHDEBINFO_INIT@\")\n"
+    "set(CMAKE_HOST${lang}_FLAGS_MINSIZEREL_INIT \"@CMAKE_HOST${lang}_FLAGS_MINSIZEREL_INIT@\")\n"
   )
 
   # Guess the supported language standard versions based on C and CXX
@@ -73,6 +83,171 @@ function(save_host_compiler_preferences lang)
   )
 endfunction(save_host_compiler_preferences)
 
+# The machine-wide detection cache shares the host compiler preferences across
+# build trees if CMAKE_HOST_COMPILER_CACHE_DIR is set. The entries are keyed by
+# the compiler binary, its version output and the CMake and hosta versions.
+function(get_host_compiler_cache_file lang OUTPUT)
+  get_filename_component(_compiler "${CMAKE_HOST${lang}_COMPILER}" REALPATH)
+  file(SIZE "${_compiler}" _size)
+  file(TIMESTAMP "${_compiler}" _timestamp "%Y-%m-%dT%H:%M:%S" UTC)
+
+  execute_process(
+    COMMAND ${CMAKE_HOST${lang}_COMPILER} --version
+    OUTPUT_VARIABLE _version
+    ERROR_VARIABLE _version
+  )
+
+  # User-provided platform options are persisted along with the detected ones,
+  # and the ABI information is missing in the lazy mode
+  unset(_options)
+  foreach(_name
+      OUTPUT_EXTENSION EXECUTABLE_SUFFIX
+      STATIC_LIBRARY_PREFIX STATIC_LIBRARY_SUFFIX
+      SHARED_LIBRARY_PREFIX SHARED_LIBRARY_SUFFIX
+      SHARED_LIBRARY_SONAME_FLAG SHARED_LIBRARY_RUNTIME_FLAG)
+    list(APPEND _options "${CMAKE_HOST${lang}_${_name}}")
+  endforeach()
+
+  string(MD5 _key "${_compiler};${_size};${_timestamp};${_version};${CMAKE_VERSION};${HOSTA_VERSION};${CMAKE_GENERATOR};${CMAKE_HOST_LAZY_COMPILER_INFO};${_options}")
+  set(${OUTPUT} "${CMAKE_HOST_COMPILER_CACHE_DIR}/CMakeHOST${lang}Compiler-${_key}.cmake" PARENT_SCOPE)
+endfunction(get_host_compiler_cache_file)
+
+macro(load_host_compiler_cache lang FILE)
+  if(EXISTS "${FILE}")
+    # Keep the compiler path found for the current build tree
+    set(_host_compiler "${CMAKE_HOST${lang}_COMPILER}")
+    include("${FILE}")
+    set(CMAKE_HOST${lang}_COMPILER "${_host_compiler}")
+    unset(_host_compiler)
+  endif()
+endmacro(load_host_compiler_cache)
+
+function(save_host_compiler_cache lang FILE)
+  # Set internal directory path
+  set(INTERNAL_DIR ${CMAKE_BINARY_DIR}${CMAKE_FILES_DIRECTORY}/${CMAKE_VERSION}-hosta.internal)
+
+  # Publish the entry atomically, since build trees may be configured concurrently
+  get_filename_component(_directory "${FILE}" DIRECTORY)
+  file(MAKE_DIRECTORY "${_directory}")
+  string(RANDOM LENGTH 8 _suffix)
+  configure_file(${INTERNAL_DIR}/CMakeHOST${lang}Compiler.cmake "${FILE}.${_suffix}" COPYONLY)
+  file(RENAME "${FILE}.${_suffix}" "${FILE}")
+endfunction(save_host_compiler_cache)
+
+# Detect the host compilers of the given languages concurrently, each in a
+# separate cmake process running DetermineHOST<LANG>Compiler.cmake. The saved
+# host compiler preferences are then loaded by the regular detection. Languages
+# that are forced, already detected or reuse the compiler information of
+# project() are skipped.
+function(detect_host_compilers)
+  # Set internal directory path
+  set(INTERNAL_DIR ${CMAKE_BINARY_DIR}${CMAKE_FILES_DIRECTORY}/${CMAKE_VERSION}-hosta.internal)
+
+  unset(_languages)
+  foreach(lang IN LISTS ARGN)
+    if(CMAKE_HOST${lang}_COMPILER_FORCED OR
+       EXISTS "${INTERNAL_DIR}/CMakeHOST${lang}Compiler.cmake" OR
+       NOT EXISTS "${_HOSTA_BASE_DIR}/DetermineHOST${lang}Compiler.cmake")
+      continue()
+    endif()
+    check_host_target_compiler_info(${lang} _reusable)
+    if(_reusable)
+      continue()
+    endif()
+    list(APPEND _languages ${lang})
+  endforeach()
+
+  list(LENGTH _languages _length)
+  if(_length LESS 2)
+    return()
+  endif()
+
+  # Forward the variables affecting the detection to the workers
+  set(_variables
+    CMAKE_BINARY_DIR
+    CMAKE_GENERATOR
+    CMAKE_HOST_COMPILER_CACHE_DIR
+    CMAKE_HOST_LAZY_COMPILER_INFO
+    CMAKE_HOST_PROFILE
+    CMAKE_PROGRAM_PATH
+    CMAKE_PREFIX_PATH
+    CMAKE_FIND_ROOT_PATH
+    CMAKE_FIND_ROOT_PATH_MODE_PROGRAM
+    HOSTA_VERSION
+  )
+
+  file(MAKE_DIRECTORY ${INTERNAL_DIR})
+  unset(_commands)
+  foreach(lang IN LISTS _languages)
+    set(_variables_file ${INTERNAL_DIR}/DetermineHOST${lang}Compiler.variables.cmake)
+    file(WRITE ${_variables_file} "")
+    foreach(_name
+        ${_variables}
+        CMAKE_HOST${lang}_COMPILER
+        CMAKE_HOST${lang}_COMPILER_LIST
+        CMAKE_HOST${lang}_AR
+        CMAKE_HOST${lang}_RANLIB
+        CMAKE_HOST${lang}_OUTPUT_EXTENSION
+        CMAKE_HOST${lang}_EXECUTABLE_SUFFIX
+        CMAKE_HOST${lang}_STATIC_LIBRARY_PREFIX
+        CMAKE_HOST${lang}_STATIC_LIBRARY_SUFFIX
+        CMAKE_HOST${lang}_SHARED_LIBRARY_PREFIX
+        CMAKE_HOST${lang}_SHARED_LIBRARY_SUFFIX
+        CMAKE_HOST${lang}_SHARED_LIBRARY_SONAME_FLAG
+        CMAKE_HOST${lang}_SHARED_LIBRARY_RUNTIME_FLAG
+        CMAKE_INCLUDE_FLAG_HOST${lang})
+      if(DEFINED ${_name})
+        file(APPEND ${_variables_file} "set(${_name} [==[${${_name}}]==])\n")
+      endif()
+    endforeach()
+
+    file(REMOVE ${INTERNAL_DIR}/DetermineHOST${lang}Compiler.log ${INTERNAL_DIR}/DetermineHOST${lang}Compiler.profile)
+    list(APPEND _commands COMMAND ${CMAKE_COMMAND}
+      -DHOST_LANGUAGE=${lang}
+      -DHOST_VARIABLES_FILE=${_variables_file}
+      -DHOST_LOG_FILE=${INTERNAL_DIR}/DetermineHOST${lang}Compiler.log
+      -DHOST_PROFILE_FILE=${INTERNAL_DIR}/DetermineHOST${lang}Compiler.profile
+      -P ${_HOSTA_BASE_DIR}/DetermineHOSTCompilerWorker.cmake
+    )
+  endforeach()
+
+  execute_process(
+    ${_commands}
+    WORKING_DIRECTORY ${CMAKE_BINARY_DIR}
+    RESULTS_VARIABLE _results
+    OUTPUT_QUIET
+    ERROR_QUIET
+  )
+
+  # Replay the output and the profile of the successful workers. The failed
+  # ones are detected again by the regular detection to report the errors.
+  foreach(lang IN LISTS _languages)
+    list(POP_FRONT _results _result)
+    if(NOT "${_result}" STREQUAL "0")
+      file(REMOVE ${INTERNAL_DIR}/CMakeHOST${lang}Compiler.cmake)
+      continue()
+    endif()
+    load_host_profile_entries(${INTERNAL_DIR}/DetermineHOST${lang}Compiler.profile)
+    file(STRINGS ${INTERNAL_DIR}/DetermineHOST${lang}Compiler.log _lines)
+    foreach(_line IN LISTS _lines)
+      if(_line MATCHES "^-- (.*)$")
+        message(STATUS "${CMAKE_MATCH_1}")
+      endif()
+    endforeach()
+  endforeach()
+endfunction(detect_host_compilers)
+
+# Set the compilers to try for the given language if not set by the user
+function(get_host_compiler_list lang OUTPUT)
+  if(CMAKE_HOST${lang}_COMPILER_LIST)
+    set(${OUTPUT} "${CMAKE_HOST${lang}_COMPILER_LIST}" PARENT_SCOPE)
+  elseif(lang STREQUAL C)
+    set(${OUTPUT} cc gcc clang PARENT_SCOPE)
+  elseif(lang STREQUAL CXX)
+    set(${OUTPUT} c++ g++ clang++ PARENT_SCOPE)
+  endif()
+endfunction(get_host_compiler_list)
+
 function(find_host_compiler lang)
   include(CMakeDetermineCompiler)
   _cmake_find_compiler(HOST${lang})
@@ -125,7 +300,9 @@ function(find_host_compiler_id lang)
   include(CMakeDetermineCompilerId)
   set(_cmake_platform_info_dir ${CMAKE_PLATFORM_INFO_DIR})
   set(CMAKE_PLATFORM_INFO_DIR ${INTERNAL_DIR})
+  start_host_profile(_profile_start)
   CMAKE_DETERMINE_COMPILER_ID(${lang} HOST${lang}FLAGS CMakeHOST${lang}CompilerId.${${lang}_extension})
+  stop_host_profile(find_host_compiler_id "${_profile_start}")
   set(CMAKE_PLATFORM_INFO_DIR ${_cmake_platform_info_dir})
 
   # Restore the original module path
@@ -165,6 +342,93 @@ function(find_host_compiler_id lang)
   endforeach()
 endfunction(find_host_compiler_id)
 
+# Check if the compiler information detected by project() can be reused, i.e.
+# the host compiler is the same binary as CMAKE_<LANG>_COMPILER, used with the
+# same flags and without cross-compiling. The host compiler is searched for if
+# not found yet.
+function(check_host_target_compiler_info lang OUTPUT)
+  set(${OUTPUT} FALSE PARENT_SCOPE)
+
+  if(NOT CMAKE_${lang}_COMPILER_LOADED OR NOT CMAKE_${lang}_COMPILER_WORKS OR NOT CMAKE_${lang}_COMPILER_ID)
+    return()
+  endif()
+
+  # Compiler wrappers given as the first argument change the compiler behavior
+  if(CMAKE_${lang}_COMPILER_ARG1)
+    return()
+  endif()
+
+  # The same compiler may still be detected for another target, e.g. with
+  # --target=, --sysroot or -m32, in which case the ABI information differs
+  if(CMAKE_CROSSCOMPILING OR
+     CMAKE_${lang}_COMPILER_TARGET OR
+     CMAKE_${lang}_COMPILER_EXTERNAL_TOOLCHAIN OR
+     CMAKE_SYSROOT OR
+     NOT "${CMAKE_${lang}_FLAGS}" STREQUAL "${CMAKE_HOST${lang}_FLAGS}")
+    return()
+  endif()
+
+  if(NOT CMAKE_HOST${lang}_COMPILER)
+    get_host_compiler_list(${lang} CMAKE_HOST${lang}_COMPILER_LIST)
+    find_host_compiler(${lang})
+  endif()
+
+  get_filename_component(_host_compiler "${CMAKE_HOST${lang}_COMPILER}" REALPATH)
+  get_filename_component(_compiler "${CMAKE_${lang}_COMPILER}" REALPATH)
+  if(NOT _host_compiler STREQUAL _compiler)
+    return()
+  endif()
+
+  set(${OUTPUT} TRUE PARENT_SCOPE)
+endfunction(check_host_target_compiler_info)
+
+# Reuse the compiler information detected by project() if possible (see
+# check_host_target_compiler_info).
+function(load_host_target_compiler_info lang OUTPUT)
+  check_host_target_compiler_info(${lang} _reusable)
+  set(${OUTPUT} ${_reusable} PARENT_SCOPE)
+  if(NOT _reusable)
+    return()
+  endif()
+
+  # Set host compiler-specific information
+  set(CMAKE_HOST${lang}_COMPILER_ID "${CMAKE_${lang}_COMPILER_ID}" PARENT_SCOPE)
+  set(CMAKE_HOST${lang}_COMPILER_VERSION "${CMAKE_${lang}_COMPILER_VERSION}" PARENT_SCOPE)
+  set(CMAKE_HOST${lang}_COMPILER_WORKS TRUE PARENT_SCOPE)
+  set(CMAKE_HOST${lang}_PLATFORM_ID "${CMAKE_${lang}_PLATFORM_ID}" PARENT_SCOPE)
+  set(CMAKE_HOST${lang}_STANDARD_COMPUTED_DEFAULT "${CMAKE_${lang}_STANDARD_COMPUTED_DEFAULT}" PARENT_SCOPE)
+  set(CMAKE_HOST${lang}_VERBOSE_FLAG "${CMAKE_${lang}_VERBOSE_FLAG}" PARENT_SCOPE)
+  set(CMAKE_INCLUDE_FLAG_HOST${lang} "${CMAKE_INCLUDE_FLAG_${lang}}" PARENT_SCOPE)
+  set(CMAKE_INCLUDE_SYSTEM_FLAG_HOST${lang} "${CMAKE_INCLUDE_SYSTEM_FLAG_${lang}}" PARENT_SCOPE)
+
+  # Set the ABI information
+  set(CMAKE_HOST${lang}_ABI_COMPILED "${CMAKE_${lang}_ABI_COMPILED}" PARENT_SCOPE)
+  set(CMAKE_HOST${lang}_COMPILER_ABI "${CMAKE_${lang}_COMPILER_ABI}" PARENT_SCOPE)
+  set(CMAKE_HOST${lang}_IMPLICIT_INCLUDE_DIRECTORIES "${CMAKE_${lang}_IMPLICIT_INCLUDE_DIRECTORIES}" PARENT_SCOPE)
+  set(CMAKE_HOST${lang}_IMPLICIT_LINK_LIBRARIES "${CMAKE_${lang}_IMPLICIT_LINK_LIBRARIES}" PARENT_SCOPE)
+  set(CMAKE_HOST${lang}_IMPLICIT_LINK_DIRECTORIES "${CMAKE_${lang}_IMPLICIT_LINK_DIRECTORIES}" PARENT_SCOPE)
+  set(CMAKE_HOST${lang}_IMPLICIT_LINK_FRAMEWORK_DIRECTORIES "${CMAKE_${lang}_IMPLICIT_LINK_FRAMEWORK_DIRECTORIES}" PARENT_SCOPE)
+
+  # Set shared library flags
+  set(CMAKE_HOST${lang}_COMPILE_OPTIONS_PIC "${CMAKE_${lang}_COMPILE_OPTIONS_PIC}" PARENT_SCOPE)
+  set(CMAKE_HOST${lang}_SHARED_LIBRARY_CREATE_FLAGS "${CMAKE_SHARED_LIBRARY_CREATE_${lang}_FLAGS}" PARENT_SCOPE)
+  set(CMAKE_HOST${lang}_SHARED_LIBRARY_SONAME_FLAG "${CMAKE_SHARED_LIBRARY_SONAME_${lang}_FLAG}" PARENT_SCOPE)
+  set(CMAKE_HOST${lang}_SHARED_LIBRARY_RUNTIME_FLAG "${CMAKE_SHARED_LIBRARY_RUNTIME_${lang}_FLAG}" PARENT_SCOPE)
+
+  # Guess the supported language standard versions based on C and CXX
+  list(APPEND versions 90 98 99 03 11 14 17 20 23 26)
+
+  # Set standard compile options
+  foreach(version IN LISTS versions)
+    if(CMAKE_${lang}${version}_STANDARD_COMPILE_OPTION)
+      set(CMAKE_HOST${lang}${version}_STANDARD_COMPILE_OPTION "${CMAKE_${lang}${version}_STANDARD_COMPILE_OPTION}" PARENT_SCOPE)
+    endif()
+    if(CMAKE_${lang}${version}_EXTENSION_COMPILE_OPTION)
+      set(CMAKE_HOST${lang}${version}_EXTENSION_COMPILE_OPTION "${CMAKE_${lang}${version}_EXTENSION_COMPILE_OPTION}" PARENT_SCOPE)
+    endif()
+  endforeach()
+endfunction(load_host_target_compiler_info)
+
 function(set_host_platform_default_options lang)
   # Check if it is a supported generator
   if(CMAKE_GENERATOR MATCHES "Visual Studio")
@@ -253,6 +517,26 @@ function(set_host_platform_default_options lang)
   if(NOT CMAKE_INCLUDE_FLAG_HOST${lang})
     set(CMAKE_INCLUDE_FLAG_HOST${lang} "-I" PARENT_SCOPE)
   endif()
+
+  # Set default interprocedural optimization options
+  if(NOT CMAKE_HOST${lang}_COMPILE_OPTIONS_IPO)
+    if(CMAKE_HOST${lang}_COMPILER_ID STREQUAL "GNU" AND CMAKE_HOST${lang}_COMPILER_VERSION VERSION_GREATER_EQUAL 10)
+      set(CMAKE_HOST${lang}_COMPILE_OPTIONS_IPO "-flto=auto;-fno-fat-lto-objects" PARENT_SCOPE)
+      set(CMAKE_HOST${lang}_LINK_OPTIONS_IPO "-flto=auto" PARENT_SCOPE)
+    elseif(CMAKE_HOST${lang}_COMPILER_ID MATCHES "Clang")
+      set(CMAKE_HOST${lang}_COMPILE_OPTIONS_IPO "-flto=thin" PARENT_SCOPE)
+      set(CMAKE_HOST${lang}_LINK_OPTIONS_IPO "-flto=thin" PARENT_SCOPE)
+    else()
+      set(CMAKE_HOST${lang}_COMPILE_OPTIONS_IPO "-flto" PARENT_SCOPE)
+      set(CMAKE_HOST${lang}_LINK_OPTIONS_IPO "-flto" PARENT_SCOPE)
+    endif()
+  endif()
+
+  # Set default compile flags of the host build types
+  set(CMAKE_HOST${lang}_FLAGS_DEBUG_INIT "-g" PARENT_SCOPE)
+  set(CMAKE_HOST${lang}_FLAGS_RELEASE_INIT "-O3;-DNDEBUG" PARENT_SCOPE)
+  set(CMAKE_HOST${lang}_FLAGS_RELWITHDEBINFO_INIT "-O2;-g;-DNDEBUG" PARENT_SCOPE)
+  set(CMAKE_HOST${lang}_FLAGS_MINSIZEREL_INIT "-Os;-DNDEBUG" PARENT_SCOPE)
 endfunction(set_host_platform_default_options)
 
 function(try_host_compile lang)
@@ -263,6 +547,7 @@ function(try_host_compile lang)
 
   file(REMOVE ${BUILD_TARGET})
 
+  start_host_profile(_profile_start)
   execute_process(
     COMMAND ${CMAKE_HOST${lang}_COMPILER} ${BUILD_COMPILE_OPTIONS} ${BUILD_SOURCE} -o ${BUILD_TARGET}
     WORKING_DIRECTORY ${BUILD_WORKING_DIRECTORY}
@@ -271,6 +556,7 @@ function(try_host_compile lang)
     ERROR_VARIABLE OUTPUT
     ERROR_QUIET
   )
+  stop_host_profile("execute_process(try_host_compile)" "${_profile_start}")
 
   if(RESULT EQUAL 0)
     set(${BUILD_RESULT_VARIABLE} TRUE PARENT_SCOPE)
@@ -280,6 +566,110 @@ function(try_host_compile lang)
   set(${BUILD_OUTPUT_VARIABLE} ${OUTPUT} PARENT_SCOPE)
 endfunction(try_host_compile)
 
+function(find_host_compiler_abi_info lang)
+  # Set internal directory path
+  set(INTERNAL_DIR ${CMAKE_BINARY_DIR}${CMAKE_FILES_DIRECTORY}/${CMAKE_VERSION}-hosta.internal)
+
+  # A list of extensions for each language
+  set(C_extension c)
+  set(CXX_extension cpp)
+
+  try_host_compile(${lang}
+    SOURCE ${CMAKE_ROOT}/Modules/CMake${lang}CompilerABI.${${lang}_extension}
+    TARGET CMakeDetermineCompilerABI_HOST${lang}.bin
+    COMPILE_OPTIONS ${CMAKE_HOST${lang}_VERBOSE_FLAG}
+    WORKING_DIRECTORY ${INTERNAL_DIR}
+    RESULT_VARIABLE _abi_compiled
+    OUTPUT_VARIABLE _abi_compiled_output
+  )
+
+  if(_abi_compiled)
+    message(STATUS "Detecting HOST${lang} compiler ABI info - done")
+    file(APPEND ${CMAKE_BINARY_DIR}${CMAKE_FILES_DIRECTORY}/CMakeOutput.log
+      "Detecting HOST${lang} compiler ABI info compiled with the following output:\n${_abi_compiled_output}\n\n"
+    )
+    parse_host_compiler_abi_info(${lang} ${INTERNAL_DIR}/CMakeDetermineCompilerABI_HOST${lang}.bin)
+    parse_host_implicit_include_info(${lang} "${_abi_compiled_output}")
+    parse_host_implicit_link_info(${lang} "${_abi_compiled_output}")
+  else()
+    message(STATUS "Detecting HOST${lang} compiler ABI info - failed")
+    file(APPEND ${CMAKE_BINARY_DIR}${CMAKE_FILES_DIRECTORY}/CMakeError.log
+      "Detecting HOST${lang} compiler ABI info failed to compile with the following output:\n${_abi_compiled_output}\n\n"
+    )
+  endif()
+
+  set(CMAKE_HOST${lang}_ABI_COMPILED ${_abi_compiled} PARENT_SCOPE)
+  foreach(_name
+      COMPILER_ABI
+      IMPLICIT_INCLUDE_DIRECTORIES
+      IMPLICIT_LINK_LIBRARIES
+      IMPLICIT_LINK_DIRECTORIES
+      IMPLICIT_LINK_FRAMEWORK_DIRECTORIES)
+    set(CMAKE_HOST${lang}_${_name} "${CMAKE_HOST${lang}_${_name}}" PARENT_SCOPE)
+  endforeach()
+endfunction(find_host_compiler_abi_info)
+
+# Query the host compiler information CMAKE_HOST<LANG>_<NAME>, e.g.
+# COMPILER_ABI or IMPLICIT_INCLUDE_DIRECTORIES. The ABI information deferred by
+# CMAKE_HOST_LAZY_COMPILER_INFO, the LINKER_TYPES needed for a linker type and
+# IPO_SUPPORTED needed for interprocedural optimization are detected on the
+# first query and saved to the host compiler preferences for later configure
+# runs.
+function(get_host_compiler_info lang NAME OUTPUT)
+  set(_abi_names
+    ABI_COMPILED
+    COMPILER_ABI
+    IMPLICIT_INCLUDE_DIRECTORIES
+    IMPLICIT_LINK_LIBRARIES
+    IMPLICIT_LINK_DIRECTORIES
+    IMPLICIT_LINK_FRAMEWORK_DIRECTORIES
+  )
+  set(_query_names LINKER_TYPES IPO_SUPPORTED)
+
+  if(NOT NAME IN_LIST _abi_names AND NOT NAME IN_LIST _query_names)
+    set(${OUTPUT} "${CMAKE_HOST${lang}_${NAME}}" PARENT_SCOPE)
+    return()
+  endif()
+
+  # Reuse the information detected by an earlier query
+  if(NAME IN_LIST _abi_names)
+    set(_names ${_abi_names})
+  else()
+    set(_names ${NAME})
+  endif()
+  get_property(_detected GLOBAL PROPERTY HOST_COMPILER_INFO_${lang}_${NAME} SET)
+  if(NOT _detected)
+    # Keep the information detected by earlier queries in the preferences
+    foreach(_name IN LISTS _abi_names _query_names)
+      get_property(_set GLOBAL PROPERTY HOST_COMPILER_INFO_${lang}_${_name} SET)
+      if(_set)
+        get_property(CMAKE_HOST${lang}_${_name} GLOBAL PROPERTY HOST_COMPILER_INFO_${lang}_${_name})
+      endif()
+    endforeach()
+
+    # The linkers and IPO support of forced compiler information are trusted
+    if(NAME IN_LIST _abi_names AND "${CMAKE_HOST${lang}_ABI_COMPILED}" STREQUAL "")
+      find_host_compiler_abi_info(${lang})
+      save_host_compiler_preferences(${lang})
+    elseif(NAME STREQUAL "LINKER_TYPES" AND "${CMAKE_HOST${lang}_LINKER_TYPES}" STREQUAL "" AND
+           NOT CMAKE_HOST${lang}_COMPILER_FORCED)
+      find_host_linker_types(${lang})
+      save_host_compiler_preferences(${lang})
+    elseif(NAME STREQUAL "IPO_SUPPORTED" AND "${CMAKE_HOST${lang}_IPO_SUPPORTED}" STREQUAL "" AND
+           NOT CMAKE_HOST${lang}_COMPILER_FORCED)
+      find_host_ipo_support(${lang})
+      save_host_compiler_preferences(${lang})
+    endif()
+
+    foreach(_name IN LISTS _names)
+      set_property(GLOBAL PROPERTY HOST_COMPILER_INFO_${lang}_${_name} "${CMAKE_HOST${lang}_${_name}}")
+    endforeach()
+  endif()
+
+  get_property(_value GLOBAL PROPERTY HOST_COMPILER_INFO_${lang}_${NAME})
+  set(${OUTPUT} "${_value}" PARENT_SCOPE)
+endfunction(get_host_compiler_info)
+
 function(parse_host_compiler_abi_info lang bin)
   file(STRINGS "${bin}" ABI_STRINGS REGEX "INFO:[A-Za-z0-9_]+\\[[^]]*\\]")
   foreach(info ${ABI_STRINGS})
@@ -297,6 +687,8 @@ endfunction(parse_host_compiler_abi_info)
 # They are intentionally NOT injected into the host compile/link command lines:
 # hosta invokes the compiler driver (gcc/clang) directly, which already resolves
 # its own implicit search paths, so passing them again would be redundant.
+# With CMAKE_HOST_LAZY_COMPILER_INFO, they are only detected when queried
+# through get_host_compiler_info().
 function(parse_host_implicit_include_info lang text)
   include(CMakeParseImplicitIncludeInfo)
 
@@ -357,8 +749,87 @@ function(find_host_binutils lang)
   set(ranlib_names "${toolchain_prefix}ranlib" "${toolchain_prefix}llvm-ranlib")
   find_program(CMAKE_HOST${lang}_RANLIB NAMES ${ranlib_names} HINTS ${toolchain_location})
   set(CMAKE_HOST${lang}_RANLIB "${CMAKE_HOST${lang}_RANLIB}" PARENT_SCOPE)
+
+  # The compiler wrappers of ar and ranlib load the LTO plugin, so that the
+  # archives of LTO objects keep their symbol tables
+  string(REGEX MATCH "^[0-9]+" compiler_major_version "${CMAKE_HOST${lang}_COMPILER_VERSION}")
+  if(CMAKE_HOST${lang}_COMPILER_ID MATCHES "Clang")
+    set(wrapper_prefix "${toolchain_prefix}llvm-")
+  else()
+    set(wrapper_prefix "${toolchain_prefix}gcc-")
+  endif()
+
+  # CMAKE_HOST${lang}_COMPILER_AR
+  set(ar_names "${wrapper_prefix}ar-${compiler_major_version}" "${wrapper_prefix}ar")
+  find_program(CMAKE_HOST${lang}_COMPILER_AR NAMES ${ar_names} HINTS ${toolchain_location})
+  set(CMAKE_HOST${lang}_COMPILER_AR "${CMAKE_HOST${lang}_COMPILER_AR}" PARENT_SCOPE)
+
+  # CMAKE_HOST${lang}_COMPILER_RANLIB
+  set(ranlib_names "${wrapper_prefix}ranlib-${compiler_major_version}" "${wrapper_prefix}ranlib")
+  find_program(CMAKE_HOST${lang}_COMPILER_RANLIB NAMES ${ranlib_names} HINTS ${toolchain_location})
+  set(CMAKE_HOST${lang}_COMPILER_RANLIB "${CMAKE_HOST${lang}_COMPILER_RANLIB}" PARENT_SCOPE)
 endfunction(find_host_binutils)
 
+# Probe the linkers the host compiler driver can select with -fuse-ld=, e.g.
+# LLD for -fuse-ld=lld. The driver only runs the linker to print its version,
+# so no program is built. CMAKE_HOST<LANG>_LINKER_TYPES lists the linkers found.
+# The linkers are probed on the first get_host_compiler_info() query.
+function(find_host_linker_types lang)
+  unset(_types)
+  foreach(_type BFD GOLD LLD MOLD)
+    string(TOLOWER "${_type}" _name)
+    execute_process(
+      COMMAND ${CMAKE_HOST${lang}_COMPILER} -fuse-ld=${_name} -Wl,--version
+      RESULT_VARIABLE _result
+      OUTPUT_QUIET
+      ERROR_QUIET
+    )
+    if(_result EQUAL 0)
+      list(APPEND _types ${_type})
+    endif()
+  endforeach()
+
+  if(_types)
+    list(JOIN _types ", " _found)
+    message(STATUS "Detecting HOST${lang} linker types - ${_found}")
+  else()
+    message(STATUS "Detecting HOST${lang} linker types - none")
+  endif()
+  set(CMAKE_HOST${lang}_LINKER_TYPES "${_types}" PARENT_SCOPE)
+endfunction(find_host_linker_types)
+
+# Check whether the host compiler can build a program with interprocedural
+# optimization. CMAKE_HOST<LANG>_IPO_SUPPORTED is set to the result. The
+# support is checked on the first get_host_compiler_info() query.
+function(find_host_ipo_support lang)
+  set(C_extension c)
+  set(CXX_extension cpp)
+  set(_directory ${CMAKE_BINARY_DIR}${CMAKE_FILES_DIRECTORY}/CMakeTmp)
+  file(WRITE ${_directory}/testHOST${lang}IPO.${${lang}_extension}
+    "int answer(void) { return 42; }\n"
+    "int main(void) { return answer() - 42; }\n"
+  )
+
+  try_host_compile(${lang}
+    SOURCE testHOST${lang}IPO.${${lang}_extension}
+    TARGET testHOST${lang}IPO.bin
+    COMPILE_OPTIONS ${CMAKE_HOST${lang}_COMPILE_OPTIONS_IPO} ${CMAKE_HOST${lang}_LINK_OPTIONS_IPO}
+    WORKING_DIRECTORY ${_directory}
+    RESULT_VARIABLE _supported
+    OUTPUT_VARIABLE _output
+  )
+
+  if(_supported)
+    message(STATUS "Detecting HOST${lang} IPO support - yes")
+  else()
+    message(STATUS "Detecting HOST${lang} IPO support - no")
+    file(APPEND ${CMAKE_BINARY_DIR}${CMAKE_FILES_DIRECTORY}/CMakeError.log
+      "Detecting HOST${lang} IPO support failed with the following output:\n${_output}\n\n"
+    )
+  endif()
+  set(CMAKE_HOST${lang}_IPO_SUPPORTED ${_supported} PARENT_SCOPE)
+endfunction(find_host_ipo_support)
+
 function(find_and_copy_file FILENAME PATHS TARGET_DIR)
   if(EXISTS ${TARGET_DIR}/${FILENAME})
     message(STATUS "Looking for ${FILENAME} in ${TARGET_DIR} -- found")
@@ -375,3 +846,236 @@ function(find_and_copy_file FILENAME PATHS TARGET_DIR)
     endif()
   endif()
 endfunction(find_and_copy_file)
+
+# Configure-time profiling, enabled by CMAKE_HOST_PROFILE.
+# The elapsed time of the instrumented functions and steps is accumulated in
+# global properties and reported by write_host_profile_report().
+function(get_host_profile_timestamp OUTPUT)
+  # Fractional seconds are supported by CMake 3.23 or higher
+  if(CMAKE_VERSION VERSION_LESS 3.23)
+    string(TIMESTAMP _seconds "%s" UTC)
+    set(${OUTPUT} "${_seconds}000000" PARENT_SCOPE)
+  else()
+    string(TIMESTAMP _microseconds "%s%f" UTC)
+    set(${OUTPUT} "${_microseconds}" PARENT_SCOPE)
+  endif()
+endfunction(get_host_profile_timestamp)
+
+function(start_host_profile OUTPUT)
+  if(NOT CMAKE_HOST_PROFILE)
+    unset(${OUTPUT} PARENT_SCOPE)
+    return()
+  endif()
+
+  # Write the report at the end of the top-level directory if supported
+  get_property(_deferred GLOBAL PROPERTY HOST_PROFILE_REPORT_DEFERRED)
+  if(NOT _deferred AND NOT CMAKE_VERSION VERSION_LESS 3.19)
+    set_property(GLOBAL PROPERTY HOST_PROFILE_REPORT_DEFERRED TRUE)
+    cmake_language(DEFER DIRECTORY ${CMAKE_SOURCE_DIR} CALL write_host_profile_report DEFER)
+  endif()
+
+  # Track the nesting level to attribute the time to the outermost call only
+  get_property(_depth GLOBAL PROPERTY HOST_PROFILE_DEPTH)
+  if(NOT _depth)
+    set(_depth 0)
+  endif()
+  math(EXPR _depth "${_depth} + 1")
+  set_property(GLOBAL PROPERTY HOST_PROFILE_DEPTH ${_depth})
+
+  get_host_profile_timestamp(_timestamp)
+  set(${OUTPUT} ${_timestamp} PARENT_SCOPE)
+endfunction(start_host_profile)
+
+# Accumulate the total time and the number of calls per name
+function(add_host_profile_entry NAME COUNT ELAPSED)
+  get_property(_names GLOBAL PROPERTY HOST_PROFILE_NAMES)
+  list(FIND _names "${NAME}" _found)
+  if(_found EQUAL -1)
+    set_property(GLOBAL APPEND PROPERTY HOST_PROFILE_NAMES ${NAME})
+  endif()
+  get_property(_total GLOBAL PROPERTY HOST_PROFILE_${NAME}_TOTAL)
+  get_property(_count GLOBAL PROPERTY HOST_PROFILE_${NAME}_COUNT)
+  if(NOT _total)
+    set(_total 0)
+    set(_count 0)
+  endif()
+  math(EXPR _total "${_total} + ${ELAPSED}")
+  math(EXPR _count "${_count} + ${COUNT}")
+  set_property(GLOBAL PROPERTY HOST_PROFILE_${NAME}_TOTAL ${_total})
+  set_property(GLOBAL PROPERTY HOST_PROFILE_${NAME}_COUNT ${_count})
+endfunction(add_host_profile_entry)
+
+function(stop_host_profile NAME START)
+  if(NOT CMAKE_HOST_PROFILE OR "${START}" STREQUAL "")
+    return()
+  endif()
+
+  set(oneValueArgs TARGET)
+  cmake_parse_arguments(ARG "" "${oneValueArgs}" "" ${ARGN})
+
+  get_host_profile_timestamp(_timestamp)
+  math(EXPR _elapsed "${_timestamp} - ${START}")
+
+  get_property(_depth GLOBAL PROPERTY HOST_PROFILE_DEPTH)
+  math(EXPR _depth "${_depth} - 1")
+  set_property(GLOBAL PROPERTY HOST_PROFILE_DEPTH ${_depth})
+
+  add_host_profile_entry(${NAME} 1 ${_elapsed})
+
+  # Accumulate the total time per target of the outermost calls
+  if(ARG_TARGET AND _depth EQUAL 0)
+    get_property(_targets GLOBAL PROPERTY HOST_PROFILE_TARGETS)
+    if(NOT ARG_TARGET IN_LIST _targets)
+      set_property(GLOBAL APPEND PROPERTY HOST_PROFILE_TARGETS ${ARG_TARGET})
+    endif()
+    get_property(_total GLOBAL PROPERTY HOST_PROFILE_TARGET_${ARG_TARGET}_TOTAL)
+    if(NOT _total)
+      set(_total 0)
+    endif()
+    math(EXPR _total "${_total} + ${_elapsed}")
+    set_property(GLOBAL PROPERTY HOST_PROFILE_TARGET_${ARG_TARGET}_TOTAL ${_total})
+  endif()
+endfunction(stop_host_profile)
+
+# Save the profile entries of a worker process, which are merged into the
+# report of the parent process by load_host_profile_entries()
+function(save_host_profile_entries FILE)
+  if(NOT CMAKE_HOST_PROFILE)
+    return()
+  endif()
+
+  file(WRITE "${FILE}" "")
+  get_property(_names GLOBAL PROPERTY HOST_PROFILE_NAMES)
+  foreach(_name IN LISTS _names)
+    get_property(_total GLOBAL PROPERTY HOST_PROFILE_${_name}_TOTAL)
+    get_property(_count GLOBAL PROPERTY HOST_PROFILE_${_name}_COUNT)
+    file(APPEND "${FILE}" "${_count}|${_total}|${_name}\n")
+  endforeach()
+endfunction(save_host_profile_entries)
+
+function(load_host_profile_entries FILE)
+  if(NOT CMAKE_HOST_PROFILE OR NOT EXISTS "${FILE}")
+    return()
+  endif()
+
+  file(STRINGS "${FILE}" _entries)
+  foreach(_entry IN LISTS _entries)
+    if(_entry MATCHES "^([0-9]+)\\|([0-9]+)\\|(.+)$")
+      add_host_profile_entry("${CMAKE_MATCH_3}" ${CMAKE_MATCH_1} ${CMAKE_MATCH_2})
+    endif()
+  endforeach()
+endfunction(load_host_profile_entries)
+
+# Sort the given names by their accumulated time in descending order
+function(sort_host_profile_entries OUTPUT PREFIX NAMES)
+  unset(_entries)
+  foreach(_name IN LISTS NAMES)
+    get_property(_total GLOBAL PROPERTY ${PREFIX}${_name}_TOTAL)
+    string(LENGTH "${_total}" _length)
+    math(EXPR _length "20 - ${_length}")
+    string(REPEAT "0" ${_length} _padding)
+    list(APPEND _entries "${_padding}${_total}|${_name}")
+  endforeach()
+  list(SORT _entries ORDER DESCENDING)
+  list(TRANSFORM _entries REPLACE "^[0-9]+\\|" "")
+  set(${OUTPUT} ${_entries} PARENT_SCOPE)
+endfunction(sort_host_profile_entries)
+
+# Right-align the given value to WIDTH characters
+function(get_host_profile_column OUTPUT VALUE WIDTH)
+  string(LENGTH "${VALUE}" _length)
+  if(_length LESS WIDTH)
+    math(EXPR _length "${WIDTH} - ${_length}")
+    string(REPEAT " " ${_length} _padding)
+    set(VALUE "${_padding}${VALUE}")
+  endif()
+  set(${OUTPUT} "${VALUE}" PARENT_SCOPE)
+endfunction(get_host_profile_column)
+
+# Format the given microseconds as milliseconds right-aligned to WIDTH
+function(get_host_profile_milliseconds OUTPUT MICROSECONDS WIDTH)
+  math(EXPR _integer "${MICROSECONDS} / 1000")
+  math(EXPR _fraction "${MICROSECONDS} % 1000 + 1000")
+  string(SUBSTRING "${_fraction}" 1 3 _fraction)
+  get_host_profile_column(_value "${_integer}.${_fraction}" ${WIDTH})
+  set(${OUTPUT} "${_value}" PARENT_SCOPE)
+endfunction(get_host_profile_milliseconds)
+
+# Write the aggregated profile to hosta-profile.json and hosta-profile.txt in
+# the top-level build directory. The report is written automatically at the
+# end of configure with CMake 3.19 or higher; call it explicitly otherwise.
+function(write_host_profile_report)
+  if(NOT CMAKE_HOST_PROFILE)
+    return()
+  endif()
+
+  # Run after the deferred calls scheduled later in the top-level directory
+  if("${ARGV0}" STREQUAL "DEFER")
+    get_property(_deferred GLOBAL PROPERTY HOST_PROFILE_REPORT_DEFERRED)
+    if(NOT _deferred STREQUAL "LAST")
+      set_property(GLOBAL PROPERTY HOST_PROFILE_REPORT_DEFERRED LAST)
+      cmake_language(DEFER DIRECTORY ${CMAKE_SOURCE_DIR} CALL write_host_profile_report DEFER)
+      return()
+    endif()
+  endif()
+
+  get_property(_names GLOBAL PROPERTY HOST_PROFILE_NAMES)
+  get_property(_targets GLOBAL PROPERTY HOST_PROFILE_TARGETS)
+  sort_host_profile_entries(_names HOST_PROFILE_ "${_names}")
+  sort_host_profile_entries(_targets HOST_PROFILE_TARGET_ "${_targets}")
+
+  # Set the width of the name column
+  set(_width 24)
+  foreach(_name IN LISTS _names _targets)
+    string(LENGTH "${_name}" _length)
+    if(_length GREATER _width)
+      set(_width ${_length})
+    endif()
+  endforeach()
+
+  string(REPEAT " " ${_width} _spaces)
+  math(EXPR _rule_width "${_width} + 26")
+  string(REPEAT "-" ${_rule_width} _rule)
+
+  # Per-function totals
+  string(SUBSTRING "Function${_spaces}" 0 ${_width} _column)
+  set(_table "${_column}       Count    Total (ms)\n${_rule}\n")
+  unset(_json_names)
+  foreach(_name IN LISTS _names)
+    get_property(_total GLOBAL PROPERTY HOST_PROFILE_${_name}_TOTAL)
+    get_property(_count GLOBAL PROPERTY HOST_PROFILE_${_name}_COUNT)
+    string(SUBSTRING "${_name}${_spaces}" 0 ${_width} _column)
+    get_host_profile_column(_count_column ${_count} 12)
+    get_host_profile_milliseconds(_milliseconds ${_total} 14)
+    string(APPEND _table "${_column}${_count_column}${_milliseconds}\n")
+    list(APPEND _json_names "    {\"name\": \"${_name}\", \"count\": ${_count}, \"total_us\": ${_total}}")
+  endforeach()
+
+  # Slowest targets
+  string(SUBSTRING "Target${_spaces}" 0 ${_width} _column)
+  string(APPEND _table "\n${_column}                Total (ms)\n${_rule}\n")
+  unset(_json_targets)
+  set(_index 0)
+  foreach(_target IN LISTS _targets)
+    get_property(_total GLOBAL PROPERTY HOST_PROFILE_TARGET_${_target}_TOTAL)
+    if(_index LESS 10)
+      string(SUBSTRING "${_target}${_spaces}" 0 ${_width} _column)
+      get_host_profile_milliseconds(_milliseconds ${_total} 26)
+      string(APPEND _table "${_column}${_milliseconds}\n")
+    endif()
+    list(APPEND _json_targets "    {\"name\": \"${_target}\", \"total_us\": ${_total}}")
+    math(EXPR _index "${_index} + 1")
+  endforeach()
+
+  string(REPLACE ";" ",\n" _json_names "${_json_names}")
+  string(REPLACE ";" ",\n" _json_targets "${_json_targets}")
+  file(WRITE ${CMAKE_BINARY_DIR}/hosta-profile.json
+    "{\n"
+    "  \"version\": \"${HOSTA_VERSION}\",\n"
+    "  \"functions\": [\n${_json_names}\n  ],\n"
+    "  \"targets\": [\n${_json_targets}\n  ]\n"
+    "}\n"
+  )
+  file(WRITE ${CMAKE_BINARY_DIR}/hosta-profile.txt "${_table}")
+  message(STATUS "Host profile report written to ${CMAKE_BINARY_DIR}/hosta-profile.txt")
+endfunction(write_host_profile_report)
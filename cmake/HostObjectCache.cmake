@@ -0,0 +1,232 @@
+# Copyright (c) 2026 LG Electronics Inc.
+# SPDX-License-Identifier: MIT
+
+# Compile a host object through the object cache (see do_host_compile).
+#
+# Usage:
+#   cmake -DHOST_OBJECT_CACHE_DIR=<dir> -DHOST_OBJECT_CACHE_MAX_SIZE=<size>
+#         -DHOST_OBJECT_CACHE_STATS=<file> -DHOST_COMPILER_IDENTITY=<identity>
+#         -P HostObjectCache.cmake -- <compile command>...
+#   cmake -DHOST_OBJECT_CACHE_DIR=<dir> -DHOST_OBJECT_CACHE_STATS=<file>
+#         -DHOST_OBJECT_CACHE_REPORT=ON -P HostObjectCache.cmake
+#
+# The cache key is the hash of the preprocessed source, the compiler identity
+# and the compile flags. On a hit, the object and the compiler diagnostics are
+# restored from the cache directory. On a miss, the compile command runs and
+# its results are stored. The least recently used objects are evicted when the
+# cache grows beyond the maximum size. Each compile appends its result to the
+# statistics file, which is summarized and reset by the report mode.
+
+# Format the given number of bytes for humans
+function(format_host_object_cache_size OUTPUT SIZE)
+  if(SIZE LESS 1048576)
+    math(EXPR _size "${SIZE} / 1024")
+    set(${OUTPUT} "${_size} KiB" PARENT_SCOPE)
+  else()
+    math(EXPR _size "${SIZE} / 1048576")
+    set(${OUTPUT} "${_size} MiB" PARENT_SCOPE)
+  endif()
+endfunction(format_host_object_cache_size)
+
+# Return the cached objects in the order of their last use, oldest first,
+# and their total size
+function(get_host_object_cache_entries OUTPUT SIZE_OUTPUT)
+  file(GLOB _paths "${HOST_OBJECT_CACHE_DIR}/??/*.o")
+  unset(_entries)
+  set(_total 0)
+  foreach(_path IN LISTS _paths)
+    file(TIMESTAMP "${_path}" _time "%Y%m%d%H%M%S" UTC)
+    file(SIZE "${_path}" _size)
+    math(EXPR _total "${_total} + ${_size}")
+    list(APPEND _entries "${_time}|${_size}|${_path}")
+  endforeach()
+  list(SORT _entries)
+  set(${OUTPUT} ${_entries} PARENT_SCOPE)
+  set(${SIZE_OUTPUT} ${_total} PARENT_SCOPE)
+endfunction(get_host_object_cache_entries)
+
+if(HOST_OBJECT_CACHE_REPORT)
+  if(NOT EXISTS "${HOST_OBJECT_CACHE_STATS}")
+    return()
+  endif()
+  file(STRINGS "${HOST_OBJECT_CACHE_STATS}" _results)
+  file(REMOVE "${HOST_OBJECT_CACHE_STATS}")
+
+  set(_hits ${_results})
+  list(FILTER _hits INCLUDE REGEX "^hit$")
+  list(LENGTH _hits _hits)
+  set(_misses ${_results})
+  list(FILTER _misses INCLUDE REGEX "^miss$")
+  list(LENGTH _misses _misses)
+  math(EXPR _total "${_hits} + ${_misses}")
+  if(_total EQUAL 0)
+    return()
+  endif()
+  math(EXPR _rate "100 * ${_hits} / ${_total}")
+
+  get_host_object_cache_entries(_entries _size)
+  format_host_object_cache_size(_size ${_size})
+  message(STATUS "Host object cache: ${_hits} hits, ${_misses} misses (${_rate}% hit rate), ${_size} in ${HOST_OBJECT_CACHE_DIR}")
+  return()
+endif()
+
+# Collect the compile command following "--"
+unset(_command)
+set(_found FALSE)
+math(EXPR _last "${CMAKE_ARGC} - 1")
+foreach(_index RANGE ${_last})
+  if(_found)
+    list(APPEND _command "${CMAKE_ARGV${_index}}")
+  elseif("${CMAKE_ARGV${_index}}" STREQUAL "--")
+    set(_found TRUE)
+  endif()
+endforeach()
+if(NOT _command)
+  message(FATAL_ERROR "No compile command given to the host object cache")
+endif()
+
+# Separate the output paths, which do not affect the object, from the flags
+unset(_object)
+unset(_flags)
+unset(_preprocess_command)
+set(_cacheable TRUE)
+set(_debug FALSE)
+set(_skip FALSE)
+foreach(_arg IN LISTS _command)
+  if(_skip STREQUAL "-o")
+    set(_object "${_arg}")
+    set(_skip FALSE)
+    continue()
+  elseif(_skip)
+    list(APPEND _preprocess_command "${_arg}")
+    set(_skip FALSE)
+    continue()
+  endif()
+
+  if(_arg STREQUAL "-o")
+    set(_skip "-o")
+    continue()
+  elseif(_arg STREQUAL "-MF" OR _arg STREQUAL "-MT" OR _arg STREQUAL "-MQ")
+    set(_skip "${_arg}")
+    list(APPEND _preprocess_command "${_arg}")
+    continue()
+  elseif(_arg MATCHES "^(--coverage|-ftest-coverage|-fprofile-arcs|-gsplit-dwarf)$")
+    # The compiler writes files next to the object besides the object itself
+    set(_cacheable FALSE)
+  elseif(_arg MATCHES "^-g")
+    set(_debug TRUE)
+  endif()
+  list(APPEND _flags "${_arg}")
+  list(APPEND _preprocess_command "${_arg}")
+endforeach()
+
+if(NOT _object OR NOT _cacheable OR NOT HOST_OBJECT_CACHE_DIR)
+  execute_process(COMMAND ${_command} RESULT_VARIABLE _result)
+  if(NOT _result EQUAL 0)
+    message(FATAL_ERROR "Failed to compile the host object: ${_object}")
+  endif()
+  return()
+endif()
+
+get_filename_component(_object "${_object}" ABSOLUTE)
+set(_preprocessed "${_object}.i")
+
+# Preprocess the source, which also writes the depfile if requested
+execute_process(
+  COMMAND ${_preprocess_command} -E -o ${_preprocessed}
+  RESULT_VARIABLE _result
+  OUTPUT_QUIET
+  ERROR_QUIET
+)
+
+if(_result EQUAL 0)
+  file(SHA256 "${_preprocessed}" _source_hash)
+  file(REMOVE "${_preprocessed}")
+
+  # Debug information refers to the working directory
+  if(_debug)
+    list(APPEND _flags "${CMAKE_CURRENT_SOURCE_DIR}")
+  endif()
+  string(SHA256 _key "hosta-object-cache-1;${HOST_COMPILER_IDENTITY};${_flags};${_source_hash}")
+  string(SUBSTRING "${_key}" 0 2 _prefix)
+  set(_entry "${HOST_OBJECT_CACHE_DIR}/${_prefix}/${_key}.o")
+
+  if(EXISTS "${_entry}")
+    # Restore the object and mark the entry as recently used
+    configure_file("${_entry}" "${_object}" COPYONLY)
+    file(TOUCH "${_object}" "${_entry}")
+    if(EXISTS "${_entry}.stderr")
+      file(READ "${_entry}.stderr" _stderr)
+      message(NOTICE "${_stderr}")
+    endif()
+    file(APPEND "${HOST_OBJECT_CACHE_STATS}" "hit\n")
+    return()
+  endif()
+else()
+  # Let the compiler report the error
+  file(REMOVE "${_preprocessed}")
+  unset(_entry)
+endif()
+
+execute_process(
+  COMMAND ${_command}
+  RESULT_VARIABLE _result
+  ERROR_VARIABLE _stderr
+)
+string(REGEX REPLACE "\n$" "" _stderr "${_stderr}")
+if(_stderr)
+  message(NOTICE "${_stderr}")
+endif()
+if(NOT _result EQUAL 0)
+  message(FATAL_ERROR "Failed to compile the host object: ${_object}")
+endif()
+
+file(APPEND "${HOST_OBJECT_CACHE_STATS}" "miss\n")
+if(NOT _entry)
+  return()
+endif()
+
+# Store the results under a temporary name first, since other compiles may
+# read the same entry concurrently
+string(RANDOM LENGTH 8 _suffix)
+configure_file("${_object}" "${_entry}.${_suffix}.tmp" COPYONLY)
+if(_stderr)
+  file(WRITE "${_entry}.stderr" "${_stderr}")
+endif()
+file(RENAME "${_entry}.${_suffix}.tmp" "${_entry}")
+
+# Evict the least recently used objects down to 90% of the maximum size
+set(_max_size "${HOST_OBJECT_CACHE_MAX_SIZE}")
+if(NOT _max_size)
+  set(_max_size 1G)
+endif()
+if(NOT _max_size MATCHES "^([0-9]+)([KMG]?)$")
+  message(FATAL_ERROR "Invalid host object cache size: ${_max_size}")
+endif()
+set(_max_size ${CMAKE_MATCH_1})
+set(_K_factor 1024)
+set(_M_factor 1048576)
+set(_G_factor 1073741824)
+if(CMAKE_MATCH_2)
+  math(EXPR _max_size "${_max_size} * ${_${CMAKE_MATCH_2}_factor}")
+endif()
+
+get_host_object_cache_entries(_entries _size)
+if(_size GREATER _max_size)
+  file(LOCK "${HOST_OBJECT_CACHE_DIR}/lock" GUARD PROCESS TIMEOUT 60 RESULT_VARIABLE _locked)
+  if(NOT _locked EQUAL 0)
+    return()
+  endif()
+  get_host_object_cache_entries(_entries _size)
+  math(EXPR _limit "${_max_size} / 10 * 9")
+  foreach(_entry IN LISTS _entries)
+    if(NOT _size GREATER _limit)
+      break()
+    endif()
+    string(REPLACE "|" ";" _entry "${_entry}")
+    list(GET _entry 1 _entry_size)
+    list(GET _entry 2 _entry_path)
+    file(REMOVE "${_entry_path}" "${_entry_path}.stderr")
+    math(EXPR _size "${_size} - ${_entry_size}")
+  endforeach()
+endif()
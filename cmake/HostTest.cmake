@@ -17,6 +17,8 @@ function(add_host_test TARGET)
     return()
   endif()
 
+  start_host_profile(_profile_start)
+
   set(oneValueArgs PREFIX)
   set(multiValueArgs EXTRA_ARGS)
   cmake_parse_arguments(ARG "" "${oneValueArgs}" "${multiValueArgs}" ${ARGN})
@@ -30,15 +32,119 @@ function(add_host_test TARGET)
   )
 
   add_test(NAME ${ARG_PREFIX}${TARGET} COMMAND ${_output} ${ARG_EXTRA_ARGS})
+
+  stop_host_profile(add_host_test "${_profile_start}" TARGET ${TARGET})
 endfunction(add_host_test)
 
+set(HOST_TEST_BATCH_SCRIPT
+  ${CMAKE_CURRENT_LIST_DIR}/HostTestBatch.cmake
+)
+
+# Register the given test cases as batches, each of which runs some test groups
+# in a single process. Either SHARDS batches are made, or each batch holds up
+# to BATCH_SIZE test cases. A test group is never split across batches.
+function(add_host_test_batches TARGET)
+  set(oneValueArgs FRAMEWORK EXECUTABLE PREFIX SHARDS BATCH_SIZE)
+  set(multiValueArgs TESTS EXTRA_ARGS)
+  cmake_parse_arguments(ARG "" "${oneValueArgs}" "${multiValueArgs}" ${ARGN})
+
+  if(DEFINED ARG_SHARDS AND DEFINED ARG_BATCH_SIZE)
+    host_logging_error("SHARDS and BATCH_SIZE cannot be used together for ${TARGET}")
+  endif()
+  foreach(_arg SHARDS BATCH_SIZE)
+    if(DEFINED ARG_${_arg} AND NOT ARG_${_arg} MATCHES "^[1-9][0-9]*$")
+      host_logging_error("${_arg} requires a positive integer: ${ARG_${_arg}}")
+    endif()
+  endforeach()
+
+  # Group the test cases by their test groups
+  unset(_groups)
+  foreach(_test IN LISTS ARG_TESTS)
+    string(REGEX REPLACE "\\..*$" "" _group "${_test}")
+    if(NOT _group IN_LIST _groups)
+      list(APPEND _groups ${_group})
+      unset(_group_tests_${_group})
+    endif()
+    list(APPEND _group_tests_${_group} ${_test})
+  endforeach()
+  list(LENGTH _groups _group_count)
+  if(_group_count EQUAL 0)
+    return()
+  endif()
+
+  # Assign the test groups to the batches
+  if(DEFINED ARG_SHARDS)
+    # Put each test group into the least loaded shard
+    set(_batch_count ${ARG_SHARDS})
+    if(_batch_count GREATER _group_count)
+      set(_batch_count ${_group_count})
+    endif()
+    foreach(_batch RANGE 1 ${_batch_count})
+      set(_batch_size_${_batch} 0)
+      unset(_batch_groups_${_batch})
+    endforeach()
+    foreach(_group IN LISTS _groups)
+      list(LENGTH _group_tests_${_group} _size)
+      set(_target_batch 1)
+      foreach(_batch RANGE 1 ${_batch_count})
+        if(_batch_size_${_batch} LESS _batch_size_${_target_batch})
+          set(_target_batch ${_batch})
+        endif()
+      endforeach()
+      list(APPEND _batch_groups_${_target_batch} ${_group})
+      math(EXPR _batch_size_${_target_batch} "${_batch_size_${_target_batch}} + ${_size}")
+    endforeach()
+  else()
+    # Fill each batch with whole test groups up to the batch size
+    set(_batch_count 0)
+    set(_batch_size 0)
+    foreach(_group IN LISTS _groups)
+      list(LENGTH _group_tests_${_group} _size)
+      math(EXPR _batch_size "${_batch_size} + ${_size}")
+      if(_batch_count EQUAL 0 OR _batch_size GREATER ARG_BATCH_SIZE)
+        math(EXPR _batch_count "${_batch_count} + 1")
+        unset(_batch_groups_${_batch_count})
+        set(_batch_size ${_size})
+      endif()
+      list(APPEND _batch_groups_${_batch_count} ${_group})
+    endforeach()
+  endif()
+
+  foreach(_batch RANGE 1 ${_batch_count})
+    unset(_batch_tests)
+    foreach(_group IN LISTS _batch_groups_${_batch})
+      list(APPEND _batch_tests ${_group_tests_${_group}})
+    endforeach()
+    string(REPLACE ";" "," _batch_tests "${_batch_tests}")
+
+    # A single batch runs all test groups without filtering
+    if(_batch_count EQUAL 1)
+      set(_batch_groups "")
+    else()
+      string(REPLACE ";" "," _batch_groups "${_batch_groups_${_batch}}")
+    endif()
+
+    add_test(NAME ${ARG_PREFIX}${TARGET}.batch${_batch}
+      COMMAND ${CMAKE_COMMAND}
+        -D "TEST_FRAMEWORK=${ARG_FRAMEWORK}"
+        -D "TEST_EXECUTABLE=${ARG_EXECUTABLE}"
+        -D "TEST_GROUPS=${_batch_groups}"
+        -D "TEST_CASES=${_batch_tests}"
+        -P "${HOST_TEST_BATCH_SCRIPT}"
+        -- ${ARG_EXTRA_ARGS}
+    )
+  endforeach()
+endfunction(add_host_test_batches)
+
 function(unity_fixture_add_host_tests TARGET)
   # Assume that enable_testing() is called
   if(NOT CMAKE_TESTING_ENABLED)
     return()
   endif()
 
-  set(oneValueArgs PREFIX)
+  start_host_profile(_profile_start)
+
+  set(oneValueArgs PREFIX SHARDS BATCH_SIZE)
   set(multiValueArgs EXTRA_ARGS)
   cmake_parse_arguments(ARG "" "${oneValueArgs}" "${multiValueArgs}" ${ARGN})
 
@@ -70,7 +176,9 @@ function(unity_fixture_add_host_tests TARGET)
   # Find the list of ignored tests
   set(ignored_tests)
   foreach(source IN LISTS sources)
+    start_host_profile(_read_start)
     file(READ "${source}" contents)
+    stop_host_profile("file(READ)" "${_read_start}")
 
     # Remove comments
     string(REGEX REPLACE "//[^\r\n]*" "" contents "${contents}")
@@ -86,8 +194,11 @@ function(unity_fixture_add_host_tests TARGET)
 
   # Find the list of runnable tests
   set(added_tests)
+  set(batch_tests)
   foreach(source IN LISTS sources)
+    start_host_profile(_read_start)
     file(READ "${source}" contents)
+    stop_host_profile("file(READ)" "${_read_start}")
 
     # Remove comments
     string(REGEX REPLACE "//[^\r\n]*" "" contents "${contents}")
@@ -105,6 +216,15 @@ function(unity_fixture_add_host_tests TARGET)
         continue()
       endif()
 
+      # Collect the runnable tests to be added as batches
+      if(DEFINED ARG_SHARDS OR DEFINED ARG_BATCH_SIZE)
+        list(APPEND added_tests ${unity_test_name})
+        if(NOT unity_test_name IN_LIST ignored_tests)
+          list(APPEND batch_tests ${unity_test_name})
+        endif()
+        continue()
+      endif()
+
       set(ctest_test_name ${ARG_PREFIX}${unity_test_name})
       if(ENABLE_HOST_UNITY_FIXTURE_EXACT_MATCH)
         add_test(NAME ${ctest_test_name} COMMAND ${_output} -G ${unity_test_group} -N ${unity_test_case} -v ${ARG_EXTRA_ARGS})
@@ -119,8 +239,175 @@ function(unity_fixture_add_host_tests TARGET)
       endif()
     endforeach()
   endforeach()
+
+  if(DEFINED ARG_SHARDS OR DEFINED ARG_BATCH_SIZE)
+    unset(_batch_options)
+    foreach(_arg SHARDS BATCH_SIZE)
+      if(DEFINED ARG_${_arg})
+        list(APPEND _batch_options ${_arg} ${ARG_${_arg}})
+      endif()
+    endforeach()
+    add_host_test_batches(${TARGET}
+      FRAMEWORK UNITY_FIXTURE
+      EXECUTABLE ${_output}
+      PREFIX "${ARG_PREFIX}"
+      ${_batch_options}
+      TESTS ${batch_tests}
+      EXTRA_ARGS ${ARG_EXTRA_ARGS}
+    )
+  endif()
+
+  stop_host_profile(unity_fixture_add_host_tests "${_profile_start}" TARGET ${TARGET})
 endfunction(unity_fixture_add_host_tests)
 
+set(HOST_TEST_DISCOVERY_SCRIPT
+  ${CMAKE_CURRENT_LIST_DIR}/HostTestDiscovery.cmake
+)
+
+# Write a script running the given discovery script with the values of the
+# given variables, which is run after build or before test. The file is only
+# rewritten if its content changes, since the tests are discovered again
+# whenever it is newer than the discovered tests.
+function(write_host_test_discovery_file FILE SCRIPT)
+  set(_content "")
+  foreach(_name IN LISTS ARGN)
+    string(APPEND _content "set(${_name} [==[${${_name}}]==])\n")
+  endforeach()
+  string(APPEND _content "include([==[${SCRIPT}]==])\n")
+
+  unset(_previous)
+  if(EXISTS "${FILE}")
+    file(READ "${FILE}" _previous)
+  endif()
+  if(NOT _content STREQUAL _previous)
+    file(WRITE "${FILE}" "${_content}")
+  endif()
+endfunction(write_host_test_discovery_file)
+
+# Run the test discovery driver after all host targets are built. The tests
+# files written by the driver are declared as byproducts, so the command is
+# added at the end of the directory of the host build target with CMake 3.19
+# or higher, once all of the discoveries are known.
+function(add_host_test_discovery_driver)
+  if("${ARGV0}" STREQUAL "DEFER" AND NOT CMAKE_VERSION VERSION_LESS 3.19)
+    get_property(_deferred GLOBAL PROPERTY HOST_TEST_DISCOVERY_DRIVER_DEFERRED)
+    if(NOT _deferred)
+      set_property(GLOBAL PROPERTY HOST_TEST_DISCOVERY_DRIVER_DEFERRED TRUE)
+      get_target_property(_directory ${CMAKE_HOST_BUILD_TARGET} SOURCE_DIR)
+      cmake_language(DEFER DIRECTORY ${_directory} CALL add_host_test_discovery_driver)
+    endif()
+    return()
+  endif()
+
+  get_property(_added GLOBAL PROPERTY HOST_TEST_DISCOVERY_DRIVER_ADDED)
+  if(_added)
+    return()
+  endif()
+  set_property(GLOBAL PROPERTY HOST_TEST_DISCOVERY_DRIVER_ADDED TRUE)
+
+  unset(_tests_files)
+  get_property(_entries GLOBAL PROPERTY HOST_TEST_DISCOVERIES)
+  foreach(_entry IN LISTS _entries)
+    string(REPLACE "|" ";" _entry "${_entry}")
+    list(GET _entry 0 _mode)
+    list(GET _entry 2 _tests_file)
+    if(_mode STREQUAL "POST_BUILD")
+      list(APPEND _tests_files "${_tests_file}")
+    endif()
+  endforeach()
+
+  get_property(_command GLOBAL PROPERTY HOST_TEST_DISCOVERY_DRIVER_COMMAND)
+  add_custom_command(TARGET ${CMAKE_HOST_BUILD_TARGET} POST_BUILD
+    BYPRODUCTS ${_tests_files}
+    COMMAND ${_command} -D "HOST_TEST_DISCOVERY_MODE=POST_BUILD" -P "${HOST_TEST_DISCOVERY_SCRIPT}"
+    VERBATIM
+  )
+endfunction(add_host_test_discovery_driver)
+
+# Add the discovery of the given test executable and write the CTest include
+# file of the discovered tests. In POST_BUILD mode, the tests are discovered
+# after the executable is built. In PRE_TEST mode, the tests are discovered
+# when CTest loads the include file, if the executable or the discovery
+# parameters are newer than the discovered tests. With
+# CMAKE_HOST_TEST_DISCOVERY_DRIVER, the discovery is left to the driver, which
+# runs the stale discoveries of all executables concurrently. The include file
+# then also runs the driver in POST_BUILD mode if the tests are missing or
+# stale, e.g. when only the test executable was built.
+function(add_host_test_discovery TARGET)
+  set(oneValueArgs EXECUTABLE INCLUDE_FILE TESTS_FILE DISCOVERY_FILE DISCOVERY_MODE DISCOVERY_TIMEOUT)
+  cmake_parse_arguments(ARG "" "${oneValueArgs}" "" ${ARGN})
+
+  if(CMAKE_HOST_TEST_DISCOVERY_DRIVER)
+    # List the discovery in the registry of the driver
+    set(_registry "${CMAKE_BINARY_DIR}${CMAKE_FILES_DIRECTORY}/hosta-test-discoveries.txt")
+    set_property(GLOBAL APPEND PROPERTY HOST_TEST_DISCOVERIES
+      "${ARG_DISCOVERY_MODE}|${ARG_DISCOVERY_FILE}|${ARG_TESTS_FILE}|${ARG_EXECUTABLE}|${ARG_DISCOVERY_TIMEOUT}"
+    )
+    get_property(_entries GLOBAL PROPERTY HOST_TEST_DISCOVERIES)
+    string(REPLACE ";" "\n" _entries "${_entries}")
+    file(WRITE "${_registry}" "${_entries}\n")
+
+    get_property(_command GLOBAL PROPERTY HOST_TEST_DISCOVERY_DRIVER_COMMAND)
+    if(NOT _command)
+      set(_command "${CMAKE_COMMAND}"
+        -D "HOST_TEST_DISCOVERY_REGISTRY=${_registry}"
+        -D "HOST_TEST_DISCOVERY_JOBS=${CMAKE_HOST_TEST_DISCOVERY_JOBS}"
+      )
+      set_property(GLOBAL PROPERTY HOST_TEST_DISCOVERY_DRIVER_COMMAND "${_command}")
+    endif()
+
+    # Run the driver once all host targets are built
+    if(ARG_DISCOVERY_MODE STREQUAL "POST_BUILD")
+      add_host_test_discovery_driver(DEFER)
+    endif()
+    list(APPEND _command -D "HOST_TEST_DISCOVERY_MODE=${ARG_DISCOVERY_MODE}" -P "${HOST_TEST_DISCOVERY_SCRIPT}")
+  else()
+    set(_command "${CMAKE_COMMAND}" -P "${ARG_DISCOVERY_FILE}")
+    if(ARG_DISCOVERY_MODE STREQUAL "POST_BUILD")
+      # The hash of the discovery parameters changes the build command, so
+      # that the tests are discovered again when the parameters change
+      file(MD5 "${ARG_DISCOVERY_FILE}" _hash)
+      add_custom_command(
+        TARGET "${CMAKE_HOST_TARGET_PREFIX}${TARGET}" POST_BUILD
+        BYPRODUCTS "${ARG_TESTS_FILE}"
+        COMMAND "${CMAKE_COMMAND}" -D "HOST_TEST_DISCOVERY_HASH=${_hash}" -P "${ARG_DISCOVERY_FILE}"
+        VERBATIM
+      )
+    endif()
+  endif()
+
+  if(ARG_DISCOVERY_MODE STREQUAL "PRE_TEST" OR CMAKE_HOST_TEST_DISCOVERY_DRIVER)
+    list(JOIN _command "\" \"" _command)
+    string(CONCAT _content
+      "if(EXISTS \"${ARG_EXECUTABLE}\")\n"
+      "  if(NOT EXISTS \"${ARG_TESTS_FILE}\" OR\n"
+      "     NOT \"${ARG_TESTS_FILE}\" IS_NEWER_THAN \"${ARG_EXECUTABLE}\" OR\n"
+      "     NOT \"${ARG_TESTS_FILE}\" IS_NEWER_THAN \"${ARG_DISCOVERY_FILE}\")\n"
+      "    execute_process(\n"
+      "      COMMAND \"${_command}\"\n"
+      "      RESULT_VARIABLE result\n"
+      "    )\n"
+      "    if(NOT result EQUAL 0)\n"
+      "      message(FATAL_ERROR \"Failed to discover the tests of ${ARG_EXECUTABLE}\")\n"
+      "    endif()\n"
+      "  endif()\n"
+      "  include(\"${ARG_TESTS_FILE}\")\n"
+      "else()\n"
+      "  add_test(${TARGET}_NOT_BUILT ${TARGET}_NOT_BUILT)\n"
+      "endif()\n"
+    )
+  else()
+    string(CONCAT _content
+      "if(EXISTS \"${ARG_TESTS_FILE}\")\n"
+      "  include(\"${ARG_TESTS_FILE}\")\n"
+      "else()\n"
+      "  add_test(${TARGET}_NOT_BUILT ${TARGET}_NOT_BUILT)\n"
+      "endif()\n"
+    )
+  endif()
+  file(WRITE "${ARG_INCLUDE_FILE}" "${_content}")
+endfunction(add_host_test_discovery)
+
 set(UNITY_FIXTURE_DISCOVER_HOST_TESTS_SCRIPT
   ${CMAKE_CURRENT_LIST_DIR}/UnityFixtureAddTests.cmake
 )
@@ -131,6 +418,8 @@ function(unity_fixture_discover_host_tests TARGET)
     return()
   endif()
 
+  start_host_profile(_profile_start)
+
   # Remove the host namespace prefix if exists
   remove_host_namespace_prefix(TARGET "${TARGET}")
 
@@ -139,7 +428,7 @@ function(unity_fixture_discover_host_tests TARGET)
     OUTPUT_NAME _output
   )
 
-  set(oneValueArgs PREFIX WORKING_DIRECTORY TEST_LIST DISCOVERY_TIMEOUT)
+  set(oneValueArgs PREFIX WORKING_DIRECTORY TEST_LIST DISCOVERY_TIMEOUT DISCOVERY_MODE)
   set(multiValueArgs EXTRA_ARGS PROPERTIES)
   cmake_parse_arguments(ARG "" "${oneValueArgs}" "${multiValueArgs}" ${ARGN})
 
@@ -152,6 +441,15 @@ function(unity_fixture_discover_host_tests TARGET)
   if(NOT ARG_DISCOVERY_TIMEOUT)
     set(ARG_DISCOVERY_TIMEOUT 5)
   endif()
+  if(NOT ARG_DISCOVERY_MODE)
+    set(ARG_DISCOVERY_MODE ${CMAKE_HOST_TEST_DISCOVERY_MODE})
+  endif()
+  if(NOT ARG_DISCOVERY_MODE)
+    set(ARG_DISCOVERY_MODE POST_BUILD)
+  endif()
+  if(NOT ARG_DISCOVERY_MODE MATCHES "^(POST_BUILD|PRE_TEST)$")
+    host_logging_error("DISCOVERY_MODE must be one of POST_BUILD or PRE_TEST: ${ARG_DISCOVERY_MODE}")
+  endif()
 
   get_property(
     has_counter
@@ -178,44 +476,88 @@ function(unity_fixture_discover_host_tests TARGET)
   set(ctest_file_base "${CMAKE_CURRENT_BINARY_DIR}/${TARGET}[${counter}]")
   set(ctest_include_file "${ctest_file_base}_include.cmake")
   set(ctest_tests_file "${ctest_file_base}_tests.cmake")
-  add_custom_command(
-    TARGET "${CMAKE_HOST_TARGET_PREFIX}${TARGET}" POST_BUILD
-    BYPRODUCTS "${ctest_tests_file}"
-    COMMAND "${CMAKE_COMMAND}"
-            -D "TEST_TARGET=${CMAKE_HOST_TARGET_PREFIX}${TARGET}"
-            -D "TEST_EXECUTABLE=${_output}"
-            -D "TEST_WORKING_DIRECTORY=${ARG_WORKING_DIRECTORY}"
-            -D "TEST_EXTRA_ARGS=${ARG_EXTRA_ARGS}"
-            -D "TEST_PROPERTIES=${ARG_PROPERTIES}"
-            -D "TEST_PREFIX=${ARG_PREFIX}"
-            -D "TEST_LIST=${ARG_TEST_LIST}"
-            -D "CTEST_FILE=${ctest_tests_file}"
-            -D "TEST_DISCOVERY_TIMEOUT=${ARG_DISCOVERY_TIMEOUT}"
-            -P "${UNITY_FIXTURE_DISCOVER_HOST_TESTS_SCRIPT}"
-    VERBATIM
+  set(ctest_discovery_file "${ctest_file_base}_discovery.cmake")
+
+  # Parameters of the discovery script
+  set(TEST_TARGET "${CMAKE_HOST_TARGET_PREFIX}${TARGET}")
+  set(TEST_EXECUTABLE "${_output}")
+  set(TEST_WORKING_DIRECTORY "${ARG_WORKING_DIRECTORY}")
+  set(TEST_EXTRA_ARGS "${ARG_EXTRA_ARGS}")
+  set(TEST_PROPERTIES "${ARG_PROPERTIES}")
+  set(TEST_PREFIX "${ARG_PREFIX}")
+  set(TEST_LIST "${ARG_TEST_LIST}")
+  set(CTEST_FILE "${ctest_tests_file}")
+  set(TEST_DISCOVERY_TIMEOUT "${ARG_DISCOVERY_TIMEOUT}")
+  set(TEST_DRY_RUN_FILE "${ctest_file_base}_dry_run.cmake")
+  write_host_test_discovery_file("${ctest_discovery_file}" "${UNITY_FIXTURE_DISCOVER_HOST_TESTS_SCRIPT}"
+    TEST_TARGET TEST_EXECUTABLE TEST_WORKING_DIRECTORY TEST_EXTRA_ARGS
+    TEST_PROPERTIES TEST_PREFIX TEST_LIST CTEST_FILE TEST_DISCOVERY_TIMEOUT
+    TEST_DRY_RUN_FILE
   )
 
-  file(WRITE "${ctest_include_file}"
-    "if(EXISTS \"${ctest_tests_file}\")\n"
-    "  include(\"${ctest_tests_file}\")\n"
-    "else()\n"
-    "  add_test(${TARGET}_NOT_BUILT ${TARGET}_NOT_BUILT)\n"
-    "endif()\n"
+  add_host_test_discovery(${TARGET}
+    EXECUTABLE "${_output}"
+    INCLUDE_FILE "${ctest_include_file}"
+    TESTS_FILE "${ctest_tests_file}"
+    DISCOVERY_FILE "${ctest_discovery_file}"
+    DISCOVERY_MODE ${ARG_DISCOVERY_MODE}
+    DISCOVERY_TIMEOUT ${ARG_DISCOVERY_TIMEOUT}
   )
 
   # Add discovered tests to directory TEST_INCLUDE_FILES
   set_property(DIRECTORY
     APPEND PROPERTY TEST_INCLUDE_FILES "${ctest_include_file}"
   )
+
+  stop_host_profile(unity_fixture_discover_host_tests "${_profile_start}" TARGET ${TARGET})
 endfunction(unity_fixture_discover_host_tests)
 
+# Register the given GoogleTest executable as SHARDS tests, each of which runs
+# one shard of the test cases selected by GoogleTest itself
+function(add_host_gtest_shards TARGET)
+  set(oneValueArgs EXECUTABLE PREFIX SHARDS WORKING_DIRECTORY)
+  set(multiValueArgs EXTRA_ARGS PROPERTIES)
+  cmake_parse_arguments(ARG "" "${oneValueArgs}" "${multiValueArgs}" ${ARGN})
+
+  if(NOT ARG_SHARDS MATCHES "^[1-9][0-9]*$")
+    host_logging_error("SHARDS requires a positive integer: ${ARG_SHARDS}")
+  endif()
+  if(NOT ARG_WORKING_DIRECTORY)
+    set(ARG_WORKING_DIRECTORY "${CMAKE_CURRENT_BINARY_DIR}")
+  endif()
+
+  math(EXPR _last "${ARG_SHARDS} - 1")
+  foreach(_index RANGE ${_last})
+    math(EXPR _shard "${_index} + 1")
+    set(_test_name ${ARG_PREFIX}${TARGET}.shard${_shard})
+    add_test(NAME ${_test_name}
+      COMMAND ${CMAKE_COMMAND}
+        -D "TEST_FRAMEWORK=GTEST"
+        -D "TEST_EXECUTABLE=${ARG_EXECUTABLE}"
+        -D "TEST_OUTPUT=${CMAKE_CURRENT_BINARY_DIR}/${TARGET}.shard${_shard}.xml"
+        -P "${HOST_TEST_BATCH_SCRIPT}"
+        -- ${ARG_EXTRA_ARGS}
+      WORKING_DIRECTORY "${ARG_WORKING_DIRECTORY}"
+    )
+    if(ARG_PROPERTIES)
+      set_tests_properties(${_test_name} PROPERTIES ${ARG_PROPERTIES})
+    endif()
+    set_property(TEST ${_test_name} APPEND PROPERTY ENVIRONMENT
+      GTEST_TOTAL_SHARDS=${ARG_SHARDS}
+      GTEST_SHARD_INDEX=${_index}
+    )
+  endforeach()
+endfunction(add_host_gtest_shards)
+
 function(gtest_add_host_tests TARGET)
   # Assume that enable_testing() is called
   if(NOT CMAKE_TESTING_ENABLED)
     return()
   endif()
 
-  set(oneValueArgs PREFIX)
+  start_host_profile(_profile_start)
+
+  set(oneValueArgs PREFIX SHARDS)
   set(multiValueArgs EXTRA_ARGS)
   cmake_parse_arguments(ARG "" "${oneValueArgs}" "${multiValueArgs}" ${ARGN})
 
@@ -239,6 +581,18 @@ function(gtest_add_host_tests TARGET)
     endif()
   endforeach()
 
+  # Run the shards of the executable instead of each test case
+  if(DEFINED ARG_SHARDS)
+    add_host_gtest_shards(${TARGET}
+      EXECUTABLE ${_output}
+      PREFIX "${ARG_PREFIX}"
+      SHARDS ${ARG_SHARDS}
+      EXTRA_ARGS ${ARG_EXTRA_ARGS}
+    )
+    stop_host_profile(gtest_add_host_tests "${_profile_start}" TARGET ${TARGET})
+    return()
+  endif()
+
   # Use gtest_add_tests
   include(GoogleTest)
   # Set TEST_PREFIX conditionally to avoid warnings on CMake 3.31.0 or later
@@ -258,6 +612,8 @@ function(gtest_add_host_tests TARGET)
       ${ARGN}
     )
   endif()
+
+  stop_host_profile(gtest_add_host_tests "${_profile_start}" TARGET ${TARGET})
 endfunction(gtest_add_host_tests)
 
 set(GOOGLETEST_DISCOVER_HOST_TESTS_SCRIPT
@@ -270,6 +626,8 @@ function(gtest_discover_host_tests TARGET)
     return()
   endif()
 
+  start_host_profile(_profile_start)
+
   # Remove the host namespace prefix if exists
   remove_host_namespace_prefix(TARGET "${TARGET}")
 
@@ -279,19 +637,43 @@ function(gtest_discover_host_tests TARGET)
   )
 
   set(options NO_PRETTY_TYPES NO_PRETTY_VALUES)
-  set(oneValueArgs PREFIX WORKING_DIRECTORY TEST_LIST DISCOVERY_TIMEOUT)
+  set(oneValueArgs PREFIX WORKING_DIRECTORY TEST_LIST DISCOVERY_TIMEOUT DISCOVERY_MODE SHARDS)
   set(multiValueArgs EXTRA_ARGS PROPERTIES)
   cmake_parse_arguments(ARG "${options}" "${oneValueArgs}" "${multiValueArgs}" ${ARGN})
 
   if(NOT ARG_WORKING_DIRECTORY)
     set(ARG_WORKING_DIRECTORY "${CMAKE_CURRENT_BINARY_DIR}")
   endif()
+
+  # The shards need no discovery, since GoogleTest selects their test cases
+  if(DEFINED ARG_SHARDS)
+    add_host_gtest_shards(${TARGET}
+      EXECUTABLE ${_output}
+      PREFIX "${ARG_PREFIX}"
+      SHARDS ${ARG_SHARDS}
+      WORKING_DIRECTORY "${ARG_WORKING_DIRECTORY}"
+      EXTRA_ARGS ${ARG_EXTRA_ARGS}
+      PROPERTIES ${ARG_PROPERTIES}
+    )
+    stop_host_profile(gtest_discover_host_tests "${_profile_start}" TARGET ${TARGET})
+    return()
+  endif()
+
   if(NOT ARG_TEST_LIST)
     set(ARG_TEST_LIST ${TARGET}_TESTS)
   endif()
   if(NOT ARG_DISCOVERY_TIMEOUT)
     set(ARG_DISCOVERY_TIMEOUT 5)
   endif()
+  if(NOT ARG_DISCOVERY_MODE)
+    set(ARG_DISCOVERY_MODE ${CMAKE_HOST_TEST_DISCOVERY_MODE})
+  endif()
+  if(NOT ARG_DISCOVERY_MODE)
+    set(ARG_DISCOVERY_MODE POST_BUILD)
+  endif()
+  if(NOT ARG_DISCOVERY_MODE MATCHES "^(POST_BUILD|PRE_TEST)$")
+    host_logging_error("DISCOVERY_MODE must be one of POST_BUILD or PRE_TEST: ${ARG_DISCOVERY_MODE}")
+  endif()
 
   get_property(
     has_counter
@@ -318,41 +700,45 @@ function(gtest_discover_host_tests TARGET)
   set(ctest_file_base "${CMAKE_CURRENT_BINARY_DIR}/${TARGET}[${counter}]")
   set(ctest_include_file "${ctest_file_base}_include.cmake")
   set(ctest_tests_file "${ctest_file_base}_tests.cmake")
-  add_custom_command(
-    TARGET "${CMAKE_HOST_TARGET_PREFIX}${TARGET}" POST_BUILD
-    BYPRODUCTS "${ctest_tests_file}"
-    COMMAND "${CMAKE_COMMAND}"
-            -D "TEST_TARGET=${CMAKE_HOST_TARGET_PREFIX}${TARGET}"
-            -D "TEST_EXECUTABLE=${_output}"
-            # NOTE: the upstream GoogleTestAddTests.cmake script expects the key
-            # TEST_WORKING_DIR (not TEST_WORKING_DIRECTORY, which the Unity and
-            # CppUTest discovery scripts use). Do not rename this to match the
-            # others -- the stock CMake module reads this exact name.
-            -D "TEST_WORKING_DIR=${ARG_WORKING_DIRECTORY}"
-            -D "TEST_EXTRA_ARGS=${ARG_EXTRA_ARGS}"
-            -D "TEST_PROPERTIES=${ARG_PROPERTIES}"
-            -D "TEST_PREFIX=${ARG_PREFIX}"
-            -D "NO_PRETTY_TYPES=${ARG_NO_PRETTY_TYPES}"
-            -D "NO_PRETTY_VALUES=${ARG_NO_PRETTY_VALUES}"
-            -D "TEST_LIST=${ARG_TEST_LIST}"
-            -D "CTEST_FILE=${ctest_tests_file}"
-            -D "TEST_DISCOVERY_TIMEOUT=${ARG_DISCOVERY_TIMEOUT}"
-            -P "${GOOGLETEST_DISCOVER_HOST_TESTS_SCRIPT}"
-    VERBATIM
+  set(ctest_discovery_file "${ctest_file_base}_discovery.cmake")
+
+  # Parameters of the discovery script
+  set(TEST_TARGET "${CMAKE_HOST_TARGET_PREFIX}${TARGET}")
+  set(TEST_EXECUTABLE "${_output}")
+  # NOTE: the upstream GoogleTestAddTests.cmake script expects the key
+  # TEST_WORKING_DIR (not TEST_WORKING_DIRECTORY, which the Unity and
+  # CppUTest discovery scripts use). Do not rename this to match the
+  # others -- the stock CMake module reads this exact name.
+  set(TEST_WORKING_DIR "${ARG_WORKING_DIRECTORY}")
+  set(TEST_EXTRA_ARGS "${ARG_EXTRA_ARGS}")
+  set(TEST_PROPERTIES "${ARG_PROPERTIES}")
+  set(TEST_PREFIX "${ARG_PREFIX}")
+  set(NO_PRETTY_TYPES "${ARG_NO_PRETTY_TYPES}")
+  set(NO_PRETTY_VALUES "${ARG_NO_PRETTY_VALUES}")
+  set(TEST_LIST "${ARG_TEST_LIST}")
+  set(CTEST_FILE "${ctest_tests_file}")
+  set(TEST_DISCOVERY_TIMEOUT "${ARG_DISCOVERY_TIMEOUT}")
+  write_host_test_discovery_file("${ctest_discovery_file}" "${GOOGLETEST_DISCOVER_HOST_TESTS_SCRIPT}"
+    TEST_TARGET TEST_EXECUTABLE TEST_WORKING_DIR TEST_EXTRA_ARGS
+    TEST_PROPERTIES TEST_PREFIX NO_PRETTY_TYPES NO_PRETTY_VALUES TEST_LIST
+    CTEST_FILE TEST_DISCOVERY_TIMEOUT
   )
 
-  file(WRITE "${ctest_include_file}"
-    "if(EXISTS \"${ctest_tests_file}\")\n"
-    "  include(\"${ctest_tests_file}\")\n"
-    "else()\n"
-    "  add_test(${TARGET}_NOT_BUILT ${TARGET}_NOT_BUILT)\n"
-    "endif()\n"
+  add_host_test_discovery(${TARGET}
+    EXECUTABLE "${_output}"
+    INCLUDE_FILE "${ctest_include_file}"
+    TESTS_FILE "${ctest_tests_file}"
+    DISCOVERY_FILE "${ctest_discovery_file}"
+    DISCOVERY_MODE ${ARG_DISCOVERY_MODE}
+    DISCOVERY_TIMEOUT ${ARG_DISCOVERY_TIMEOUT}
   )
 
   # Add discovered tests to directory TEST_INCLUDE_FILES
   set_property(DIRECTORY
     APPEND PROPERTY TEST_INCLUDE_FILES "${ctest_include_file}"
   )
+
+  stop_host_profile(gtest_discover_host_tests "${_profile_start}" TARGET ${TARGET})
 endfunction(gtest_discover_host_tests)
 
 function(cpputest_add_host_tests TARGET)
@@ -361,7 +747,9 @@ function(cpputest_add_host_tests TARGET)
     return()
   endif()
 
-  set(oneValueArgs PREFIX)
+  start_host_profile(_profile_start)
+
+  set(oneValueArgs PREFIX SHARDS BATCH_SIZE)
   set(multiValueArgs EXTRA_ARGS)
   cmake_parse_arguments(ARG "" "${oneValueArgs}" "${multiValueArgs}" ${ARGN})
 
@@ -392,8 +780,11 @@ function(cpputest_add_host_tests TARGET)
   set(cpputest_test_type_regex "([^A-Za-z_0-9](IGNORE_)?TEST)")
 
   set(added_tests)
+  set(batch_tests)
   foreach(source IN LISTS sources)
+    start_host_profile(_read_start)
     file(READ "${source}" contents)
+    stop_host_profile("file(READ)" "${_read_start}")
 
     string(REGEX REPLACE "//[^\r\n]*" "" contents "${contents}")
     string(REGEX REPLACE "/\\*([^*]|\\*+[^*/])*\\*/" "" contents "${contents}")
@@ -409,6 +800,15 @@ function(cpputest_add_host_tests TARGET)
         continue()
       endif()
 
+      # Collect the runnable tests to be added as batches
+      if(DEFINED ARG_SHARDS OR DEFINED ARG_BATCH_SIZE)
+        list(APPEND added_tests ${cpputest_test_name})
+        if(NOT hit MATCHES "IGNORE_TEST")
+          list(APPEND batch_tests ${cpputest_test_name})
+        endif()
+        continue()
+      endif()
+
       set(ctest_test_name ${ARG_PREFIX}${cpputest_test_name})
       add_test(NAME ${ctest_test_name} COMMAND ${_output} -sg ${cpputest_test_group} -sn ${cpputest_test_case} ${ARG_EXTRA_ARGS})
       list(APPEND added_tests ${cpputest_test_name})
@@ -418,6 +818,25 @@ function(cpputest_add_host_tests TARGET)
       endif()
     endforeach()
   endforeach()
+
+  if(DEFINED ARG_SHARDS OR DEFINED ARG_BATCH_SIZE)
+    unset(_batch_options)
+    foreach(_arg SHARDS BATCH_SIZE)
+      if(DEFINED ARG_${_arg})
+        list(APPEND _batch_options ${_arg} ${ARG_${_arg}})
+      endif()
+    endforeach()
+    add_host_test_batches(${TARGET}
+      FRAMEWORK CPPUTEST
+      EXECUTABLE ${_output}
+      PREFIX "${ARG_PREFIX}"
+      ${_batch_options}
+      TESTS ${batch_tests}
+      EXTRA_ARGS ${ARG_EXTRA_ARGS}
+    )
+  endif()
+
+  stop_host_profile(cpputest_add_host_tests "${_profile_start}" TARGET ${TARGET})
 endfunction(cpputest_add_host_tests)
 
 set(CPPUTEST_DISCOVER_HOST_TESTS_SCRIPT
@@ -430,6 +849,8 @@ function(cpputest_discover_host_tests TARGET)
     return()
   endif()
 
+  start_host_profile(_profile_start)
+
   # Remove the host namespace prefix if exists
   remove_host_namespace_prefix(TARGET "${TARGET}")
 
@@ -438,7 +859,7 @@ function(cpputest_discover_host_tests TARGET)
     OUTPUT_NAME _output
   )
 
-  set(oneValueArgs PREFIX WORKING_DIRECTORY TEST_LIST DISCOVERY_TIMEOUT)
+  set(oneValueArgs PREFIX WORKING_DIRECTORY TEST_LIST DISCOVERY_TIMEOUT DISCOVERY_MODE)
   set(multiValueArgs EXTRA_ARGS PROPERTIES)
   cmake_parse_arguments(ARG "" "${oneValueArgs}" "${multiValueArgs}" ${ARGN})
 
@@ -451,6 +872,15 @@ function(cpputest_discover_host_tests TARGET)
   if(NOT ARG_DISCOVERY_TIMEOUT)
     set(ARG_DISCOVERY_TIMEOUT 5)
   endif()
+  if(NOT ARG_DISCOVERY_MODE)
+    set(ARG_DISCOVERY_MODE ${CMAKE_HOST_TEST_DISCOVERY_MODE})
+  endif()
+  if(NOT ARG_DISCOVERY_MODE)
+    set(ARG_DISCOVERY_MODE POST_BUILD)
+  endif()
+  if(NOT ARG_DISCOVERY_MODE MATCHES "^(POST_BUILD|PRE_TEST)$")
+    host_logging_error("DISCOVERY_MODE must be one of POST_BUILD or PRE_TEST: ${ARG_DISCOVERY_MODE}")
+  endif()
 
   get_property(
     has_counter
@@ -477,33 +907,36 @@ function(cpputest_discover_host_tests TARGET)
   set(ctest_file_base "${CMAKE_CURRENT_BINARY_DIR}/${TARGET}[${counter}]")
   set(ctest_include_file "${ctest_file_base}_include.cmake")
   set(ctest_tests_file "${ctest_file_base}_tests.cmake")
-  add_custom_command(
-    TARGET "${CMAKE_HOST_TARGET_PREFIX}${TARGET}" POST_BUILD
-    BYPRODUCTS "${ctest_tests_file}"
-    COMMAND "${CMAKE_COMMAND}"
-            -D "TEST_TARGET=${CMAKE_HOST_TARGET_PREFIX}${TARGET}"
-            -D "TEST_EXECUTABLE=${_output}"
-            -D "TEST_WORKING_DIRECTORY=${ARG_WORKING_DIRECTORY}"
-            -D "TEST_EXTRA_ARGS=${ARG_EXTRA_ARGS}"
-            -D "TEST_PROPERTIES=${ARG_PROPERTIES}"
-            -D "TEST_PREFIX=${ARG_PREFIX}"
-            -D "TEST_LIST=${ARG_TEST_LIST}"
-            -D "CTEST_FILE=${ctest_tests_file}"
-            -D "TEST_DISCOVERY_TIMEOUT=${ARG_DISCOVERY_TIMEOUT}"
-            -P "${CPPUTEST_DISCOVER_HOST_TESTS_SCRIPT}"
-    VERBATIM
+  set(ctest_discovery_file "${ctest_file_base}_discovery.cmake")
+
+  # Parameters of the discovery script
+  set(TEST_TARGET "${CMAKE_HOST_TARGET_PREFIX}${TARGET}")
+  set(TEST_EXECUTABLE "${_output}")
+  set(TEST_WORKING_DIRECTORY "${ARG_WORKING_DIRECTORY}")
+  set(TEST_EXTRA_ARGS "${ARG_EXTRA_ARGS}")
+  set(TEST_PROPERTIES "${ARG_PROPERTIES}")
+  set(TEST_PREFIX "${ARG_PREFIX}")
+  set(TEST_LIST "${ARG_TEST_LIST}")
+  set(CTEST_FILE "${ctest_tests_file}")
+  set(TEST_DISCOVERY_TIMEOUT "${ARG_DISCOVERY_TIMEOUT}")
+  write_host_test_discovery_file("${ctest_discovery_file}" "${CPPUTEST_DISCOVER_HOST_TESTS_SCRIPT}"
+    TEST_TARGET TEST_EXECUTABLE TEST_WORKING_DIRECTORY TEST_EXTRA_ARGS
+    TEST_PROPERTIES TEST_PREFIX TEST_LIST CTEST_FILE TEST_DISCOVERY_TIMEOUT
   )
 
-  file(WRITE "${ctest_include_file}"
-    "if(EXISTS \"${ctest_tests_file}\")\n"
-    "  include(\"${ctest_tests_file}\")\n"
-    "else()\n"
-    "  add_test(${TARGET}_NOT_BUILT ${TARGET}_NOT_BUILT)\n"
-    "endif()\n"
+  add_host_test_discovery(${TARGET}
+    EXECUTABLE "${_output}"
+    INCLUDE_FILE "${ctest_include_file}"
+    TESTS_FILE "${ctest_tests_file}"
+    DISCOVERY_FILE "${ctest_discovery_file}"
+    DISCOVERY_MODE ${ARG_DISCOVERY_MODE}
+    DISCOVERY_TIMEOUT ${ARG_DISCOVERY_TIMEOUT}
   )
 
   # Add discovered tests to directory TEST_INCLUDE_FILES
   set_property(DIRECTORY
     APPEND PROPERTY TEST_INCLUDE_FILES "${ctest_include_file}"
   )
+
+  stop_host_profile(cpputest_discover_host_tests "${_profile_start}" TARGET ${TARGET})
 endfunction(cpputest_discover_host_tests)
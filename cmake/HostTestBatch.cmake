@@ -0,0 +1,170 @@
+# Copyright (c) 2026 LG Electronics Inc.
+# SPDX-License-Identifier: MIT
+
+# Run a batch of Unity Fixture, CppUTest or GoogleTest test cases in as few
+# processes as possible (see unity_fixture_add_host_tests,
+# cpputest_add_host_tests and gtest_add_host_tests).
+#
+# Usage:
+#   cmake -DTEST_FRAMEWORK=<UNITY_FIXTURE|CPPUTEST> -DTEST_EXECUTABLE=<path>
+#         -DTEST_GROUPS=<group>,... -DTEST_CASES=<group>.<case>,...
+#         -P HostTestBatch.cmake [-- <extra args>...]
+#   cmake -DTEST_FRAMEWORK=GTEST -DTEST_EXECUTABLE=<path> -DTEST_OUTPUT=<xml>
+#         -P HostTestBatch.cmake [-- <extra args>...]
+#
+# The test groups are selected by the group filters of the framework. Unity
+# Fixture accepts a single group filter, so it runs once per group with the
+# exact group filter, since -g also selects the groups containing the name, or
+# once for all tests if TEST_GROUPS is empty. CppUTest runs all groups at once. The
+# result of each test case is parsed from the verbose output and reported, and
+# the batch fails if any of its test cases failed or the executable failed.
+#
+# GoogleTest selects the test cases of a shard by itself from the
+# GTEST_TOTAL_SHARDS and GTEST_SHARD_INDEX environment variables. The result
+# of each test case of the shard is read from the XML report in TEST_OUTPUT.
+
+# Collect the extra arguments following "--"
+unset(_extra_args)
+set(_found FALSE)
+math(EXPR _last "${CMAKE_ARGC} - 1")
+foreach(_index RANGE ${_last})
+  if(_found)
+    list(APPEND _extra_args "${CMAKE_ARGV${_index}}")
+  elseif("${CMAKE_ARGV${_index}}" STREQUAL "--")
+    set(_found TRUE)
+  endif()
+endforeach()
+
+if(NOT EXISTS "${TEST_EXECUTABLE}")
+  message(FATAL_ERROR
+    "Specified test executable does not exist.\n"
+    "  Path: '${TEST_EXECUTABLE}'"
+  )
+endif()
+
+string(REPLACE "," ";" _groups "${TEST_GROUPS}")
+string(REPLACE "," ";" _cases "${TEST_CASES}")
+
+# Build the arguments of the test runs, separated by "|"
+unset(_runs)
+if(TEST_FRAMEWORK STREQUAL "UNITY_FIXTURE")
+  foreach(_group IN LISTS _groups)
+    list(APPEND _runs "-v|-G|${_group}")
+  endforeach()
+  if(NOT _runs)
+    set(_runs "-v")
+  endif()
+elseif(TEST_FRAMEWORK STREQUAL "CPPUTEST")
+  set(_run "-v")
+  foreach(_group IN LISTS _groups)
+    string(APPEND _run "|-sg|${_group}")
+  endforeach()
+  set(_runs "${_run}")
+elseif(TEST_FRAMEWORK STREQUAL "GTEST")
+  file(REMOVE "${TEST_OUTPUT}")
+  set(_runs "--gtest_output=xml:${TEST_OUTPUT}")
+else()
+  message(FATAL_ERROR "Unsupported test framework: ${TEST_FRAMEWORK}")
+endif()
+
+set(_status 0)
+set(_output "")
+foreach(_run IN LISTS _runs)
+  string(REPLACE "|" ";" _arguments "${_run}")
+  execute_process(
+    COMMAND "${TEST_EXECUTABLE}" ${_arguments} ${_extra_args}
+    OUTPUT_VARIABLE _run_output
+    ERROR_VARIABLE _run_output
+    RESULT_VARIABLE _result
+  )
+  message("${_run_output}")
+  string(APPEND _output "\n${_run_output}")
+  if(NOT _result EQUAL 0)
+    set(_status 1)
+  endif()
+endforeach()
+
+if(TEST_FRAMEWORK STREQUAL "GTEST")
+  # Split the XML report at each test case element
+  unset(_output)
+  if(EXISTS "${TEST_OUTPUT}")
+    file(READ "${TEST_OUTPUT}" _output)
+  endif()
+  string(REGEX REPLACE "[][;]" "_" _output "${_output}")
+  string(REPLACE "<testcase " ";<testcase " _output "${_output}")
+  unset(_found_cases)
+  foreach(_segment IN LISTS _output)
+    if(NOT _segment MATCHES "^<testcase name=\"([^\"]*)\"")
+      continue()
+    endif()
+    set(_case "${CMAKE_MATCH_1}")
+    if(NOT _segment MATCHES " classname=\"([^\"]*)\"")
+      continue()
+    endif()
+    set(_name "${CMAKE_MATCH_1}.${_case}")
+    if(_segment MATCHES "<failure")
+      set(_result "Failed")
+    elseif(_segment MATCHES " status=\"notrun\"| result=\"skipped\"")
+      set(_result "Skipped")
+    else()
+      set(_result "Passed")
+    endif()
+    set(_result_${_name} "${_result}")
+    list(APPEND _found_cases ${_name})
+  endforeach()
+
+  # The test cases of a shard are only known after the run
+  if(NOT _cases)
+    set(_cases ${_found_cases})
+  endif()
+else()
+  # Split the verbose output at the start of each test case, which is printed
+  # as TEST(group, case) or IGNORE_TEST(group, case) at the start of a line
+  string(REGEX REPLACE "[][;]" "_" _output "${_output}")
+  string(REGEX REPLACE "\n((IGNORE_)?TEST\\([A-Za-z_0-9]+, [A-Za-z_0-9]+\\))" "\n;\\1" _output "${_output}")
+  string(REPLACE "\n" " " _output "${_output}")
+  foreach(_segment IN LISTS _output)
+    if(NOT _segment MATCHES "^(IGNORE_)?TEST\\(([A-Za-z_0-9]+), ([A-Za-z_0-9]+)\\)(.*)$")
+      continue()
+    endif()
+    set(_name "${CMAKE_MATCH_2}.${CMAKE_MATCH_3}")
+    set(_rest "${CMAKE_MATCH_4}")
+    if(CMAKE_MATCH_1 OR _rest MATCHES ":IGNORE")
+      set(_result "Skipped")
+    elseif(TEST_FRAMEWORK STREQUAL "UNITY_FIXTURE" AND _rest MATCHES "^ PASS")
+      set(_result "Passed")
+    elseif(TEST_FRAMEWORK STREQUAL "CPPUTEST" AND _rest MATCHES "^ - [0-9]+ ms" AND NOT _rest MATCHES "Failure in")
+      set(_result "Passed")
+    else()
+      set(_result "Failed")
+    endif()
+    set(_result_${_name} "${_result}")
+  endforeach()
+endif()
+
+# Report the result of each test case of the batch
+set(_passed 0)
+set(_skipped 0)
+set(_failed 0)
+set(_not_run 0)
+foreach(_case IN LISTS _cases)
+  if(NOT DEFINED _result_${_case})
+    # Test cases not reached by the runner, for example due to conditional
+    # compilation, fail the batch only through the exit code
+    set(_result_${_case} "Not Run")
+    math(EXPR _not_run "${_not_run} + 1")
+  elseif(_result_${_case} STREQUAL "Passed")
+    math(EXPR _passed "${_passed} + 1")
+  elseif(_result_${_case} STREQUAL "Skipped")
+    math(EXPR _skipped "${_skipped} + 1")
+  else()
+    math(EXPR _failed "${_failed} + 1")
+    set(_status 1)
+  endif()
+  message(STATUS "${_case} ... ${_result_${_case}}")
+endforeach()
+message(STATUS "${_passed} passed, ${_skipped} skipped, ${_failed} failed, ${_not_run} not run")
+
+if(NOT _status EQUAL 0)
+  message(FATAL_ERROR "Test batch failed: ${TEST_EXECUTABLE}")
+endif()
@@ -0,0 +1,150 @@
+# Copyright (c) 2026 LG Electronics Inc.
+# SPDX-License-Identifier: MIT
+
+# Run the stale test discoveries of all test executables concurrently (see
+# CMAKE_HOST_TEST_DISCOVERY_DRIVER).
+#
+# Usage:
+#   cmake -DHOST_TEST_DISCOVERY_REGISTRY=<file> -DHOST_TEST_DISCOVERY_MODE=<mode>
+#         [-DHOST_TEST_DISCOVERY_JOBS=<count>] -P HostTestDiscovery.cmake
+#   cmake -DHOST_TEST_DISCOVERY_FILE=<file> -DHOST_TEST_DISCOVERY_TIMEOUT=<second>
+#         -P HostTestDiscovery.cmake
+#
+# The registry lists a discovery per line as
+# <mode>|<discovery file>|<tests file>|<executable>|<timeout>. A discovery is
+# stale if its tests file is older than the executable or the discovery file.
+# Up to HOST_TEST_DISCOVERY_JOBS workers run concurrently within a single
+# execute_process() call. Each worker runs one discovery file within its
+# timeout, and writes the output, the result and the elapsed time next to it,
+# since only the output of the last command of execute_process() can be
+# captured.
+
+function(get_host_test_discovery_timestamp OUTPUT)
+  # Fractional seconds are supported by CMake 3.23 or higher
+  if(CMAKE_VERSION VERSION_LESS 3.23)
+    string(TIMESTAMP _seconds "%s" UTC)
+    set(${OUTPUT} "${_seconds}000000" PARENT_SCOPE)
+  else()
+    string(TIMESTAMP _microseconds "%s%f" UTC)
+    set(${OUTPUT} "${_microseconds}" PARENT_SCOPE)
+  endif()
+endfunction(get_host_test_discovery_timestamp)
+
+if(HOST_TEST_DISCOVERY_FILE)
+  get_host_test_discovery_timestamp(_start)
+  execute_process(
+    COMMAND "${CMAKE_COMMAND}" -P "${HOST_TEST_DISCOVERY_FILE}"
+    TIMEOUT ${HOST_TEST_DISCOVERY_TIMEOUT}
+    OUTPUT_FILE "${HOST_TEST_DISCOVERY_FILE}.log"
+    ERROR_FILE "${HOST_TEST_DISCOVERY_FILE}.log"
+    RESULT_VARIABLE _result
+  )
+  get_host_test_discovery_timestamp(_stop)
+  math(EXPR _elapsed "${_stop} - ${_start}")
+  file(WRITE "${HOST_TEST_DISCOVERY_FILE}.result"
+    "set(_result [==[${_result}]==])\n"
+    "set(_elapsed ${_elapsed})\n"
+  )
+  return()
+endif()
+
+if(NOT EXISTS "${HOST_TEST_DISCOVERY_REGISTRY}")
+  return()
+endif()
+
+set(_jobs "${HOST_TEST_DISCOVERY_JOBS}")
+if(NOT _jobs)
+  cmake_host_system_information(RESULT _jobs QUERY NUMBER_OF_LOGICAL_CORES)
+endif()
+if(NOT _jobs GREATER 0)
+  set(_jobs 1)
+endif()
+
+# Gather the stale discoveries of the executables built so far
+file(STRINGS "${HOST_TEST_DISCOVERY_REGISTRY}" _entries)
+unset(_pending)
+unset(_pending_files)
+set(_index 0)
+foreach(_entry IN LISTS _entries)
+  math(EXPR _index "${_index} + 1")
+  string(REPLACE "|" ";" _entry "${_entry}")
+  list(GET _entry 0 _mode)
+  list(GET _entry 1 _discovery_file_${_index})
+  list(GET _entry 2 _tests_file)
+  list(GET _entry 3 _executable_${_index})
+  list(GET _entry 4 _timeout_${_index})
+  set(_discovery_file "${_discovery_file_${_index}}")
+  set(_executable "${_executable_${_index}}")
+  if(NOT _mode STREQUAL HOST_TEST_DISCOVERY_MODE OR NOT EXISTS "${_executable}")
+    continue()
+  endif()
+  if(EXISTS "${_tests_file}" AND
+     "${_tests_file}" IS_NEWER_THAN "${_executable}" AND
+     "${_tests_file}" IS_NEWER_THAN "${_discovery_file}")
+    continue()
+  endif()
+  list(FIND _pending_files "${_discovery_file}" _found)
+  if(_found EQUAL -1)
+    list(APPEND _pending_files "${_discovery_file}")
+    list(APPEND _pending ${_index})
+  endif()
+endforeach()
+if(NOT _pending)
+  return()
+endif()
+
+get_host_test_discovery_timestamp(_start)
+set(_count 0)
+set(_failed FALSE)
+while(_pending)
+  unset(_commands)
+  unset(_batch)
+  while(_pending)
+    list(LENGTH _batch _length)
+    if(NOT _length LESS _jobs)
+      break()
+    endif()
+    list(GET _pending 0 _index)
+    list(REMOVE_AT _pending 0)
+    set(_discovery_file "${_discovery_file_${_index}}")
+    file(REMOVE "${_discovery_file}.log" "${_discovery_file}.result")
+    list(APPEND _commands COMMAND "${CMAKE_COMMAND}"
+      -D "HOST_TEST_DISCOVERY_FILE=${_discovery_file}"
+      -D "HOST_TEST_DISCOVERY_TIMEOUT=${_timeout_${_index}}"
+      -P "${CMAKE_CURRENT_LIST_FILE}"
+    )
+    list(APPEND _batch ${_index})
+  endwhile()
+
+  execute_process(${_commands} OUTPUT_QUIET ERROR_QUIET)
+
+  # Report the result and the discovery time of each executable
+  foreach(_index IN LISTS _batch)
+    set(_discovery_file "${_discovery_file_${_index}}")
+    set(_executable "${_executable_${_index}}")
+    set(_result "Worker did not finish")
+    set(_elapsed 0)
+    include("${_discovery_file}.result" OPTIONAL)
+    math(EXPR _milliseconds "${_elapsed} / 1000")
+    math(EXPR _count "${_count} + 1")
+    if("${_result}" STREQUAL "0")
+      message(STATUS "Discovering tests in ${_executable} - done (${_milliseconds} ms)")
+    else()
+      set(_failed TRUE)
+      unset(_output)
+      if(EXISTS "${_discovery_file}.log")
+        file(READ "${_discovery_file}.log" _output)
+      endif()
+      message(STATUS "Discovering tests in ${_executable} - failed (${_milliseconds} ms)")
+      message(NOTICE "${_output}${_result}")
+    endif()
+  endforeach()
+endwhile()
+
+get_host_test_discovery_timestamp(_stop)
+math(EXPR _milliseconds "(${_stop} - ${_start}) / 1000")
+message(STATUS "Discovered tests of ${_count} executables with ${_jobs} jobs in ${_milliseconds} ms")
+
+if(_failed)
+  message(FATAL_ERROR "Failed to discover the tests of some executables")
+endif()
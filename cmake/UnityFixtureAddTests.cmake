@@ -23,27 +23,54 @@ if(NOT EXISTS "${TEST_EXECUTABLE}")
   )
 endif()
 
-# Check if the test executable supports dry-run mode
-execute_process(
-  COMMAND "${TEST_EXECUTABLE}" -h
-  WORKING_DIRECTORY "${TEST_WORKING_DIRECTORY}"
-  TIMEOUT ${TEST_DISCOVERY_TIMEOUT}
-  OUTPUT_VARIABLE output
-  RESULT_VARIABLE result
-)
-if(NOT output MATCHES "Unity")
-  message(FATAL_ERROR
-    "Error running test executable.\n"
-    "  Path: '${TEST_EXECUTABLE}'\n"
-    "  Result: ${result}\n"
+# Identify the test executable by its size and timestamp
+file(SIZE "${TEST_EXECUTABLE}" executable_size)
+file(TIMESTAMP "${TEST_EXECUTABLE}" executable_timestamp "%Y-%m-%dT%H:%M:%S" UTC)
+set(executable_key "${executable_size};${executable_timestamp}")
+
+# Check if the test executable is a Unity Fixture test which supports the
+# dry-run mode, and record the result for the executable
+function(check_dry_run_support)
+  execute_process(
+    COMMAND "${TEST_EXECUTABLE}" -h
+    WORKING_DIRECTORY "${TEST_WORKING_DIRECTORY}"
+    TIMEOUT ${TEST_DISCOVERY_TIMEOUT}
+    OUTPUT_VARIABLE output
+    RESULT_VARIABLE result
   )
+  if(NOT output MATCHES "Unity")
+    message(FATAL_ERROR
+      "Error running test executable.\n"
+      "  Path: '${TEST_EXECUTABLE}'\n"
+      "  Result: ${result}\n"
+    )
+  endif()
+  if(NOT output MATCHES "-d          Dry run all tests")
+    message(FATAL_ERROR
+      "Missing dry-run option. Upgrade Unity Fixture to the latest version.\n"
+      "  Path: '${TEST_EXECUTABLE}'\n"
+      "  Result: ${result}\n"
+    )
+  endif()
+  if(TEST_DRY_RUN_FILE)
+    file(WRITE "${TEST_DRY_RUN_FILE}" "set(dry_run_executable \"${executable_key}\")\n")
+  endif()
+endfunction(check_dry_run_support)
+
+# Unknown options are ignored by Unity Fixture, so an executable without the
+# dry-run option would run its tests. Check the support once per executable
+# and skip the check on later discoveries of the same executable.
+set(dry_run_supported FALSE)
+if(TEST_DRY_RUN_FILE AND EXISTS "${TEST_DRY_RUN_FILE}")
+  include("${TEST_DRY_RUN_FILE}")
+  if("${dry_run_executable}" STREQUAL "${executable_key}")
+    set(dry_run_supported TRUE)
+  else()
+    file(REMOVE "${TEST_DRY_RUN_FILE}")
+  endif()
 endif()
-if(NOT output MATCHES "-d          Dry run all tests")
-  message(FATAL_ERROR
-    "Missing dry-run option. Upgrade Unity Fixture to the latest version.\n"
-    "  Path: '${TEST_EXECUTABLE}'\n"
-    "  Result: ${result}\n"
-  )
+if(NOT dry_run_supported)
+  check_dry_run_support()
 endif()
 
 # Run test executable to get list of available tests
@@ -54,7 +81,12 @@ execute_process(
   OUTPUT_VARIABLE output
   RESULT_VARIABLE result
 )
-if(NOT ${result} EQUAL 0)
+if(NOT ${result} EQUAL 0 OR NOT output MATCHES "Unity test run")
+  # Check the support again if skipped, as the executable may have changed
+  if(dry_run_supported)
+    file(REMOVE "${TEST_DRY_RUN_FILE}")
+    check_dry_run_support()
+  endif()
   string(REPLACE "\n" "\n    " output "${output}")
   message(FATAL_ERROR
     "Error running test executable.\n"
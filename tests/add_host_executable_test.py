@@ -505,3 +505,49 @@ def test_no_rebuild_when_nothing_changes(testing):
     assert os.path.getmtime(obj_path) == mtime_before, (
         "main.c.o was rebuilt even though no source or header changed"
     )
+
+def test_cmake_host_build_type(testing):
+    content = '''
+    cmake_minimum_required(VERSION 3.17)
+    project(CMakeTest LANGUAGES NONE)
+    include(cmake/HostBuild.cmake)
+    add_host_executable(hello SOURCES main.c)
+    '''
+    testing.write("CMakeLists.txt", content)
+    testing.write("main.c", "#include <assert.h>\nint main(void) { assert(0); return 0; }")
+    testing.configure_internal(options=["-DCMAKE_HOST_BUILD_TYPE=Release"]).check_returncode()
+    stdout = testing.cmake("host-targets", verbose=True).stdout
+    assert '-O3 -DNDEBUG' in stdout
+    assert testing.exists("CMakeFiles/HOST-hello.dir/Release/main.c.o")
+    assert testing.execute(os.path.join(testing.build, "hello")).returncode == 0
+
+    testing.configure_internal(options=["-DCMAKE_HOST_BUILD_TYPE=Debug"]).check_returncode()
+    stdout = testing.cmake("host-targets", verbose=True).stdout
+    assert '-O3' not in stdout
+    assert testing.exists("CMakeFiles/HOST-hello.dir/Debug/main.c.o")
+    assert testing.execute(os.path.join(testing.build, "hello")).returncode != 0
+
+    # Switching back reuses the objects of the earlier build type
+    testing.configure_internal(options=["-DCMAKE_HOST_BUILD_TYPE=Release"]).check_returncode()
+    stdout = testing.cmake("host-targets").stdout
+    assert 'Building HOSTC object' not in stdout
+    assert 'Linking HOSTC executable hello' in stdout
+
+def test_cmake_host_build_type_flags(testing):
+    content = '''
+    cmake_minimum_required(VERSION 3.17)
+    project(CMakeTest LANGUAGES NONE)
+
+    set(CMAKE_HOSTC_FLAGS_BENCHMARK "-O2;-DBENCHMARK")
+    set(CMAKE_HOST_EXE_LINKER_FLAGS_BENCHMARK "-Wl,--as-needed")
+
+    include(cmake/HostBuild.cmake)
+    add_host_executable(hello SOURCES main.c)
+    '''
+    testing.write("CMakeLists.txt", content)
+    testing.write("main.c", "int main(void) { return 0; }")
+    testing.configure_internal(options=["-DCMAKE_HOST_BUILD_TYPE=Benchmark"]).check_returncode()
+    stdout = testing.cmake("host-targets", verbose=True).stdout
+    assert '-O2 -DBENCHMARK' in stdout
+    assert '-Wl,--as-needed' in stdout
+    assert testing.exists("CMakeFiles/HOST-hello.dir/Benchmark/main.c.o")
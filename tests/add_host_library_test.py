@@ -5,6 +5,8 @@ Copyright (c) 2024 LG Electronics Inc.
 SPDX-License-Identifier: MIT
 """
 
+import time
+
 
 def test_existing_target(testing):
     content = '''
@@ -809,3 +811,144 @@ def test_shared_link_libraries_with_private_options(testing):
     assert 'aaa' not in stdout
     assert 'bbb' not in stdout
     assert 'ccc' not in stdout
+
+def test_object_no_source(testing):
+    content = '''
+    cmake_minimum_required(VERSION 3.17)
+    project(CMakeTest LANGUAGES NONE)
+    include(cmake/HostBuild.cmake)
+    add_host_library(hello OBJECT)
+    '''
+    testing.write("CMakeLists.txt", content)
+    assert 'No SOURCES given to target: hello' in testing.configure_internal().stderr
+
+def test_object_compiled_once(testing):
+    content = '''
+    cmake_minimum_required(VERSION 3.17)
+    project(CMakeTest LANGUAGES NONE)
+    include(cmake/HostBuild.cmake)
+    add_host_library(hello OBJECT SOURCES hello.c INCLUDE_DIRECTORIES PUBLIC include)
+    add_host_executable(first SOURCES main.c LINK_LIBRARIES PRIVATE Host::hello)
+    add_host_executable(second SOURCES main.c LINK_LIBRARIES PRIVATE Host::hello)
+    '''
+    testing.write("CMakeLists.txt", content)
+    testing.write("include/hello.h", "int hello(void);")
+    testing.write("hello.c", "int hello(void) { return 3; }")
+    testing.write("main.c", "#include <hello.h>\nint main(void) { return hello(); }")
+    testing.configure_internal().check_returncode()
+    stdout = testing.cmake("host-targets", verbose=True).stdout
+    assert stdout.count("Building HOSTC object CMakeFiles/HOST-hello.dir/hello.c.o") == 1
+    assert 'Linking HOSTC static library' not in stdout
+    assert f'{testing.build}/CMakeFiles/HOST-hello.dir/hello.c.o' in stdout
+    assert testing.execute(f"{testing.build}/first").returncode == 3
+    assert testing.execute(f"{testing.build}/second").returncode == 3
+
+def test_object_relink_on_change(testing):
+    content = '''
+    cmake_minimum_required(VERSION 3.17)
+    project(CMakeTest LANGUAGES NONE)
+    include(cmake/HostBuild.cmake)
+    add_host_executable(main SOURCES main.c LINK_LIBRARIES PRIVATE Host::world)
+    add_host_library(world STATIC SOURCES world.c LINK_LIBRARIES PRIVATE Host::hello)
+    add_host_library(hello OBJECT SOURCES hello.c)
+    '''
+    testing.write("CMakeLists.txt", content)
+    testing.write("hello.c", "int hello(void) { return 1; }")
+    testing.write("world.c", "int hello(void);\nint world(void) { return hello(); }")
+    testing.write("main.c", "int world(void);\nint main(void) { return world(); }")
+    testing.configure_internal().check_returncode()
+    testing.cmake("host-targets").check_returncode()
+    assert testing.execute(f"{testing.build}/main").returncode == 1
+
+    time.sleep(1)
+    testing.write("hello.c", "int hello(void) { return 2; }")
+    stdout = testing.cmake("host-targets").stdout
+    assert 'Linking HOSTC static library' not in stdout
+    assert 'Linking HOSTC executable main' in stdout
+    assert testing.execute(f"{testing.build}/main").returncode == 2
+
+def test_executable_relink_on_static_library_change(testing):
+    content = '''
+    cmake_minimum_required(VERSION 3.17)
+    project(CMakeTest LANGUAGES NONE)
+    include(cmake/HostBuild.cmake)
+    add_host_library(hello STATIC SOURCES hello.c)
+    add_host_executable(main SOURCES main.c LINK_LIBRARIES PRIVATE Host::hello)
+    '''
+    testing.write("CMakeLists.txt", content)
+    testing.write("hello.c", "int hello(void) { return 1; }")
+    testing.write("main.c", "int hello(void);\nint main(void) { return hello(); }")
+    testing.configure_internal().check_returncode()
+    testing.cmake("host-targets").check_returncode()
+
+    time.sleep(1)
+    testing.write("hello.c", "int hello(void) { return 2; }")
+    assert 'Linking HOSTC executable main' in testing.cmake("host-targets").stdout
+    assert testing.execute(f"{testing.build}/main").returncode == 2
+
+def test_interprocedural_optimization(testing):
+    content = '''
+    cmake_minimum_required(VERSION 3.17)
+    project(CMakeTest LANGUAGES NONE)
+    include(cmake/HostBuild.cmake)
+    add_host_library(hello STATIC SOURCES hello.c INTERPROCEDURAL_OPTIMIZATION ON)
+    add_host_executable(main SOURCES main.c LINK_LIBRARIES PRIVATE Host::hello INTERPROCEDURAL_OPTIMIZATION ON)
+    '''
+    testing.write("CMakeLists.txt", content)
+    testing.write("hello.c", "int hello(void) { return 3; }")
+    testing.write("main.c", "int hello(void);\nint main(void) { return hello(); }")
+    stdout = testing.configure_internal().stdout
+    assert "Detecting HOSTC IPO support - yes" in stdout
+    stdout = testing.cmake("host-targets", verbose=True).stdout
+    assert "-flto=auto -fno-fat-lto-objects" in stdout
+    assert "gcc-ar" in stdout
+    assert testing.execute(f"{testing.build}/main").returncode == 3
+
+def test_no_ipo_support_check_without_interprocedural_optimization(testing):
+    content = '''
+    cmake_minimum_required(VERSION 3.17)
+    project(CMakeTest LANGUAGES NONE)
+    include(cmake/HostBuild.cmake)
+    add_host_library(hello STATIC SOURCES hello.c INTERPROCEDURAL_OPTIMIZATION ${IPO})
+    '''
+    testing.write("CMakeLists.txt", content)
+    testing.write("hello.c", "int hello(void) { return 3; }")
+    assert "Detecting HOSTC IPO support" not in testing.configure_internal(options=["-DIPO=OFF"]).stdout
+    assert "Detecting HOSTC IPO support - yes" in testing.configure_internal(options=["-DIPO=ON"]).stdout
+    assert "Detecting HOSTC IPO support" not in testing.configure_internal().stdout
+    assert 'set(CMAKE_HOSTC_IPO_SUPPORTED TRUE)' in testing.read(testing.internal_dir("CMakeHOSTCCompiler.cmake"))
+
+def test_interprocedural_optimization_of_dependency(testing):
+    content = '''
+    cmake_minimum_required(VERSION 3.17)
+    project(CMakeTest LANGUAGES NONE)
+    include(cmake/HostBuild.cmake)
+    add_host_library(hello STATIC SOURCES hello.c INTERPROCEDURAL_OPTIMIZATION ON)
+    add_host_library(world OBJECT SOURCES world.c INTERPROCEDURAL_OPTIMIZATION ON)
+    add_host_executable(main SOURCES main.c LINK_LIBRARIES PRIVATE Host::hello Host::world)
+    '''
+    testing.write("CMakeLists.txt", content)
+    testing.write("hello.c", "int hello(void) { return 3; }")
+    testing.write("world.c", "int world(void) { return 4; }")
+    testing.write("main.c", "int hello(void);\nint world(void);\nint main(void) { return hello() + world(); }")
+    testing.configure_internal().check_returncode()
+    stdout = testing.cmake("host-targets", verbose=True).stdout
+    assert f"{testing.build}/libhello.a {testing.build}/CMakeFiles/HOST-world.dir/world.c.o -flto=auto" in stdout
+    assert testing.execute(f"{testing.build}/main").returncode == 7
+
+def test_gc_sections(testing):
+    content = '''
+    cmake_minimum_required(VERSION 3.17)
+    project(CMakeTest LANGUAGES NONE)
+    include(cmake/HostBuild.cmake)
+    add_host_library(hello SHARED SOURCES hello.c)
+    add_host_executable(main SOURCES main.c GC_SECTIONS OFF)
+    '''
+    testing.write("CMakeLists.txt", content)
+    testing.write("hello.c", "int hello(void) { return 0; }")
+    testing.write("main.c", "int main(void) { return 0; }")
+    testing.configure_internal(options=["-DCMAKE_HOST_GC_SECTIONS=ON"]).check_returncode()
+    stdout = testing.cmake("host-targets", verbose=True).stdout
+    assert stdout.count("-ffunction-sections -fdata-sections") == 1
+    assert stdout.count("-Wl,--gc-sections") == 1
+    assert "-flto" not in stdout
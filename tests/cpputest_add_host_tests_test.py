@@ -221,3 +221,46 @@ def test_run_test_multiple_times(testing):
     testing.write("CMakeLists.txt", content)
     testing.write("test_file.cpp", test_file)
     assert 'test NAME "Test.test1" which already exists' not in testing.configure_internal().stderr
+
+batch_test_file = '''
+#include "CppUTest/TestHarness.h"
+#include "CppUTest/CommandLineTestRunner.h"
+TEST_GROUP(GroupA) { };
+TEST(GroupA, test1) { }
+TEST(GroupA, test2) { }
+IGNORE_TEST(GroupA, test3) { FAIL("ignored"); }
+TEST_GROUP(GroupB) { };
+TEST(GroupB, test1) { CHECK(VALUE); }
+TEST_GROUP(GroupC) { };
+TEST(GroupC, test1) { }
+int main(int ac, char** av) {
+  return CommandLineTestRunner::RunAllTests(ac, av);
+}
+'''
+
+def test_shards(testing):
+    testing.copytree("tests/project/external/cpputest", "")
+    testing.write("CMakeLists.txt", content)
+    testing.write("test_file.cpp", batch_test_file.replace("VALUE", "true"))
+    testing.configure_internal(options=['-DEXTRA_ARGS="SHARDS;2"']).check_returncode()
+    testing.cmake("host-targets").check_returncode()
+    stdout = testing.ctest("--verbose").stdout
+    assert "unittest.batch1 ..................   Passed" in stdout
+    assert "unittest.batch2 ..................   Passed" in stdout
+    assert "TEST_GROUPS=GroupB,GroupC" in stdout
+    assert "GroupA.test1 ... Passed" in stdout
+    assert "GroupA.test3 ..." not in stdout
+    assert "GroupB.test1 ... Passed" in stdout
+    assert "GroupC.test1 ... Passed" in stdout
+
+def test_batch_size_failed(testing):
+    testing.copytree("tests/project/external/cpputest", "")
+    testing.write("CMakeLists.txt", content)
+    testing.write("test_file.cpp", batch_test_file.replace("VALUE", "false"))
+    testing.configure_internal(options=['-DEXTRA_ARGS="BATCH_SIZE;2"']).check_returncode()
+    testing.cmake("host-targets").check_returncode()
+    stdout = testing.ctest("--verbose").stdout
+    assert "unittest.batch1 ..................   Passed" in stdout
+    assert "unittest.batch2 ..................***Failed" in stdout
+    assert "GroupB.test1 ... Failed" in stdout
+    assert "GroupC.test1 ... Passed" in stdout
@@ -108,6 +108,16 @@ def test_counter(testing):
     assert testing.exists("unittest[1]_tests.cmake")
     assert testing.exists("unittest[2]_tests.cmake")
 
+def test_discovery_mode_argument(testing):
+    testing.copytree("tests/project/external/cpputest", "")
+    testing.write("CMakeLists.txt", content)
+    testing.write("test_file.cpp", test_file)
+    testing.configure_internal(options=['-DEXTRA_ARGS="DISCOVERY_MODE;PRE_TEST"']).check_returncode()
+    testing.cmake("host-targets").check_returncode()
+    assert not testing.exists("unittest[1]_tests.cmake")
+    assert "Test.test ........................   Passed" in testing.ctest().stdout
+    assert testing.exists("unittest[1]_tests.cmake")
+
 def test_blank_file(testing):
     test_file = '''
     int main(int argc, const char* argv[]) {
@@ -0,0 +1,93 @@
+#-*- coding: utf-8 -*-
+
+"""
+Copyright (c) 2026 LG Electronics Inc.
+SPDX-License-Identifier: MIT
+"""
+
+import json
+import os
+
+
+content = '''
+cmake_minimum_required(VERSION 3.17 FATAL_ERROR)
+
+project(CMakeTest LANGUAGES NONE)
+
+include(cmake/HostBuild.cmake)
+
+message(STATUS "ENABLED_LANGUAGES: ${ENABLED_HOST_LANGUAGES}")
+'''
+
+def test_concurrent_detection(testing):
+    testing.write("CMakeLists.txt", content)
+    stdout = testing.configure_internal().stdout
+    assert 'Check for working HOSTC compiler: /usr/bin/cc -- works' in stdout
+    assert 'Check for working HOSTCXX compiler: /usr/bin/c++ -- works' in stdout
+    assert 'ENABLED_LANGUAGES: C;CXX' in stdout
+    assert testing.exists(testing.internal_dir("DetermineHOSTCCompiler.log"))
+    assert testing.exists(testing.internal_dir("DetermineHOSTCXXCompiler.log"))
+
+target_content = '''
+cmake_minimum_required(VERSION 3.17 FATAL_ERROR)
+
+project(CMakeTest LANGUAGES C CXX)
+
+include(cmake/HostBuild.cmake)
+'''
+
+toolchain = '''
+set(CMAKE_SYSTEM_NAME Generic)
+set(CMAKE_C_COMPILER gcc)
+set(CMAKE_CXX_COMPILER g++)
+'''
+
+def test_concurrent_detection_with_cross_toolchain(testing):
+    testing.write("CMakeLists.txt", target_content)
+    testing.write("toolchain.cmake", toolchain)
+    stdout = testing.configure_internal(options=[f"-DCMAKE_TOOLCHAIN_FILE={testing.workspace}/toolchain.cmake"]).stdout
+    assert 'Reusing' not in stdout
+    assert testing.exists(testing.internal_dir("DetermineHOSTCCompiler.log"))
+    assert testing.exists(testing.internal_dir("DetermineHOSTCXXCompiler.log"))
+
+def test_no_concurrent_detection_for_reused_compilers(testing):
+    testing.write("CMakeLists.txt", target_content)
+    stdout = testing.configure_internal(options=["-DCMAKE_C_COMPILER=gcc", "-DCMAKE_CXX_COMPILER=g++", "-DCMAKE_HOSTC_COMPILER_LIST=gcc", "-DCMAKE_HOSTCXX_COMPILER_LIST=g++"]).stdout
+    assert 'Reusing C compiler info for HOSTC compiler - done' in stdout
+    assert 'Reusing CXX compiler info for HOSTCXX compiler - done' in stdout
+    assert not testing.exists(testing.internal_dir("DetermineHOSTCCompiler.log"))
+    assert not testing.exists(testing.internal_dir("DetermineHOSTCXXCompiler.log"))
+
+def test_same_preferences_as_serial_detection(testing):
+    testing.write("CMakeLists.txt", content)
+    testing.configure_internal().check_returncode()
+    concurrent = [testing.read(testing.internal_dir(f"CMakeHOST{lang}Compiler.cmake")) for lang in ["C", "CXX"]]
+
+    testing.build = os.path.join(testing.workspace, "serial")
+    testing.configure_internal(options=["-DCMAKE_HOST_CONCURRENT_DETECTION=OFF"]).check_returncode()
+    assert not testing.exists(testing.internal_dir("DetermineHOSTCCompiler.log"))
+    serial = [testing.read(testing.internal_dir(f"CMakeHOST{lang}Compiler.cmake")) for lang in ["C", "CXX"]]
+    assert concurrent == serial
+
+def test_profile_of_workers(testing):
+    testing.write("CMakeLists.txt", content)
+    testing.configure_internal(options=["-DCMAKE_HOST_PROFILE=ON"]).check_returncode()
+    assert testing.exists(testing.internal_dir("DetermineHOSTCCompiler.profile"))
+    report = json.loads(testing.read("hosta-profile.json"))
+    functions = {entry["name"]: entry for entry in report["functions"]}
+    assert functions["find_host_compiler_id"]["count"] == 2
+    assert functions["execute_process(try_host_compile)"]["count"] > 0
+
+def test_single_language(testing):
+    testing.write("CMakeLists.txt", content)
+    stdout = testing.configure_internal(options=["-DENABLE_HOST_LANGUAGES=C"]).stdout
+    assert 'Check for working HOSTC compiler: /usr/bin/cc -- works' in stdout
+    assert not testing.exists(testing.internal_dir("DetermineHOSTCCompiler.log"))
+
+def test_failed_worker_reports_error(testing):
+    testing.write("CMakeLists.txt", content)
+    result = testing.configure_internal(options=["-DCMAKE_HOSTCXX_COMPILER_LIST=unknown-compiler"])
+    assert result.returncode != 0
+    assert 'Check for working HOSTC compiler: /usr/bin/cc -- works' in result.stdout
+    assert 'The CMAKE_HOSTCXX_COMPILER:' in result.stderr
+    assert not testing.exists(testing.internal_dir("CMakeHOSTCXXCompiler.cmake"))
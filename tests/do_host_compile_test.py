@@ -39,3 +39,128 @@ def test_remove_gcda_file_when_file_changed(testing):
     testing.touch("main.c")
     testing.cmake("host-targets").check_returncode()
     assert not testing.exists("CMakeFiles/HOST-main.dir/main.c.gcda")
+
+launcher = '''
+import subprocess
+import sys
+with open(sys.argv[1], "a") as f:
+    f.write(" ".join(sys.argv[2:]) + "\\n")
+sys.exit(subprocess.call(sys.argv[2:]))
+'''
+
+launcher_content = '''
+cmake_minimum_required(VERSION 3.17)
+project(CMakeTest LANGUAGES NONE)
+include(cmake/HostBuild.cmake)
+add_host_executable(main SOURCES main.c {options})
+'''
+
+def test_compiler_launcher(testing):
+    testing.write("launcher.py", launcher)
+    testing.write("main.c", "int main(void) { return 0; }")
+    testing.write("CMakeLists.txt", launcher_content.format(options=""))
+    log = f"{testing.workspace}/launcher.log"
+    testing.configure_internal(options=[
+        f"\"-DCMAKE_HOSTC_COMPILER_LAUNCHER=python3;{testing.workspace}/launcher.py;{log}\"",
+        "-DCMAKE_HOST_DEPFILE_ONLY=OFF",
+    ]).check_returncode()
+    assert "-MM" in testing.read(log)
+    testing.cmake("host-targets").check_returncode()
+    assert "-c " + f"{testing.workspace}/main.c" in testing.read(log)
+
+def test_target_compiler_launcher(testing):
+    testing.write("launcher.py", launcher)
+    testing.write("main.c", "int main(void) { return 0; }")
+    log = f"{testing.workspace}/target.log"
+    testing.write("CMakeLists.txt", launcher_content.format(options=f"COMPILER_LAUNCHER python3 {testing.workspace}/launcher.py {log}"))
+    testing.configure_internal(options=["-DCMAKE_HOSTC_COMPILER_LAUNCHER=false"]).check_returncode()
+    testing.cmake("host-targets").check_returncode()
+    assert "-c " + f"{testing.workspace}/main.c" in testing.read(log)
+
+dedup_content = '''
+cmake_minimum_required(VERSION 3.19)
+project(CMakeTest LANGUAGES NONE)
+include(cmake/HostBuild.cmake)
+add_host_executable(first SOURCES main.c common.c)
+add_host_executable(second SOURCES main.c common.c)
+add_host_executable(third SOURCES main.c common.c COMPILE_OPTIONS PRIVATE -DTHIRD)
+'''
+
+def test_deduplicate_identical_compiles(testing):
+    testing.write("CMakeLists.txt", dedup_content)
+    testing.write("common.c", "int common(void) { return 0; }")
+    testing.write("main.c", "int common(void);\nint main(void) { return common(); }")
+    assert "Host compiles deduplicated: 2 of 6" in testing.configure_internal().stdout
+    stdout = testing.cmake("host-targets").stdout
+    assert "Building HOSTC object CMakeFiles/HOST-second.dir" not in stdout
+    assert "Building HOSTC object CMakeFiles/HOST-third.dir/common.c.o" in stdout
+    assert testing.execute(f"{testing.build}/second").returncode == 0
+
+def test_build_deduplicated_compile_without_owner(testing):
+    testing.write("CMakeLists.txt", dedup_content)
+    testing.write("common.c", "int common(void) { return 0; }")
+    testing.write("main.c", "int common(void);\nint main(void) { return common(); }")
+    testing.configure_internal().check_returncode()
+    testing.cmake("HOST-second").check_returncode()
+    assert testing.exists("CMakeFiles/HOST-first.dir/common.c.o")
+    assert not testing.exists("first")
+    assert testing.execute(f"{testing.build}/second").returncode == 0
+
+def test_disable_deduplication(testing):
+    testing.write("CMakeLists.txt", dedup_content)
+    testing.write("common.c", "int common(void) { return 0; }")
+    testing.write("main.c", "int common(void);\nint main(void) { return common(); }")
+    assert "deduplicated" not in testing.configure_internal(options=["-DCMAKE_HOST_DEDUPLICATE_COMPILES=OFF"]).stdout
+    assert "Building HOSTC object CMakeFiles/HOST-second.dir/common.c.o" in testing.cmake("host-targets").stdout
+
+def test_deduplicate_compiles_with_same_dependencies(testing):
+    testing.write("CMakeLists.txt", dedup_content.replace("-DTHIRD", "-DTHIRD)\nadd_host_executable(fourth SOURCES main.c common.c DEPENDS ${CMAKE_CURRENT_LIST_DIR}/version.h"))
+    testing.write("common.c", "int common(void) { return 0; }")
+    testing.write("main.c", "int common(void);\nint main(void) { return common(); }")
+    testing.write("version.h", "")
+    assert "Host compiles deduplicated: 2 of 8" in testing.configure_internal().stdout
+    testing.cmake("host-targets").check_returncode()
+    testing.write("version.h", "#define VERSION 2")
+    stdout = testing.cmake("host-targets").stdout
+    assert "Building HOSTC object CMakeFiles/HOST-fourth.dir/common.c.o" in stdout
+    assert "Building HOSTC object CMakeFiles/HOST-first.dir/common.c.o" not in stdout
+
+debug_content = '''
+cmake_minimum_required(VERSION 3.17)
+project(CMakeTest LANGUAGES NONE)
+include(cmake/HostBuild.cmake)
+add_host_executable(main SOURCES main.c COMPILE_OPTIONS PRIVATE {options})
+'''
+
+def test_split_debug_info(testing):
+    testing.write("CMakeLists.txt", debug_content.format(options="-g"))
+    testing.write("main.c", "int main(void) { return 0; }")
+    testing.configure_internal(options=["-DCMAKE_HOST_DEBUG_INFO=SPLIT", "-DCMAKE_HOST_LINKER_TYPE=GOLD"]).check_returncode()
+    stdout = testing.cmake("host-targets", verbose=True).stdout
+    assert "-gsplit-dwarf" in stdout
+    assert "-Wl,--gdb-index" in stdout
+    assert testing.exists("CMakeFiles/HOST-main.dir/main.c.dwo")
+    assert testing.execute(f"{testing.build}/main").returncode == 0
+
+    testing.cmake("clean").check_returncode()
+    assert not testing.exists("CMakeFiles/HOST-main.dir/main.c.dwo")
+
+def test_compressed_debug_info(testing):
+    testing.write("CMakeLists.txt", debug_content.format(options="-g"))
+    testing.write("main.c", "int main(void) { return 0; }")
+    testing.configure_internal(options=["-DCMAKE_HOST_DEBUG_INFO=COMPRESSED"]).check_returncode()
+    stdout = testing.cmake("host-targets", verbose=True).stdout
+    assert stdout.count(" -gz") == 2
+    assert testing.execute(f"{testing.build}/main").returncode == 0
+
+def test_debug_info_without_debug_options(testing):
+    testing.write("CMakeLists.txt", debug_content.format(options="-g -g0"))
+    testing.write("main.c", "int main(void) { return 0; }")
+    testing.configure_internal(options=["-DCMAKE_HOST_DEBUG_INFO=SPLIT"]).check_returncode()
+    assert "-gsplit-dwarf" not in testing.cmake("host-targets", verbose=True).stdout
+    assert not testing.exists("CMakeFiles/HOST-main.dir/main.c.dwo")
+
+def test_invalid_debug_info(testing):
+    testing.write("CMakeLists.txt", debug_content.format(options="-g"))
+    testing.write("main.c", "int main(void) { return 0; }")
+    assert "CMAKE_HOST_DEBUG_INFO must be one of DEFAULT, SPLIT or COMPRESSED: SMALL" in testing.configure_internal(options=["-DCMAKE_HOST_DEBUG_INFO=SMALL"]).stderr
@@ -0,0 +1,83 @@
+#-*- coding: utf-8 -*-
+
+"""
+Copyright (c) 2026 LG Electronics Inc.
+SPDX-License-Identifier: MIT
+"""
+
+
+launcher = '''
+import subprocess
+import sys
+with open(sys.argv[1], "a") as f:
+    f.write(" ".join(sys.argv[2:]) + "\\n")
+sys.exit(subprocess.call(sys.argv[2:]))
+'''
+
+content = '''
+cmake_minimum_required(VERSION 3.17)
+project(CMakeTest LANGUAGES NONE)
+include(cmake/HostBuild.cmake)
+add_host_library(hello SHARED SOURCES hello.c {options})
+add_host_executable(main SOURCES main.c {options})
+'''
+
+def test_linker_launcher(testing):
+    testing.write("launcher.py", launcher)
+    testing.write("hello.c", "int hello(void) { return 0; }")
+    testing.write("main.c", "int main(void) { return 0; }")
+    testing.write("CMakeLists.txt", content.format(options=""))
+    log = f"{testing.workspace}/launcher.log"
+    testing.configure_internal(options=[f"\"-DCMAKE_HOSTC_LINKER_LAUNCHER=python3;{testing.workspace}/launcher.py;{log}\""]).check_returncode()
+    testing.cmake("host-targets").check_returncode()
+    commands = testing.read(log)
+    assert f"-o {testing.build}/libhello.so" in commands
+    assert f"-o {testing.build}/main" in commands
+    assert " -c " not in commands
+
+def test_target_linker_launcher(testing):
+    testing.write("launcher.py", launcher)
+    testing.write("hello.c", "int hello(void) { return 0; }")
+    testing.write("main.c", "int main(void) { return 0; }")
+    log = f"{testing.workspace}/target.log"
+    testing.write("CMakeLists.txt", content.format(options=f"LINKER_LAUNCHER python3 {testing.workspace}/launcher.py {log}"))
+    testing.configure_internal(options=["-DCMAKE_HOSTC_LINKER_LAUNCHER=false"]).check_returncode()
+    testing.cmake("host-targets").check_returncode()
+    assert f"-o {testing.build}/main" in testing.read(log)
+
+def test_linker_type(testing):
+    testing.write("launcher.py", launcher)
+    testing.write("hello.c", "int hello(void) { return 0; }")
+    testing.write("main.c", "int main(void) { return 0; }")
+    testing.write("CMakeLists.txt", content.format(options=""))
+    stdout = testing.configure_internal(options=["-DCMAKE_HOST_LINKER_TYPE=BFD"]).stdout
+    assert "Detecting HOSTC linker types - BFD" in stdout
+    stdout = testing.cmake("host-targets", verbose=True).stdout
+    assert f"-o {testing.build}/libhello.so" in stdout
+    assert stdout.count("-fuse-ld=bfd") == 2
+    assert testing.execute(f"{testing.build}/main").returncode == 0
+
+def test_no_linker_types_without_linker_type(testing):
+    testing.write("launcher.py", launcher)
+    testing.write("hello.c", "int hello(void) { return 0; }")
+    testing.write("main.c", "int main(void) { return 0; }")
+    testing.write("CMakeLists.txt", content.format(options=""))
+    assert "Detecting HOSTC linker types" not in testing.configure_internal().stdout
+    stdout = testing.configure_internal(options=["-DCMAKE_HOST_LINKER_TYPE=BFD"]).stdout
+    assert "Detecting HOSTC linker types - BFD" in stdout
+    assert "Detecting HOSTC linker types" not in testing.configure_internal().stdout
+
+def test_target_linker_type(testing):
+    testing.write("launcher.py", launcher)
+    testing.write("hello.c", "int hello(void) { return 0; }")
+    testing.write("main.c", "int main(void) { return 0; }")
+    testing.write("CMakeLists.txt", content.format(options="LINKER_TYPE SYSTEM"))
+    testing.configure_internal(options=["-DCMAKE_HOST_LINKER_TYPE=BFD"]).check_returncode()
+    assert "-fuse-ld" not in testing.cmake("host-targets", verbose=True).stdout
+
+def test_unavailable_linker_type(testing):
+    testing.write("launcher.py", launcher)
+    testing.write("hello.c", "int hello(void) { return 0; }")
+    testing.write("main.c", "int main(void) { return 0; }")
+    testing.write("CMakeLists.txt", content.format(options="LINKER_TYPE UNKNOWN"))
+    assert "The HOSTC linker type UNKNOWN is not available for hello." in testing.configure_internal().stderr
@@ -0,0 +1,102 @@
+#-*- coding: utf-8 -*-
+
+"""
+Copyright (c) 2026 LG Electronics Inc.
+SPDX-License-Identifier: MIT
+"""
+
+import os
+import time
+
+
+def test_precompile_headers(testing):
+    content = '''
+    cmake_minimum_required(VERSION 3.17)
+    project(CMakeTest LANGUAGES NONE)
+    include(cmake/HostBuild.cmake)
+    add_host_executable(main SOURCES main.c PRECOMPILE_HEADERS PRIVATE common/common.h <stdio.h>)
+    '''
+    testing.write("common/common.h", "#define COMMON 0\n")
+    testing.write("main.c", "int main() { return COMMON; }")
+    testing.write("other.c", "int main() { return COMMON; }")
+    testing.write("CMakeLists.txt", content)
+    testing.configure_internal().check_returncode()
+    header = testing.read("CMakeFiles/HOST-main.dir/cmake_pch.h")
+    assert f'#include "{testing.workspace}/common/common.h"\n#include <stdio.h>\n' in header
+    stdout = testing.cmake("host-targets", verbose=True).stdout
+    assert "Precompiling HOSTC header CMakeFiles/HOST-main.dir/cmake_pch.h.gch" in stdout
+    assert f'-include {testing.build}/CMakeFiles/HOST-main.dir/cmake_pch.h' in stdout
+    assert testing.exists("CMakeFiles/HOST-main.dir/cmake_pch.h.gch")
+
+def test_reuse_across_targets(testing):
+    content = '''
+    cmake_minimum_required(VERSION 3.17)
+    project(CMakeTest LANGUAGES NONE)
+    include(cmake/HostBuild.cmake)
+    add_host_executable(main SOURCES main.c PRECOMPILE_HEADERS PRIVATE common/common.h)
+    add_host_executable(other SOURCES other.c PRECOMPILE_HEADERS PRIVATE common/common.h)
+    add_host_executable(different SOURCES other.c COMPILE_OPTIONS PRIVATE -DDIFFERENT PRECOMPILE_HEADERS PRIVATE common/common.h)
+    '''
+    testing.write("common/common.h", "#define COMMON 0\n")
+    testing.write("main.c", "int main() { return COMMON; }")
+    testing.write("other.c", "int main() { return COMMON; }")
+    testing.write("CMakeLists.txt", content)
+    testing.configure_internal().check_returncode()
+    stdout = testing.cmake("host-targets", verbose=True).stdout
+    assert stdout.count("Precompiling HOSTC header") == 2
+    assert not testing.exists("CMakeFiles/HOST-other.dir/cmake_pch.h.gch")
+    assert testing.exists("CMakeFiles/HOST-different.dir/cmake_pch.h.gch")
+
+def test_build_shared_header_without_owner(testing):
+    content = '''
+    cmake_minimum_required(VERSION 3.17)
+    project(CMakeTest LANGUAGES NONE)
+    include(cmake/HostBuild.cmake)
+    add_host_executable(main SOURCES main.c PRECOMPILE_HEADERS PRIVATE common/common.h)
+    add_host_executable(other SOURCES other.c PRECOMPILE_HEADERS PRIVATE common/common.h)
+    '''
+    testing.write("common/common.h", "#define COMMON 0\n")
+    testing.write("main.c", "int main() { return COMMON; }")
+    testing.write("other.c", "int main() { return COMMON; }")
+    testing.write("CMakeLists.txt", content)
+    testing.configure_internal().check_returncode()
+    testing.cmake("HOST-other").check_returncode()
+    assert testing.exists("CMakeFiles/HOST-main.dir/cmake_pch.h.gch")
+    assert not testing.exists("main")
+    assert testing.exists("other")
+
+def test_public_precompile_headers(testing):
+    content = '''
+    cmake_minimum_required(VERSION 3.17)
+    project(CMakeTest LANGUAGES NONE)
+    include(cmake/HostBuild.cmake)
+    add_host_library(common INTERFACE PRECOMPILE_HEADERS PUBLIC common/common.h)
+    add_host_executable(main SOURCES main.c LINK_LIBRARIES PRIVATE Host::common)
+    '''
+    testing.write("common/common.h", "#define COMMON 0\n")
+    testing.write("main.c", "int main() { return COMMON; }")
+    testing.write("other.c", "int main() { return COMMON; }")
+    testing.write("CMakeLists.txt", content)
+    testing.configure_internal().check_returncode()
+    testing.cmake("host-targets").check_returncode()
+    assert testing.exists("CMakeFiles/HOST-main.dir/cmake_pch.h.gch")
+
+def test_rebuild_on_header_change(testing):
+    content = '''
+    cmake_minimum_required(VERSION 3.17)
+    project(CMakeTest LANGUAGES NONE)
+    include(cmake/HostBuild.cmake)
+    add_host_executable(main SOURCES main.c PRECOMPILE_HEADERS PRIVATE common/common.h)
+    '''
+    testing.write("common/common.h", "#define COMMON 0\n")
+    testing.write("main.c", "int main() { return COMMON; }")
+    testing.write("other.c", "int main() { return COMMON; }")
+    testing.write("CMakeLists.txt", content)
+    testing.configure_internal().check_returncode()
+    testing.cmake("host-targets").check_returncode()
+    assert testing.execute(os.path.join(testing.build, "main")).returncode == 0
+
+    time.sleep(1)
+    testing.write("common/common.h", "#define COMMON 3\n")
+    testing.cmake("host-targets").check_returncode()
+    assert testing.execute(os.path.join(testing.build, "main")).returncode == 3
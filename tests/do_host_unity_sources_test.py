@@ -0,0 +1,81 @@
+#-*- coding: utf-8 -*-
+
+"""
+Copyright (c) 2026 LG Electronics Inc.
+SPDX-License-Identifier: MIT
+"""
+
+import os
+import time
+
+
+content = '''
+cmake_minimum_required(VERSION 3.17 FATAL_ERROR)
+project(CMakeTest LANGUAGES NONE)
+include(cmake/HostBuild.cmake)
+add_host_executable(main SOURCES main.c first.c second.c {options})
+add_host_library(hello STATIC SOURCES first.c second.c {options})
+'''
+
+def test_global_unity_build(testing):
+    testing.write("main.c", "int first(void);\nint second(void);\nint main() { return first() + second(); }")
+    testing.write("first.c", "static int value(void) { return 0; }\nint first(void) { return value(); }")
+    testing.write("second.c", "static int other(void) { return 0; }\nint second(void) { return other(); }")
+    testing.write("CMakeLists.txt", content.format(options=""))
+    testing.configure_internal(options=["-DCMAKE_HOST_UNITY_BUILD=ON", "-DCMAKE_HOST_UNITY_BUILD_BATCH_SIZE=2"]).check_returncode()
+    assert testing.read("CMakeFiles/HOST-main.dir/unity_0_c.c") == f'/* generated by hosta */\n#include "{testing.workspace}/main.c"\n#include "{testing.workspace}/first.c"\n'
+    assert testing.read("CMakeFiles/HOST-main.dir/unity_1_c.c") == f'/* generated by hosta */\n#include "{testing.workspace}/second.c"\n'
+    assert testing.exists("CMakeFiles/HOST-libhello.a.dir/unity_0_c.c")
+    stdout = testing.cmake("host-targets").stdout
+    assert "Building HOSTC object CMakeFiles/HOST-main.dir/unity_0_c.c.o" in stdout
+    assert "Building HOSTC object CMakeFiles/HOST-main.dir/unity_1_c.c.o" in stdout
+    assert "main.c.o" not in stdout
+
+def test_target_unity_build(testing):
+    testing.write("main.c", "int first(void);\nint second(void);\nint main() { return first() + second(); }")
+    testing.write("first.c", "static int value(void) { return 0; }\nint first(void) { return value(); }")
+    testing.write("second.c", "static int other(void) { return 0; }\nint second(void) { return other(); }")
+    testing.write("CMakeLists.txt", content.format(options="UNITY_BUILD ON UNITY_BUILD_BATCH_SIZE 0"))
+    testing.configure_internal().check_returncode()
+    assert testing.exists("CMakeFiles/HOST-main.dir/unity_0_c.c")
+    assert not testing.exists("CMakeFiles/HOST-main.dir/unity_1_c.c")
+    testing.cmake("host-targets").check_returncode()
+
+def test_disable_unity_build_for_target(testing):
+    testing.write("main.c", "int first(void);\nint second(void);\nint main() { return first() + second(); }")
+    testing.write("first.c", "static int value(void) { return 0; }\nint first(void) { return value(); }")
+    testing.write("second.c", "static int other(void) { return 0; }\nint second(void) { return other(); }")
+    testing.write("CMakeLists.txt", content.format(options="UNITY_BUILD OFF"))
+    testing.configure_internal(options=["-DCMAKE_HOST_UNITY_BUILD=ON"]).check_returncode()
+    assert not testing.exists("CMakeFiles/HOST-main.dir/unity_0_c.c")
+    assert "Building HOSTC object CMakeFiles/HOST-main.dir/main.c.o" in testing.cmake("host-targets").stdout
+
+def test_batch_size_one(testing):
+    testing.write("main.c", "int first(void);\nint second(void);\nint main() { return first() + second(); }")
+    testing.write("first.c", "static int value(void) { return 0; }\nint first(void) { return value(); }")
+    testing.write("second.c", "static int other(void) { return 0; }\nint second(void) { return other(); }")
+    testing.write("CMakeLists.txt", content.format(options="UNITY_BUILD ON UNITY_BUILD_BATCH_SIZE 1"))
+    testing.configure_internal().check_returncode()
+    assert not testing.exists("CMakeFiles/HOST-main.dir/unity_0_c.c")
+    assert "Building HOSTC object CMakeFiles/HOST-main.dir/main.c.o" in testing.cmake("host-targets").stdout
+
+def test_invalid_batch_size(testing):
+    testing.write("main.c", "int first(void);\nint second(void);\nint main() { return first() + second(); }")
+    testing.write("first.c", "static int value(void) { return 0; }\nint first(void) { return value(); }")
+    testing.write("second.c", "static int other(void) { return 0; }\nint second(void) { return other(); }")
+    testing.write("CMakeLists.txt", content.format(options="UNITY_BUILD ON UNITY_BUILD_BATCH_SIZE many"))
+    assert "UNITY_BUILD_BATCH_SIZE requires a non-negative integer: many" in testing.configure_internal().stderr
+
+def test_rebuild_on_source_change(testing):
+    testing.write("main.c", "int first(void);\nint second(void);\nint main() { return first() + second(); }")
+    testing.write("first.c", "static int value(void) { return 0; }\nint first(void) { return value(); }")
+    testing.write("second.c", "static int other(void) { return 0; }\nint second(void) { return other(); }")
+    testing.write("CMakeLists.txt", content.format(options="UNITY_BUILD ON"))
+    testing.configure_internal().check_returncode()
+    testing.cmake("host-targets").check_returncode()
+    assert testing.execute(os.path.join(testing.build, "main")).returncode == 0
+
+    time.sleep(1)
+    testing.write("second.c", "static int other(void) { return 4; }\nint second(void) { return other(); }")
+    testing.cmake("host-targets").check_returncode()
+    assert testing.execute(os.path.join(testing.build, "main")).returncode == 4
@@ -5,6 +5,8 @@ Copyright (c) 2024 LG Electronics Inc.
 SPDX-License-Identifier: MIT
 """
 
+import re
+
 
 content = '''
 cmake_minimum_required(VERSION 3.17 FATAL_ERROR)
@@ -20,6 +22,8 @@ find_host_binutils(C)
 include(CMakePrintHelpers)
 cmake_print_variables(CMAKE_HOSTC_AR)
 cmake_print_variables(CMAKE_HOSTC_RANLIB)
+cmake_print_variables(CMAKE_HOSTC_COMPILER_AR)
+cmake_print_variables(CMAKE_HOSTC_COMPILER_RANLIB)
 '''
 
 def test_unknown_host_compiler(testing):
@@ -45,3 +49,9 @@ def test_find_binutils_of_mingw_compiler(testing):
     testing.write("CMakeLists.txt", content.format(compiler="i686-w64-mingw32-gcc"))
     assert 'CMAKE_HOSTC_AR="/usr/bin/i686-w64-mingw32-ar"' in testing.configure_internal().stdout
     assert 'CMAKE_HOSTC_RANLIB="/usr/bin/i686-w64-mingw32-ranlib"' in testing.configure_internal().stdout
+
+def test_find_compiler_wrappers_of_gcc_compiler(testing):
+    testing.write("CMakeLists.txt", content.format(compiler="gcc"))
+    stdout = testing.configure_internal().stdout
+    assert re.search(r'CMAKE_HOSTC_COMPILER_AR="/usr/bin/gcc-ar(-[0-9]+)?"', stdout)
+    assert re.search(r'CMAKE_HOSTC_COMPILER_RANLIB="/usr/bin/gcc-ranlib(-[0-9]+)?"', stdout)
@@ -0,0 +1,58 @@
+#-*- coding: utf-8 -*-
+
+"""
+Copyright (c) 2026 LG Electronics Inc.
+SPDX-License-Identifier: MIT
+"""
+
+
+content = '''
+cmake_minimum_required(VERSION 3.17 FATAL_ERROR)
+
+project(CMakeTest LANGUAGES NONE)
+
+set(ENABLE_HOST_LANGUAGES C)
+include(cmake/HostBuild.cmake)
+
+{queries}
+'''
+
+query = '''
+get_host_compiler_info(C {name} OUTPUT)
+message(STATUS "{name}: ${{OUTPUT}}")
+'''
+
+def test_eager_detection(testing):
+    testing.write("CMakeLists.txt", content.format(queries=query.format(name="COMPILER_ABI")))
+    stdout = testing.configure_internal(options=["-DCMAKE_HOST_LAZY_COMPILER_INFO=OFF"]).stdout
+    assert 'Detecting HOSTC compiler ABI info - done' in stdout
+    assert 'Detecting HOSTC compiler ABI info - deferred' not in stdout
+    assert 'COMPILER_ABI: ELF' in stdout
+
+def test_lazy_detection_without_query(testing):
+    testing.write("CMakeLists.txt", content.format(queries=""))
+    stdout = testing.configure_internal().stdout
+    assert 'Detecting HOSTC compiler ABI info - deferred' in stdout
+    assert 'Detecting HOSTC compiler ABI info - done' not in stdout
+    assert not testing.exists(testing.internal_dir("CMakeDetermineCompilerABI_HOSTC.bin"))
+    assert 'set(CMAKE_HOSTC_COMPILER_WORKS TRUE)' in testing.read(testing.internal_dir("CMakeHOSTCCompiler.cmake"))
+
+def test_lazy_detection_on_query(testing):
+    queries = query.format(name="COMPILER_ABI") + query.format(name="IMPLICIT_INCLUDE_DIRECTORIES")
+    testing.write("CMakeLists.txt", content.format(queries=queries))
+    stdout = testing.configure_internal(options=["-DCMAKE_HOST_LAZY_COMPILER_INFO=ON"]).stdout
+    assert stdout.count('Detecting HOSTC compiler ABI info - done') == 1
+    assert 'COMPILER_ABI: ELF' in stdout
+    assert 'IMPLICIT_INCLUDE_DIRECTORIES: ' in stdout and '/usr/include' in stdout
+    assert 'set(CMAKE_HOSTC_ABI_COMPILED TRUE)' in testing.read(testing.internal_dir("CMakeHOSTCCompiler.cmake"))
+
+    # The queried information is saved for later configure runs
+    stdout = testing.configure_internal(options=["-DCMAKE_HOST_LAZY_COMPILER_INFO=ON"]).stdout
+    assert 'Detecting HOSTC compiler ABI info' not in stdout
+    assert 'COMPILER_ABI: ELF' in stdout
+
+def test_other_information(testing):
+    testing.write("CMakeLists.txt", content.format(queries=query.format(name="COMPILER_ID")))
+    stdout = testing.configure_internal(options=["-DCMAKE_HOST_LAZY_COMPILER_INFO=ON"]).stdout
+    assert 'COMPILER_ID: GNU' in stdout
+    assert 'Detecting HOSTC compiler ABI info - done' not in stdout
@@ -0,0 +1,161 @@
+#-*- coding: utf-8 -*-
+
+"""
+Copyright (c) 2026 LG Electronics Inc.
+SPDX-License-Identifier: MIT
+"""
+
+
+def read_generated(testing, path):
+    return [item for item in testing.read(path).strip().split(";") if item]
+
+def test_transitive_closure(testing):
+    content = '''
+    cmake_minimum_required(VERSION 3.17)
+    project(CMakeTest LANGUAGES NONE)
+    include(CMakePrintHelpers)
+    include(cmake/HostBuild.cmake)
+    add_host_library(bottom STATIC SOURCES bottom/bottom.c INCLUDE_DIRECTORIES PUBLIC bottom COMPILE_OPTIONS PUBLIC -DBOTTOM=0)
+    add_host_library(middle STATIC SOURCES middle/middle.c INCLUDE_DIRECTORIES PUBLIC middle LINK_LIBRARIES PUBLIC Host::bottom)
+    add_host_library(top STATIC SOURCES top/top.c INCLUDE_DIRECTORIES PUBLIC top LINK_LIBRARIES PUBLIC Host::middle Host::bottom)
+    get_host_transitive_properties(A "HOST-top")
+    cmake_print_variables(A_DEPENDENCIES)
+    file(GENERATE OUTPUT include_directories.txt CONTENT "${A_INCLUDE_DIRECTORIES}")
+    file(GENERATE OUTPUT compile_options.txt CONTENT "${A_COMPILE_OPTIONS}")
+    '''
+    testing.write("main.c", '#include "top.h"\nint main() { return top(); }')
+    testing.write("top/top.h", '#include "middle.h"\nint top(void);')
+    testing.write("top/top.c", '#include "top.h"\nint top(void) { return middle(); }')
+    testing.write("middle/middle.h", '#include "bottom.h"\nint middle(void);')
+    testing.write("middle/middle.c", '#include "middle.h"\nint middle(void) { return bottom(); }')
+    testing.write("bottom/bottom.h", "int bottom(void);")
+    testing.write("bottom/bottom.c", '#include "bottom.h"\nint bottom(void) { return BOTTOM; }')
+    testing.write("CMakeLists.txt", content)
+    stdout = testing.configure_internal().stdout
+    assert 'A_DEPENDENCIES="HOST-top;HOST-middle;HOST-bottom"' in stdout
+    workspace = testing.workspace
+    assert read_generated(testing, "include_directories.txt") == [f"{workspace}/top", f"{workspace}/middle", f"{workspace}/bottom"]
+    assert read_generated(testing, "compile_options.txt") == ["-DBOTTOM=0"]
+
+def test_link_indirect_libraries(testing):
+    content = '''
+    cmake_minimum_required(VERSION 3.17)
+    project(CMakeTest LANGUAGES NONE)
+    include(cmake/HostBuild.cmake)
+    add_host_library(bottom STATIC SOURCES bottom/bottom.c INCLUDE_DIRECTORIES PUBLIC bottom COMPILE_OPTIONS PUBLIC -DBOTTOM=0)
+    add_host_library(middle STATIC SOURCES middle/middle.c INCLUDE_DIRECTORIES PUBLIC middle LINK_LIBRARIES PUBLIC Host::bottom)
+    add_host_library(top STATIC SOURCES top/top.c INCLUDE_DIRECTORIES PUBLIC top LINK_LIBRARIES PUBLIC Host::middle Host::bottom)
+    add_host_executable(main SOURCES main.c LINK_LIBRARIES PRIVATE Host::top)
+    '''
+    testing.write("main.c", '#include "top.h"\nint main() { return top(); }')
+    testing.write("top/top.h", '#include "middle.h"\nint top(void);')
+    testing.write("top/top.c", '#include "top.h"\nint top(void) { return middle(); }')
+    testing.write("middle/middle.h", '#include "bottom.h"\nint middle(void);')
+    testing.write("middle/middle.c", '#include "middle.h"\nint middle(void) { return bottom(); }')
+    testing.write("bottom/bottom.h", "int bottom(void);")
+    testing.write("bottom/bottom.c", '#include "bottom.h"\nint bottom(void) { return BOTTOM; }')
+    testing.write("CMakeLists.txt", content)
+    testing.configure_internal().check_returncode()
+    process = testing.cmake("host-targets", verbose=True)
+    process.check_returncode()
+    build = testing.build
+    assert f'{build}/libtop.a {build}/libmiddle.a {build}/libbottom.a' in process.stdout
+    assert f'{build}/libbottom.a {build}/libbottom.a' not in process.stdout
+
+def test_link_libraries_defined_later(testing):
+    content = '''
+    cmake_minimum_required(VERSION 3.17)
+    project(CMakeTest LANGUAGES NONE)
+    include(cmake/HostBuild.cmake)
+    add_host_executable(main SOURCES main.c LINK_LIBRARIES PRIVATE Host::top)
+    add_host_library(top STATIC SOURCES top/top.c INCLUDE_DIRECTORIES PUBLIC top LINK_LIBRARIES PUBLIC Host::middle)
+    add_host_library(middle STATIC SOURCES middle/middle.c INCLUDE_DIRECTORIES PUBLIC middle LINK_LIBRARIES PUBLIC Host::bottom)
+    add_host_library(bottom STATIC SOURCES bottom/bottom.c INCLUDE_DIRECTORIES PUBLIC bottom COMPILE_OPTIONS PUBLIC -DBOTTOM=0)
+    '''
+    testing.write("main.c", '#include "top.h"\nint main() { return top(); }')
+    testing.write("top/top.h", '#include "middle.h"\nint top(void);')
+    testing.write("top/top.c", '#include "top.h"\nint top(void) { return middle(); }')
+    testing.write("middle/middle.h", '#include "bottom.h"\nint middle(void);')
+    testing.write("middle/middle.c", '#include "middle.h"\nint middle(void) { return bottom(); }')
+    testing.write("bottom/bottom.h", "int bottom(void);")
+    testing.write("bottom/bottom.c", '#include "bottom.h"\nint bottom(void) { return BOTTOM; }')
+    testing.write("CMakeLists.txt", content)
+    testing.configure_internal().check_returncode()
+    process = testing.cmake("host-targets", verbose=True)
+    process.check_returncode()
+    build = testing.build
+    assert f'{build}/libtop.a {build}/libmiddle.a {build}/libbottom.a' in process.stdout
+
+def test_private_libraries_of_shared_library(testing):
+    content = '''
+    cmake_minimum_required(VERSION 3.17)
+    project(CMakeTest LANGUAGES NONE)
+    include(CMakePrintHelpers)
+    include(cmake/HostBuild.cmake)
+    add_host_library(bottom STATIC SOURCES bottom/bottom.c INCLUDE_DIRECTORIES PUBLIC bottom COMPILE_OPTIONS PUBLIC -DBOTTOM=0)
+    add_host_library(middle SHARED SOURCES middle/middle.c INCLUDE_DIRECTORIES PUBLIC middle LINK_LIBRARIES PRIVATE Host::bottom)
+    get_host_transitive_properties(A "HOST-middle")
+    cmake_print_variables(A_RUNTIME_DIRECTORIES)
+    file(GENERATE OUTPUT link_options.txt CONTENT "${A_LINK_OPTIONS}")
+    '''
+    testing.write("main.c", '#include "top.h"\nint main() { return top(); }')
+    testing.write("top/top.h", '#include "middle.h"\nint top(void);')
+    testing.write("top/top.c", '#include "top.h"\nint top(void) { return middle(); }')
+    testing.write("middle/middle.h", '#include "bottom.h"\nint middle(void);')
+    testing.write("middle/middle.c", '#include "middle.h"\nint middle(void) { return bottom(); }')
+    testing.write("bottom/bottom.h", "int bottom(void);")
+    testing.write("bottom/bottom.c", '#include "bottom.h"\nint bottom(void) { return BOTTOM; }')
+    testing.write("CMakeLists.txt", content)
+    stdout = testing.configure_internal().stdout
+    assert read_generated(testing, "link_options.txt") == [f"-L{testing.build}", "-lmiddle"]
+    assert f'A_RUNTIME_DIRECTORIES="{testing.build}"' in stdout
+
+def test_keep_repeated_options(testing):
+    content = '''
+    cmake_minimum_required(VERSION 3.17)
+    project(CMakeTest LANGUAGES NONE)
+    include(cmake/HostBuild.cmake)
+    add_host_library(bottom STATIC SOURCES bottom/bottom.c INCLUDE_DIRECTORIES PUBLIC bottom COMPILE_OPTIONS PUBLIC -DBOTTOM=0 -include first.h -include second.h)
+    add_host_library(middle STATIC SOURCES middle/middle.c INCLUDE_DIRECTORIES PUBLIC middle LINK_LIBRARIES PUBLIC Host::bottom)
+    add_host_executable(main SOURCES main.c LINK_LIBRARIES PRIVATE Host::middle)
+    '''
+    testing.write("bottom/first.h", "#define FIRST 1")
+    testing.write("bottom/second.h", "#define SECOND 2")
+    testing.write("bottom/bottom.h", "int bottom(void);")
+    testing.write("bottom/bottom.c", '#include "bottom.h"\nint bottom(void) { return FIRST + SECOND - 3; }')
+    testing.write("middle/middle.h", '#include "bottom.h"\nint middle(void);')
+    testing.write("middle/middle.c", '#include "middle.h"\nint middle(void) { return bottom(); }')
+    testing.write("main.c", '#include "middle.h"\nint main() { return middle() + FIRST + SECOND - 3; }')
+    testing.write("CMakeLists.txt", content)
+    testing.configure_internal().check_returncode()
+    process = testing.cmake("host-targets", verbose=True)
+    process.check_returncode()
+    assert "-include first.h -include second.h" in process.stdout
+    assert testing.execute(f"{testing.build}/main").returncode == 0
+
+def test_interface_properties_set_later(testing):
+    content = '''
+    cmake_minimum_required(VERSION 3.17)
+    project(CMakeTest LANGUAGES NONE)
+    include(cmake/HostBuild.cmake)
+    add_host_library(bottom STATIC SOURCES bottom/bottom.c INCLUDE_DIRECTORIES PUBLIC bottom)
+    add_host_library(middle STATIC SOURCES middle/middle.c INCLUDE_DIRECTORIES PUBLIC middle LINK_LIBRARIES PUBLIC Host::bottom)
+    add_host_library(top STATIC SOURCES top/top.c INCLUDE_DIRECTORIES PUBLIC top LINK_LIBRARIES PUBLIC Host::middle)
+    set_host_target_properties(Host::bottom INTERFACE_COMPILE_OPTIONS -DBOTTOM=0)
+    add_host_executable(main SOURCES main.c LINK_LIBRARIES PRIVATE Host::top)
+    '''
+    testing.write("main.c", '#include "top.h"\nint main() { return top(); }')
+    testing.write("top/top.h", '#include "middle.h"\nint top(void);')
+    testing.write("top/top.c", '#include "top.h"\nint top(void) { return middle(); }')
+    testing.write("middle/middle.h", '#include "bottom.h"\nint middle(void);')
+    testing.write("middle/middle.c", '#include "middle.h"\nint middle(void) { return bottom(); }')
+    testing.write("bottom/bottom.h", "int bottom(void);")
+    testing.write("bottom/bottom.c", '#include "bottom.h"\nint bottom(void) { return BOTTOM; }')
+    testing.write("bottom/bottom.c", '#include "bottom.h"\nint bottom(void) { return 0; }')
+    testing.write("main.c", '#include "top.h"\nint main() { return top() + BOTTOM; }')
+    testing.write("CMakeLists.txt", content)
+    testing.configure_internal().check_returncode()
+    process = testing.cmake("host-targets", verbose=True)
+    process.check_returncode()
+    assert "-DBOTTOM=0" in process.stdout
+    assert testing.execute(f"{testing.build}/main").returncode == 0
@@ -225,3 +225,27 @@ def test_multiple_test_groups(testing):
     assert "GroupA.test1" in stdout
     assert "GroupA.test2" in stdout
     assert "GroupB.test1" in stdout
+
+def test_shards(testing):
+    test_file = '''
+    #include <gtest/gtest.h>
+    TEST(Test, test1) { SUCCEED(); }
+    TEST(Test, test2) { SUCCEED(); }
+    TEST(Other, test1) { GTEST_SKIP(); }
+    int main(int argc, char* argv[]) {
+      ::testing::InitGoogleTest(&argc, argv);
+      return RUN_ALL_TESTS();
+    }
+    '''
+    testing.copytree("tests/project/external/gtest", "")
+    testing.write("CMakeLists.txt", content.replace("gtest_add_host_tests(Host::unittest)", "gtest_add_host_tests(Host::unittest SHARDS 3)"))
+    testing.write("test_file.cpp", test_file)
+    testing.configure_internal().check_returncode()
+    testing.cmake("host-targets").check_returncode()
+    stdout = testing.ctest("--verbose").stdout
+    assert "unittest.shard1 ..................   Passed" in stdout
+    assert "unittest.shard2 ..................   Passed" in stdout
+    assert "unittest.shard3 ..................   Passed" in stdout
+    assert stdout.count("Test.test1 ... Passed") == 1
+    assert stdout.count("Test.test2 ... Passed") == 1
+    assert stdout.count("Other.test1 ... Skipped") == 1
@@ -87,6 +87,36 @@ def test_counter(testing):
     assert testing.exists("unittest[1]_tests.cmake")
     assert testing.exists("unittest[2]_tests.cmake")
 
+def test_discovery_mode_argument(testing):
+    testing.copytree("tests/project/external/gtest", "")
+    testing.write("CMakeLists.txt", content)
+    testing.write("test_file.cpp", test_file)
+    testing.configure_internal(options=['-DEXTRA_ARGS="DISCOVERY_MODE;PRE_TEST"']).check_returncode()
+    testing.cmake("host-targets").check_returncode()
+    assert not testing.exists("unittest[1]_tests.cmake")
+    assert "Test.test ........................   Passed" in testing.ctest().stdout
+    assert testing.exists("unittest[1]_tests.cmake")
+
+def test_global_discovery_mode(testing):
+    testing.copytree("tests/project/external/gtest", "")
+    testing.write("CMakeLists.txt", content)
+    testing.write("test_file.cpp", test_file)
+    testing.configure_internal(options=["-DCMAKE_HOST_TEST_DISCOVERY_MODE=PRE_TEST"]).check_returncode()
+    testing.cmake("host-targets").check_returncode()
+    assert not testing.exists("unittest[1]_tests.cmake")
+    assert "Test.test ........................   Passed" in testing.ctest().stdout
+
+    testing.write("test_file.cpp", test_file.replace("TEST(Test, test)", "TEST(Test, other)"))
+    testing.cmake("host-targets").check_returncode()
+    assert "Test.other .......................   Passed" in testing.ctest().stdout
+
+def test_invalid_discovery_mode_argument(testing):
+    testing.copytree("tests/project/external/gtest", "")
+    testing.write("CMakeLists.txt", content)
+    testing.write("test_file.cpp", test_file)
+    stderr = testing.configure_internal(options=['-DEXTRA_ARGS="DISCOVERY_MODE;LATER"']).stderr
+    assert "DISCOVERY_MODE must be one of POST_BUILD or PRE_TEST: LATER" in stderr
+
 def test_blank_file(testing):
     test_file = '''
     int main(int argc, const char* argv[]) {
@@ -260,3 +290,31 @@ def test_with_parameterized(testing):
     testing.configure_internal().check_returncode()
     testing.cmake("host-targets").check_returncode()
     assert "SimpleValues/AddTest.add/(1, 2) ...   Passed" in testing.ctest().stdout
+
+def test_shards_argument(testing):
+    test_file = '''
+    #include <gtest/gtest.h>
+    TEST(Test, test1) { SUCCEED(); }
+    TEST(Test, test2) { SUCCEED(); }
+    TEST(Test, test3) { FAIL(); }
+    TEST(Test, DISABLED_test4) { FAIL(); }
+    int main(int argc, char* argv[]) {
+      ::testing::InitGoogleTest(&argc, argv);
+      return RUN_ALL_TESTS();
+    }
+    '''
+    testing.copytree("tests/project/external/gtest", "")
+    testing.write("CMakeLists.txt", content)
+    testing.write("test_file.cpp", test_file)
+    testing.configure_internal(options=['-DEXTRA_ARGS="SHARDS;2"']).check_returncode()
+    testing.cmake("host-targets").check_returncode()
+    assert not testing.exists("unittest[1]_tests.cmake")
+    stdout = testing.ctest("--verbose").stdout
+    assert "unittest.shard1" in stdout
+    assert "unittest.shard2" in stdout
+    assert "unittest.shard3" not in stdout
+    assert "Test.test1 ... Passed" in stdout
+    assert "Test.test2 ... Passed" in stdout
+    assert "Test.test3 ... Failed" in stdout
+    assert testing.exists("unittest.shard1.xml")
+    assert testing.exists("unittest.shard2.xml")
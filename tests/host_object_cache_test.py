@@ -0,0 +1,91 @@
+#-*- coding: utf-8 -*-
+
+"""
+Copyright (c) 2026 LG Electronics Inc.
+SPDX-License-Identifier: MIT
+"""
+
+import glob
+import os
+import shutil
+import time
+
+
+content = '''
+cmake_minimum_required(VERSION 3.17)
+project(CMakeTest LANGUAGES NONE)
+include(cmake/HostBuild.cmake)
+add_host_executable(main SOURCES main.c hello.c)
+'''
+
+def cached_objects(cache):
+    return glob.glob(os.path.join(cache, "??", "*.o"))
+
+def test_restore_objects_in_fresh_tree(testing):
+    testing.write("CMakeLists.txt", content)
+    testing.write("main.c", "int hello(void);\nint main(void) { return hello(); }")
+    testing.write("hello.c", "int hello(void) { return 0; }")
+    cache = os.path.join(testing.workspace, "cache")
+    testing.configure_internal(options=[f"-DCMAKE_HOST_OBJECT_CACHE_DIR={cache}"]).check_returncode()
+    stdout = testing.cmake("host-targets").stdout
+    assert "Host object cache: 0 hits, 2 misses (0% hit rate)" in stdout
+    assert len(cached_objects(cache)) == 2
+
+    shutil.rmtree(testing.build)
+    testing.configure_internal(options=[f"-DCMAKE_HOST_OBJECT_CACHE_DIR={cache}"]).check_returncode()
+    stdout = testing.cmake("host-targets").stdout
+    assert "Host object cache: 2 hits, 0 misses (100% hit rate)" in stdout
+    assert testing.execute(os.path.join(testing.build, "main")).returncode == 0
+    assert "hello.c" in testing.read("CMakeFiles/HOST-main.dir/hello.c.o.d")
+
+def test_miss_on_source_change(testing):
+    testing.write("CMakeLists.txt", content)
+    testing.write("main.c", "int hello(void);\nint main(void) { return hello(); }")
+    testing.write("hello.c", "int hello(void) { return 0; }")
+    cache = os.path.join(testing.workspace, "cache")
+    testing.configure_internal(options=[f"-DCMAKE_HOST_OBJECT_CACHE_DIR={cache}"]).check_returncode()
+    testing.cmake("host-targets").check_returncode()
+
+    time.sleep(1)
+    testing.write("main.c", "int hello(void);\nint main(void) { return hello(); }")
+    testing.write("hello.c", "int hello(void) { return 3; }")
+    stdout = testing.cmake("host-targets").stdout
+    assert "Host object cache: 1 hits, 1 misses (50% hit rate)" in stdout
+    assert testing.execute(os.path.join(testing.build, "main")).returncode == 3
+    assert len(cached_objects(cache)) == 3
+
+def test_evict_least_recently_used_objects(testing):
+    testing.write("CMakeLists.txt", content)
+    testing.write("main.c", "int hello(void);\nint main(void) { return hello(); }")
+    testing.write("hello.c", "int hello(void) { return 0; }")
+    cache = os.path.join(testing.workspace, "cache")
+    testing.configure_internal(options=[
+        f"-DCMAKE_HOST_OBJECT_CACHE_DIR={cache}",
+        "-DCMAKE_HOST_OBJECT_CACHE_MAX_SIZE=2K",
+    ]).check_returncode()
+    testing.cmake("host-targets").check_returncode()
+    assert len(cached_objects(cache)) == 1
+
+def test_report_compile_errors(testing):
+    testing.write("CMakeLists.txt", content)
+    testing.write("main.c", "int hello(void);\nint main(void) { return hello(); }")
+    testing.write("hello.c", "int hello(void) { return 0; }")
+    testing.write("hello.c", "int hello(void) { return undefined; }")
+    cache = os.path.join(testing.workspace, "cache")
+    testing.configure_internal(options=[f"-DCMAKE_HOST_OBJECT_CACHE_DIR={cache}"]).check_returncode()
+    result = testing.cmake("host-targets")
+    assert result.returncode != 0
+    assert "undefined" in result.stderr
+    assert "Failed to compile the host object" in result.stderr
+    assert len(cached_objects(cache)) <= 1
+
+def test_skip_coverage_objects(testing):
+    testing.write("CMakeLists.txt", content)
+    testing.write("main.c", "int hello(void);\nint main(void) { return hello(); }")
+    testing.write("hello.c", "int hello(void) { return 0; }")
+    testing.write("CMakeLists.txt", content.replace("hello.c)", "hello.c COMPILE_OPTIONS PRIVATE --coverage LINK_OPTIONS PRIVATE --coverage)"))
+    cache = os.path.join(testing.workspace, "cache")
+    testing.configure_internal(options=[f"-DCMAKE_HOST_OBJECT_CACHE_DIR={cache}"]).check_returncode()
+    testing.cmake("host-targets").check_returncode()
+    assert testing.exists("CMakeFiles/HOST-main.dir/hello.c.gcno")
+    assert len(cached_objects(cache)) == 0
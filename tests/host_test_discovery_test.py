@@ -0,0 +1,115 @@
+#-*- coding: utf-8 -*-
+
+"""
+Copyright (c) 2026 LG Electronics Inc.
+SPDX-License-Identifier: MIT
+"""
+
+import os
+
+
+content = '''
+cmake_minimum_required(VERSION 3.17 FATAL_ERROR)
+project(CMakeTest LANGUAGES NONE)
+include(cmake/HostTest.cmake)
+enable_testing()
+add_host_library(unity_fixture STATIC
+  SOURCES unity.c unity_fixture.c
+  INCLUDE_DIRECTORIES PUBLIC ${CMAKE_CURRENT_LIST_DIR}
+  COMPILE_OPTIONS PUBLIC -DUNITY_FIXTURE_NO_EXTRAS
+)
+foreach(name first second)
+  add_host_executable(${name}
+    SOURCES ${name}.c
+    LINK_LIBRARIES PRIVATE Host::unity_fixture
+  )
+  unity_fixture_discover_host_tests(Host::${name} ${EXTRA_ARGS})
+endforeach()
+'''
+
+test_file = '''
+#include <unity_fixture.h>
+
+TEST_GROUP(Test);
+TEST_SETUP(Test) { }
+TEST_TEAR_DOWN(Test) { }
+
+TEST(Test, NAME) { TEST_ASSERT_TRUE(1); }
+
+static void runAllTests(void) {
+  RUN_TEST_CASE(Test, NAME);
+}
+int main(int argc, const char* argv[]) {
+  return UnityMain(argc, argv, runAllTests);
+}
+'''
+
+def test_discover_after_build(testing):
+    testing.copytree("tests/project/external/unity", "")
+    testing.write("CMakeLists.txt", content)
+    testing.write("first.c", test_file.replace("NAME", "first"))
+    testing.write("second.c", test_file.replace("NAME", "second"))
+    testing.configure_internal(options=[
+        "-DCMAKE_HOST_TEST_DISCOVERY_DRIVER=ON",
+        "-DCMAKE_HOST_TEST_DISCOVERY_JOBS=2",
+    ]).check_returncode()
+    stdout = testing.cmake("host-targets").stdout
+    assert f"Discovering tests in {os.path.join(testing.build, 'first')} - done (" in stdout
+    assert f"Discovering tests in {os.path.join(testing.build, 'second')} - done (" in stdout
+    assert "Discovered tests of 2 executables with 2 jobs in" in stdout
+    stdout = testing.ctest().stdout
+    assert "Test.first .......................   Passed" in stdout
+    assert "Test.second ......................   Passed" in stdout
+
+    # Only the stale discoveries run again
+    assert "Discovering tests in" not in testing.cmake("host-targets").stdout
+    testing.write("second.c", test_file.replace("NAME", "other"))
+    stdout = testing.cmake("host-targets").stdout
+    assert "Discovered tests of 1 executables with 2 jobs in" in stdout
+    assert "Test.other .......................   Passed" in testing.ctest().stdout
+
+def test_discover_before_test(testing):
+    testing.copytree("tests/project/external/unity", "")
+    testing.write("CMakeLists.txt", content)
+    testing.write("first.c", test_file.replace("NAME", "first"))
+    testing.write("second.c", test_file.replace("NAME", "second"))
+    testing.configure_internal(options=[
+        "-DCMAKE_HOST_TEST_DISCOVERY_DRIVER=ON",
+        "-DCMAKE_HOST_TEST_DISCOVERY_MODE=PRE_TEST",
+    ]).check_returncode()
+    assert "Discovering tests in" not in testing.cmake("host-targets").stdout
+    assert not testing.exists("first[1]_tests.cmake")
+    stdout = testing.ctest().stdout
+    assert "Discovered tests of 2 executables with" in stdout
+    assert "Test.first .......................   Passed" in stdout
+    assert "Test.second ......................   Passed" in stdout
+
+def test_discovery_timeout(testing):
+    testing.copytree("tests/project/external/unity", "")
+    testing.write("CMakeLists.txt", content)
+    testing.write("first.c", test_file.replace("NAME", "first"))
+    testing.write("second.c", test_file.replace("NAME", "second"))
+    testing.write("second.c", "#include <unistd.h>\nint main(void) { sleep(10); return 0; }")
+    testing.configure_internal(options=[
+        "-DCMAKE_HOST_TEST_DISCOVERY_DRIVER=ON",
+        '-DEXTRA_ARGS="DISCOVERY_TIMEOUT;1"',
+    ]).check_returncode()
+    result = testing.cmake("host-targets")
+    assert result.returncode != 0
+    assert f"Discovering tests in {os.path.join(testing.build, 'first')} - done (" in result.stdout
+    assert f"Discovering tests in {os.path.join(testing.build, 'second')} - failed (" in result.stdout
+    assert "Process terminated due to timeout" in result.stderr
+
+def test_discover_single_target(testing):
+    testing.copytree("tests/project/external/unity", "")
+    testing.write("CMakeLists.txt", content)
+    testing.write("first.c", test_file.replace("NAME", "first"))
+    testing.write("second.c", test_file.replace("NAME", "second"))
+    testing.configure_internal(options=[
+        "-DCMAKE_HOST_TEST_DISCOVERY_DRIVER=ON",
+    ]).check_returncode()
+    testing.cmake("HOST-first").check_returncode()
+    stdout = testing.ctest().stdout
+    assert "Discovered tests of 1 executables with" in stdout
+    assert "Test.first .......................   Passed" in stdout
+    assert "second_NOT_BUILT" in stdout
@@ -0,0 +1,40 @@
+#-*- coding: utf-8 -*-
+
+"""
+Copyright (c) 2026 LG Electronics Inc.
+SPDX-License-Identifier: MIT
+"""
+
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "benchmarks"))
+import hosta_benchmark
+
+
+def test_synthetic_project(testing):
+    project = hosta_benchmark.SyntheticProject(static=3, shared=1, interface=1, sources=2, fanout=2, unity_fixture_tests=1)
+    project.write(testing)
+    testing.configure_internal().check_returncode()
+    testing.cmake("host-targets").check_returncode()
+    assert testing.exists("libs/lib00000/liblib00000.a")
+    assert "100% tests passed" in testing.ctest().stdout
+
+def test_benchmark_report(testing):
+    output = os.path.join(testing.workspace, "result.json")
+    hosta_benchmark.main([
+        "--static", "2",
+        "--interface", "1",
+        "--generator", "Unix Makefiles",
+        "--workdir", os.path.join(testing.workspace, "benchmark"),
+        "--output", output,
+    ])
+    with open(output, "r") as f:
+        report = json.load(f)
+    assert report["project"]["static"] == 2
+    assert report["targets"] == {"libraries": 3, "executables": 1, "tests": 0}
+    result = report["results"][0]
+    assert result["generator"] == "Unix Makefiles"
+    for key in ("configure_s", "generate_s", "build_s", "null_build_s", "touch_build_s"):
+        assert result[key] >= 0
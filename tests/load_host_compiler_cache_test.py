@@ -0,0 +1,68 @@
+#-*- coding: utf-8 -*-
+
+"""
+Copyright (c) 2026 LG Electronics Inc.
+SPDX-License-Identifier: MIT
+"""
+
+import glob
+import os
+
+
+content = '''
+cmake_minimum_required(VERSION 3.17 FATAL_ERROR)
+
+project(CMakeTest LANGUAGES NONE)
+
+set(ENABLE_HOST_LANGUAGES C)
+include(cmake/HostBuild.cmake)
+
+message(STATUS "CMAKE_HOSTC_COMPILER: ${CMAKE_HOSTC_COMPILER}")
+message(STATUS "CMAKE_HOSTC_COMPILER_VERSION: ${CMAKE_HOSTC_COMPILER_VERSION}")
+'''
+
+def cache_files(testing):
+    return glob.glob(os.path.join(testing.workspace, "cache", "CMakeHOSTCCompiler-*.cmake"))
+
+def configure(testing, build):
+    testing.build = os.path.join(testing.workspace, build)
+    return testing.configure_internal(options=[f'-DCMAKE_HOST_COMPILER_CACHE_DIR={testing.workspace}/cache'])
+
+def test_disabled_by_default(testing):
+    testing.write("CMakeLists.txt", content)
+    testing.configure_internal().check_returncode()
+    assert len(cache_files(testing)) == 0
+
+def test_save_cache(testing):
+    testing.write("CMakeLists.txt", content)
+    output = configure(testing, "first").stdout
+    assert 'Check for working HOSTC compiler' in output
+    assert len(cache_files(testing)) == 1
+
+def test_load_cache_in_fresh_build_tree(testing):
+    testing.write("CMakeLists.txt", content)
+    configure(testing, "first").check_returncode()
+    for cache_file in cache_files(testing):
+        with open(cache_file, "a") as f:
+            f.write('set(CMAKE_HOSTC_COMPILER_VERSION "99.9.9")\n')
+
+    output = configure(testing, "second").stdout
+    assert 'Check for working HOSTC compiler' not in output
+    assert f'Loading HOSTC compiler info from {testing.workspace}/cache - done' in output
+    assert 'CMAKE_HOSTC_COMPILER_VERSION: 99.9.9' in output
+    assert 'CMAKE_HOSTC_COMPILER_VERSION "99.9.9"' in testing.read(testing.internal_dir("CMakeHOSTCCompiler.cmake"))
+
+def test_modified_compiler(testing):
+    testing.write("CMakeLists.txt", content)
+    testing.write("bin/gcc", '#!/bin/sh\nexec gcc "$@"\n')
+    os.chmod(os.path.join(testing.workspace, "bin/gcc"), 0o755)
+    options = [f'-DCMAKE_HOSTC_COMPILER_LIST={testing.workspace}/bin/gcc']
+    testing.build = os.path.join(testing.workspace, "first")
+    testing.configure_internal(options=[f'-DCMAKE_HOST_COMPILER_CACHE_DIR={testing.workspace}/cache'] + options).check_returncode()
+    assert len(cache_files(testing)) == 1
+
+    os.utime(os.path.join(testing.workspace, "bin/gcc"), (0, 0))
+    testing.build = os.path.join(testing.workspace, "second")
+    output = testing.configure_internal(options=[f'-DCMAKE_HOST_COMPILER_CACHE_DIR={testing.workspace}/cache'] + options).stdout
+    assert 'Check for working HOSTC compiler' in output
+    assert len(cache_files(testing)) == 2
@@ -0,0 +1,62 @@
+#-*- coding: utf-8 -*-
+
+"""
+Copyright (c) 2026 LG Electronics Inc.
+SPDX-License-Identifier: MIT
+"""
+
+import os
+
+
+content = '''
+cmake_minimum_required(VERSION 3.17 FATAL_ERROR)
+
+project(CMakeTest LANGUAGES {languages})
+
+set(ENABLE_HOST_LANGUAGES C)
+include(cmake/HostBuild.cmake)
+'''
+
+def test_reuse_same_compiler(testing):
+    testing.write("CMakeLists.txt", content.format(languages="C"))
+    output = testing.configure_internal(options=["-DCMAKE_C_COMPILER=gcc", "-DCMAKE_HOSTC_COMPILER_LIST=gcc"]).stdout
+    assert 'Reusing C compiler info for HOSTC compiler - done' in output
+    assert 'Check for working HOSTC compiler' not in output
+    assert not testing.exists(testing.internal_dir("CompilerIdHOSTC"))
+
+def test_same_preferences_as_detection(testing):
+    testing.write("CMakeLists.txt", content.format(languages="C"))
+    testing.configure_internal(options=["-DCMAKE_C_COMPILER=gcc", "-DCMAKE_HOSTC_COMPILER_LIST=gcc"]).check_returncode()
+    reused = testing.read(testing.internal_dir("CMakeHOSTCCompiler.cmake"))
+
+    testing.write("CMakeLists.txt", content.format(languages="NONE"))
+    testing.build = os.path.join(testing.workspace, "detected")
+    output = testing.configure_internal(options=["-DCMAKE_HOSTC_COMPILER_LIST=gcc", "-DCMAKE_HOST_LAZY_COMPILER_INFO=OFF"]).stdout
+    assert 'Check for working HOSTC compiler' in output
+    assert reused == testing.read(testing.internal_dir("CMakeHOSTCCompiler.cmake"))
+
+def test_no_target_language(testing):
+    testing.write("CMakeLists.txt", content.format(languages="NONE"))
+    output = testing.configure_internal().stdout
+    assert 'Reusing C compiler info' not in output
+    assert 'Check for working HOSTC compiler' in output
+
+def test_different_compiler(testing):
+    testing.write("bin/gcc", '#!/bin/sh\nexec gcc "$@"\n')
+    os.chmod(os.path.join(testing.workspace, "bin/gcc"), 0o755)
+    testing.write("CMakeLists.txt", content.format(languages="C"))
+    output = testing.configure_internal(options=["-DCMAKE_C_COMPILER=gcc", f"-DCMAKE_HOSTC_COMPILER_LIST={testing.workspace}/bin/gcc"]).stdout
+    assert 'Reusing C compiler info' not in output
+    assert 'Check for working HOSTC compiler' in output
+
+def test_cross_compiling(testing):
+    testing.write("CMakeLists.txt", content.format(languages="C"))
+    output = testing.configure_internal(options=["-DCMAKE_C_COMPILER=gcc", "-DCMAKE_HOSTC_COMPILER_LIST=gcc", "-DCMAKE_SYSTEM_NAME=Generic"]).stdout
+    assert 'Reusing C compiler info' not in output
+    assert 'Check for working HOSTC compiler' in output
+
+def test_different_flags(testing):
+    testing.write("CMakeLists.txt", content.format(languages="C"))
+    output = testing.configure_internal(options=["-DCMAKE_C_COMPILER=gcc", "-DCMAKE_HOSTC_COMPILER_LIST=gcc", "-DCMAKE_C_FLAGS=-fno-common"]).stdout
+    assert 'Reusing C compiler info' not in output
+    assert 'Check for working HOSTC compiler' in output
@@ -0,0 +1,147 @@
+#-*- coding: utf-8 -*-
+
+"""
+Copyright (c) 2026 LG Electronics Inc.
+SPDX-License-Identifier: MIT
+"""
+
+import glob
+import os
+import re
+import time
+
+
+content = '''
+cmake_minimum_required(VERSION 3.17 FATAL_ERROR)
+
+project(CMakeTest LANGUAGES NONE)
+
+include(cmake/HostBuild.cmake)
+queue_host_file_dependencies(C first SOURCE first.c)
+queue_host_file_dependencies(C second SOURCE second.c INCLUDE_DIRECTORIES -I${{CMAKE_CURRENT_SOURCE_DIR}}/hello)
+queue_host_file_dependencies(C third SOURCE third.c COMPILE_OPTIONS -DHELLO)
+scan_host_file_dependencies()
+
+foreach(index ${{first}} ${{second}} ${{third}})
+  get_property(OUTPUT DIRECTORY PROPERTY HOST_DEPENDENCY_SCAN_${{index}}_RESULT)
+  message(STATUS "OUTPUT[${{index}}]=${{OUTPUT}}")
+endforeach()
+'''
+
+def test_scan_multiple_sources(testing):
+    testing.write("hello/hello.h", "void hello() {}")
+    testing.write("first.c", "int main() { return 0; }")
+    testing.write("second.c", '#include "hello.h"\nint main() { hello(); return 0; }')
+    testing.write("third.c", '#ifdef HELLO\n #include "hello/hello.h"\n #endif\n int main() { return 0; }')
+    testing.write("CMakeLists.txt", content.format())
+    output = testing.configure_internal().stdout
+    assert f'OUTPUT[0]={testing.workspace}/first.c\n' in output
+    assert f'OUTPUT[1]={testing.workspace}/second.c;{testing.workspace}/hello/hello.h\n' in output
+    assert f'OUTPUT[2]={testing.workspace}/third.c;{testing.workspace}/hello/hello.h\n' in output
+
+def test_scan_with_single_job(testing):
+    testing.write("hello/hello.h", "void hello() {}")
+    testing.write("first.c", "int main() { return 0; }")
+    testing.write("second.c", '#include "hello.h"\nint main() { hello(); return 0; }')
+    testing.write("third.c", '#ifdef HELLO\n #include "hello/hello.h"\n #endif\n int main() { return 0; }')
+    testing.write("CMakeLists.txt", content.format())
+    output = testing.configure_internal(options=["-DCMAKE_HOST_DEPENDENCY_SCAN_JOBS=1"]).stdout
+    assert f'OUTPUT[0]={testing.workspace}/first.c\n' in output
+    assert f'OUTPUT[1]={testing.workspace}/second.c;{testing.workspace}/hello/hello.h\n' in output
+    assert f'OUTPUT[2]={testing.workspace}/third.c;{testing.workspace}/hello/hello.h\n' in output
+
+def test_scan_failure_falls_back_to_source(testing):
+    testing.write("hello/hello.h", "void hello() {}")
+    testing.write("first.c", "int main() { return 0; }")
+    testing.write("second.c", '#include "hello.h"\nint main() { hello(); return 0; }')
+    testing.write("third.c", '#ifdef HELLO\n #include "hello/hello.h"\n #endif\n int main() { return 0; }')
+    testing.write("second.c", '#include "unknown.h"\nint main() { return 0; }')
+    testing.write("CMakeLists.txt", content.format())
+    output = testing.configure_internal().stdout
+    assert f'OUTPUT[1]={testing.workspace}/second.c\n' in output
+    assert f'OUTPUT[2]={testing.workspace}/third.c;{testing.workspace}/hello/hello.h\n' in output
+
+def test_object_dependencies(testing):
+    content = '''
+    cmake_minimum_required(VERSION 3.17 FATAL_ERROR)
+    project(CMakeTest LANGUAGES NONE)
+    include(cmake/HostBuild.cmake)
+    add_host_executable(main SOURCES main.c)
+    add_host_library(hello STATIC SOURCES hello.c)
+    '''
+    testing.write("hello.h", "void hello(void);")
+    testing.write("main.c", '#include "hello.h"\nint main() { return 0; }')
+    testing.write("hello.c", '#include "hello.h"\nvoid hello(void) {}')
+    testing.write("CMakeLists.txt", content)
+    testing.configure_internal(options=["-DCMAKE_HOST_DEPFILE_ONLY=OFF"]).check_returncode()
+    assert f'{testing.workspace}/hello.h' in testing.read("CMakeFiles/HOST-main.dir/build.make")
+    assert f'{testing.workspace}/hello.h' in testing.read("CMakeFiles/HOST-hello.dir/build.make")
+
+def test_depfile_only_object_dependencies(testing):
+    content = '''
+    cmake_minimum_required(VERSION 3.17 FATAL_ERROR)
+    project(CMakeTest LANGUAGES NONE)
+    include(cmake/HostBuild.cmake)
+    add_host_executable(main SOURCES main.c)
+    '''
+    testing.write("hello.h", "static int hello(void) { return 0; }")
+    testing.write("main.c", '#include "hello.h"\nint main() { return hello(); }')
+    testing.write("CMakeLists.txt", content)
+    testing.configure_internal().check_returncode()
+    assert f'{testing.workspace}/hello.h' not in testing.read("CMakeFiles/HOST-main.dir/build.make")
+    assert not testing.exists(testing.internal_dir("dependencies"))
+    testing.cmake("host-targets").check_returncode()
+
+    obj_path = os.path.join(testing.build, "CMakeFiles/HOST-main.dir/main.c.o")
+    mtime_before = os.path.getmtime(obj_path)
+    time.sleep(1)
+    testing.write("hello.h", "static int hello(void) { return 1; }")
+    testing.cmake("host-targets").check_returncode()
+    assert os.path.getmtime(obj_path) > mtime_before
+
+def corrupt_cached_dependencies(testing, value):
+    stamp_files = glob.glob(os.path.join(testing.build, testing.internal_dir("dependencies"), "*.cmake"))
+    assert len(stamp_files) > 0, "No cached dependency scan found"
+    for stamp_file in stamp_files:
+        with open(stamp_file, "r") as f:
+            original = f.read()
+        with open(stamp_file, "w") as f:
+            f.write(re.sub(r'set\(_cached_dependencies \[==\[.*\]==\]\)', f'set(_cached_dependencies [==[{value}]==])', original))
+
+def test_reuse_cached_results(testing):
+    testing.write("hello/hello.h", "void hello() {}")
+    testing.write("first.c", "int main() { return 0; }")
+    testing.write("second.c", '#include "hello.h"\nint main() { hello(); return 0; }')
+    testing.write("third.c", '#ifdef HELLO\n #include "hello/hello.h"\n #endif\n int main() { return 0; }')
+    testing.write("CMakeLists.txt", content.format())
+    testing.configure_internal().check_returncode()
+    corrupt_cached_dependencies(testing, "cached.h")
+    output = testing.configure_internal().stdout
+    assert 'OUTPUT[0]=cached.h\n' in output
+    assert 'OUTPUT[1]=cached.h\n' in output
+
+def test_rescan_changed_header(testing):
+    testing.write("hello/hello.h", "void hello() {}")
+    testing.write("first.c", "int main() { return 0; }")
+    testing.write("second.c", '#include "hello.h"\nint main() { hello(); return 0; }')
+    testing.write("third.c", '#ifdef HELLO\n #include "hello/hello.h"\n #endif\n int main() { return 0; }')
+    testing.write("CMakeLists.txt", content.format())
+    testing.configure_internal().check_returncode()
+    corrupt_cached_dependencies(testing, "cached.h")
+    time.sleep(0.01)
+    testing.write("hello/hello.h", '#include "world.h"\nvoid hello() {}')
+    testing.write("hello/world.h", "void world() {}")
+    output = testing.configure_internal().stdout
+    assert 'OUTPUT[0]=cached.h\n' in output
+    assert f'OUTPUT[1]={testing.workspace}/second.c;{testing.workspace}/hello/hello.h;{testing.workspace}/hello/world.h\n' in output
+
+def test_disable_cache(testing):
+    testing.write("hello/hello.h", "void hello() {}")
+    testing.write("first.c", "int main() { return 0; }")
+    testing.write("second.c", '#include "hello.h"\nint main() { hello(); return 0; }')
+    testing.write("third.c", '#ifdef HELLO\n #include "hello/hello.h"\n #endif\n int main() { return 0; }')
+    testing.write("CMakeLists.txt", content.format())
+    testing.configure_internal().check_returncode()
+    corrupt_cached_dependencies(testing, "cached.h")
+    output = testing.configure_internal(options=["-DCMAKE_HOST_DEPENDENCY_SCAN_CACHE=OFF"]).stdout
+    assert f'OUTPUT[0]={testing.workspace}/first.c\n' in output
@@ -7,7 +7,7 @@ SPDX-License-Identifier: MIT
 
 
 def test_host_compiler_info(testing):
-    testing.configure(c_compiler_list="clang")
+    testing.configure(c_compiler_list="clang", extra_options=["-DCMAKE_HOST_LAZY_COMPILER_INFO=OFF"])
     compiler_info = testing.read(testing.internal_dir("CMakeHOSTCCompiler.cmake"))
     assert 'set(CMAKE_HOSTC_COMPILER "/usr/bin/clang")' in compiler_info
     assert 'set(CMAKE_HOSTC_COMPILER_ID "Clang")' in compiler_info
@@ -7,7 +7,7 @@ SPDX-License-Identifier: MIT
 
 
 def test_host_compiler_info(testing):
-    testing.configure(cpp_compiler_list="i686-w64-mingw32-g++")
+    testing.configure(cpp_compiler_list="i686-w64-mingw32-g++", extra_options=["-DCMAKE_HOST_LAZY_COMPILER_INFO=OFF"])
     compiler_info = testing.read(testing.internal_dir("CMakeHOSTCXXCompiler.cmake"))
     assert 'set(CMAKE_HOSTCXX_COMPILER "/usr/bin/i686-w64-mingw32-g++")' in compiler_info
     assert 'set(CMAKE_HOSTCXX_COMPILER_ID "GNU")' in compiler_info
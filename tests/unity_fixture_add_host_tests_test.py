@@ -389,3 +389,96 @@ def test_enable_exact_match_with_unknown_test_name(testing):
     stdout = testing.ctest('-R Test1\\.test1 --verbose').stdout
     assert 'TEST(Test1, test1) PASS' in stdout
     assert 'TEST(Test123, test123) PASS' not in stdout
+
+batch_test_file = '''
+#include <unity_fixture.h>
+TEST_GROUP(GroupA);
+TEST_SETUP(GroupA) { }
+TEST_TEAR_DOWN(GroupA) { }
+TEST(GroupA, test1) { TEST_ASSERT_TRUE(1); }
+TEST(GroupA, test2) { TEST_ASSERT_TRUE(1); }
+IGNORE_TEST(GroupA, test3) { TEST_FAIL(); }
+
+TEST_GROUP(GroupB);
+TEST_SETUP(GroupB) { }
+TEST_TEAR_DOWN(GroupB) { }
+TEST(GroupB, test1) { TEST_ASSERT_TRUE(VALUE); }
+
+static void runAllTests(void) {
+  RUN_TEST_CASE(GroupA, test1);
+  RUN_TEST_CASE(GroupA, test2);
+  RUN_TEST_CASE(GroupA, test3);
+  RUN_TEST_CASE(GroupB, test1);
+}
+int main(int argc, const char* argv[]) {
+  return UnityMain(argc, argv, runAllTests);
+}
+'''
+
+def test_shards(testing):
+    testing.copytree("tests/project/external/unity", "")
+    testing.write("CMakeLists.txt", content.replace("unity_fixture_add_host_tests(Host::unittest)", "unity_fixture_add_host_tests(Host::unittest SHARDS 4)"))
+    testing.write("test_file.c", batch_test_file.replace("VALUE", "1"))
+    testing.configure_internal().check_returncode()
+    testing.cmake("host-targets").check_returncode()
+    stdout = testing.ctest("--verbose").stdout
+    assert "unittest.batch1 ..................   Passed" in stdout
+    assert "unittest.batch2 ..................   Passed" in stdout
+    assert "unittest.batch3" not in stdout
+    assert "GroupA.test1 ... Passed" in stdout
+    assert "GroupA.test2 ... Passed" in stdout
+    assert "IGNORE_TEST(GroupA, test3)" in stdout
+    assert "GroupA.test3 ..." not in stdout
+    assert "GroupB.test1 ... Passed" in stdout
+
+def test_shards_with_group_prefix(testing):
+    test_file = '''
+    #include <unity_fixture.h>
+    TEST_GROUP(Foo);
+    TEST_SETUP(Foo) { }
+    TEST_TEAR_DOWN(Foo) { }
+    TEST(Foo, a) { TEST_ASSERT_TRUE(1); }
+
+    TEST_GROUP(FooBar);
+    TEST_SETUP(FooBar) { }
+    TEST_TEAR_DOWN(FooBar) { }
+    TEST(FooBar, b) { TEST_FAIL(); }
+
+    static void runAllTests(void) {
+      RUN_TEST_CASE(Foo, a);
+      RUN_TEST_CASE(FooBar, b);
+    }
+    int main(int argc, const char* argv[]) {
+      return UnityMain(argc, argv, runAllTests);
+    }
+    '''
+    testing.copytree("tests/project/external/unity", "")
+    testing.write("CMakeLists.txt", content.replace("unity_fixture_add_host_tests(Host::unittest)", "unity_fixture_add_host_tests(Host::unittest SHARDS 2)"))
+    testing.write("test_file.c", test_file)
+    testing.configure_internal().check_returncode()
+    testing.cmake("host-targets").check_returncode()
+    stdout = testing.ctest("--verbose").stdout
+    assert "unittest.batch1 ..................   Passed" in stdout
+    assert "unittest.batch2 ..................***Failed" in stdout
+    assert stdout.count("TEST(FooBar, b)") == 1
+
+def test_batch_size_failed(testing):
+    testing.copytree("tests/project/external/unity", "")
+    testing.write("CMakeLists.txt", content.replace("unity_fixture_add_host_tests(Host::unittest)", "unity_fixture_add_host_tests(Host::unittest BATCH_SIZE 8)"))
+    testing.write("test_file.c", batch_test_file.replace("VALUE", "0"))
+    testing.configure_internal().check_returncode()
+    testing.cmake("host-targets").check_returncode()
+    stdout = testing.ctest("--verbose").stdout
+    assert "unittest.batch1 ..................***Failed" in stdout
+    assert "unittest.batch2" not in stdout
+    assert "GroupA.test1 ... Passed" in stdout
+    assert "GroupB.test1 ... Failed" in stdout
+    assert "2 passed, 0 skipped, 1 failed, 0 not run" in stdout
+
+def test_invalid_batch_options(testing):
+    testing.copytree("tests/project/external/unity", "")
+    testing.write("CMakeLists.txt", content.replace("unity_fixture_add_host_tests(Host::unittest)", "unity_fixture_add_host_tests(Host::unittest SHARDS 2 BATCH_SIZE 8)"))
+    testing.write("test_file.c", batch_test_file.replace("VALUE", "1"))
+    assert "SHARDS and BATCH_SIZE cannot be used together for unittest" in testing.configure_internal().stderr
+    testing.write("CMakeLists.txt", content.replace("unity_fixture_add_host_tests(Host::unittest)", "unity_fixture_add_host_tests(Host::unittest SHARDS 0)"))
+    assert "SHARDS requires a positive integer: 0" in testing.configure_internal().stderr
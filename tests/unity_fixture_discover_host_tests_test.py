@@ -5,6 +5,9 @@ Copyright (c) 2025 LG Electronics Inc.
 SPDX-License-Identifier: MIT
 """
 
+import os
+import time
+
 
 content = '''
 cmake_minimum_required(VERSION 3.17 FATAL_ERROR)
@@ -99,6 +102,109 @@ def test_counter(testing):
     assert testing.exists("unittest[1]_tests.cmake")
     assert testing.exists("unittest[2]_tests.cmake")
 
+def test_discovery_mode_argument(testing):
+    testing.copytree("tests/project/external/unity", "")
+    testing.write("CMakeLists.txt", content)
+    testing.write("test_file.c", test_file)
+    testing.configure_internal(options=['-DEXTRA_ARGS="DISCOVERY_MODE;PRE_TEST"']).check_returncode()
+    testing.cmake("host-targets").check_returncode()
+    assert not testing.exists("unittest[1]_tests.cmake")
+    assert "Test.test1 .......................   Passed" in testing.ctest().stdout
+    assert testing.exists("unittest[1]_tests.cmake")
+
+def test_rediscover_on_changed_arguments(testing):
+    testing.copytree("tests/project/external/unity", "")
+    testing.write("CMakeLists.txt", content)
+    testing.write("test_file.c", test_file)
+    testing.configure_internal().check_returncode()
+    testing.cmake("host-targets").check_returncode()
+    discovery = os.path.join(testing.build, "unittest[1]_discovery.cmake")
+    modified = os.path.getmtime(discovery)
+
+    time.sleep(1)
+    testing.configure_internal().check_returncode()
+    assert os.path.getmtime(discovery) == modified
+    testing.configure_internal(options=['-DEXTRA_ARGS="PREFIX;HELLO"']).check_returncode()
+    assert os.path.getmtime(discovery) > modified
+    testing.cmake("host-targets").check_returncode()
+    assert 'HELLO' in testing.ctest().stdout
+
+def test_keep_discovered_tests_before_test(testing):
+    testing.copytree("tests/project/external/unity", "")
+    testing.write("CMakeLists.txt", content)
+    testing.write("test_file.c", test_file)
+    testing.configure_internal(options=['-DEXTRA_ARGS="DISCOVERY_MODE;PRE_TEST"']).check_returncode()
+    testing.cmake("host-targets").check_returncode()
+    testing.ctest().check_returncode()
+    tests = os.path.join(testing.build, "unittest[1]_tests.cmake")
+    modified = os.path.getmtime(tests)
+
+    time.sleep(1)
+    testing.configure_internal(options=['-DEXTRA_ARGS="DISCOVERY_MODE;PRE_TEST"']).check_returncode()
+    testing.ctest().check_returncode()
+    assert os.path.getmtime(tests) == modified
+
+def test_check_dry_run_support_once(testing):
+    counting_file = test_file.replace("int main(int argc, const char* argv[]) {", """#include <stdio.h>
+#include <string.h>
+int main(int argc, const char* argv[]) {
+  if (argc > 1 && strcmp(argv[1], "-h") == 0) {
+    FILE* log = fopen("help.log", "a");
+    fputs("-h\\n", log);
+    fclose(log);
+  }""")
+    testing.copytree("tests/project/external/unity", "")
+    testing.write("CMakeLists.txt", content)
+    testing.write("test_file.c", counting_file)
+    testing.configure_internal().check_returncode()
+    testing.cmake("host-targets").check_returncode()
+    assert testing.read("help.log") == "-h\n"
+    assert testing.exists("unittest[1]_dry_run.cmake")
+
+    time.sleep(1)
+    testing.configure_internal(options=['-DEXTRA_ARGS="PREFIX;HELLO."']).check_returncode()
+    testing.cmake("host-targets").check_returncode()
+    assert testing.read("help.log") == "-h\n"
+    assert "HELLO.Test.test3 .................   Passed" in testing.ctest().stdout
+
+    time.sleep(1)
+    testing.write("test_file.c", counting_file.replace("test3", "test4"))
+    testing.cmake("host-targets").check_returncode()
+    assert testing.read("help.log") == "-h\n-h\n"
+    assert "HELLO.Test.test4 .................   Passed" in testing.ctest().stdout
+
+def test_check_dry_run_support_of_relinked_executable(testing):
+    testing.copytree("tests/project/external/unity", "")
+    testing.write("CMakeLists.txt", content)
+    testing.write("test_file.c", test_file)
+    testing.configure_internal().check_returncode()
+    testing.cmake("host-targets").check_returncode()
+    assert testing.exists("unittest[1]_dry_run.cmake")
+
+    time.sleep(1)
+    testing.write("test_file.c", '''
+    #include <stdio.h>
+    int main(int argc, const char* argv[]) {
+      puts("Runs a series of Unity Fixture tests.");
+      puts("Unity test run 1 of 1");
+      return 0;
+    }
+    ''')
+    assert 'Missing dry-run option' in testing.cmake("host-targets").stderr
+
+def test_check_dry_run_support_on_failure(testing):
+    testing.copytree("tests/project/external/unity", "")
+    testing.write("CMakeLists.txt", content)
+    testing.write("test_file.c", test_file)
+    testing.configure_internal().check_returncode()
+    testing.cmake("host-targets").check_returncode()
+    assert testing.exists("unittest[1]_dry_run.cmake")
+
+    time.sleep(1)
+    testing.write("test_file.c", "int main(int argc, const char* argv[]) { return 0; }")
+    assert 'Error running test executable' in testing.cmake("host-targets").stderr
+    assert not testing.exists("unittest[1]_dry_run.cmake")
+
 def test_blank_file(testing):
     test_file = '''
     int main(int argc, const char* argv[]) {
@@ -0,0 +1,65 @@
+#-*- coding: utf-8 -*-
+
+"""
+Copyright (c) 2026 LG Electronics Inc.
+SPDX-License-Identifier: MIT
+"""
+
+import json
+
+
+content = '''
+cmake_minimum_required(VERSION 3.17 FATAL_ERROR)
+
+project(CMakeTest LANGUAGES NONE)
+
+include(cmake/HostTest.cmake)
+enable_testing()
+add_host_executable(main SOURCES main.c)
+add_host_library(hello STATIC SOURCES hello.c)
+add_host_test(main)
+'''
+
+def test_disabled_by_default(testing):
+    testing.write("main.c", "int main() { return 0; }")
+    testing.write("hello.c", "void hello(void) {}")
+    testing.write("CMakeLists.txt", content)
+    testing.configure_internal().check_returncode()
+    assert not testing.exists("hosta-profile.json")
+    assert not testing.exists("hosta-profile.txt")
+
+def test_json_report(testing):
+    testing.write("main.c", "int main() { return 0; }")
+    testing.write("hello.c", "void hello(void) {}")
+    testing.write("CMakeLists.txt", content)
+    testing.configure_internal(options=["-DCMAKE_HOST_PROFILE=ON"]).check_returncode()
+    report = json.loads(testing.read("hosta-profile.json"))
+    functions = {entry["name"]: entry for entry in report["functions"]}
+    assert functions["add_host_executable"]["count"] == 1
+    assert functions["add_host_library"]["count"] == 1
+    assert functions["add_host_test"]["count"] == 1
+    assert functions["do_host_compile"]["count"] == 2
+    assert functions["DetermineHOSTCCompiler"]["count"] == 1
+    assert functions["execute_process(try_host_compile)"]["count"] > 0
+    targets = [entry["name"] for entry in report["targets"]]
+    assert sorted(targets) == ["hello", "main"]
+
+def test_table_report(testing):
+    testing.write("main.c", "int main() { return 0; }")
+    testing.write("hello.c", "void hello(void) {}")
+    testing.write("CMakeLists.txt", content)
+    output = testing.configure_internal(options=["-DCMAKE_HOST_PROFILE=ON"]).stdout
+    assert f'Host profile report written to {testing.build}/hosta-profile.txt' in output
+    table = testing.read("hosta-profile.txt")
+    assert 'Function' in table and 'Count' in table and 'Total (ms)' in table
+    assert 'add_host_executable' in table
+    assert 'Target' in table
+
+def test_sorted_by_total(testing):
+    testing.write("main.c", "int main() { return 0; }")
+    testing.write("hello.c", "void hello(void) {}")
+    testing.write("CMakeLists.txt", content)
+    testing.configure_internal(options=["-DCMAKE_HOST_PROFILE=ON"]).check_returncode()
+    report = json.loads(testing.read("hosta-profile.json"))
+    totals = [entry["total_us"] for entry in report["functions"]]
+    assert totals == sorted(totals, reverse=True)